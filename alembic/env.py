@@ -7,7 +7,7 @@ import asyncio
 
 # Import your models Base
 from app.database import Base
-from app.models import User, Job, Application
+from app.models import User, Job, Application, CVDocument, ProcessingTask
 
 # this is the Alembic Config object
 config = context.config
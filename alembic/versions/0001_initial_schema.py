@@ -0,0 +1,80 @@
+"""initial schema: users, jobs, applications
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 00:00:00
+
+Tables as created by Base.metadata.create_all before the processing queue.
+Databases that were created that way already have them: existing tables
+are left alone, so `alembic upgrade head` also works on those.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    
+    if "users" not in tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("username", sa.String(50), nullable=False),
+            sa.Column("email", sa.String(100), nullable=False),
+            sa.Column("hashed_password", sa.String(255), nullable=False),
+            sa.Column("full_name", sa.String(100), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+    
+    if "jobs" not in tables:
+        op.create_table(
+            "jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(200), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_jobs_id", "jobs", ["id"])
+        op.create_index("ix_jobs_title", "jobs", ["title"])
+    
+    if "applications" not in tables:
+        op.create_table(
+            "applications",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("job_id", sa.Integer(), sa.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("cv_file_path", sa.String(500), nullable=False),
+            sa.Column("original_filename", sa.String(255), nullable=False),
+            sa.Column("candidate_name", sa.String(200), nullable=True),
+            sa.Column("match_score", sa.Float(), nullable=True),
+            sa.Column("extracted_text", sa.Text(), nullable=True),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "PROCESSING", "COMPLETED", "FAILED", name="processingstatus"),
+                nullable=False
+            ),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_applications_id", "applications", ["id"])
+        op.create_index("ix_applications_status", "applications", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_table("applications")
+    op.drop_table("jobs")
+    op.drop_table("users")
+    sa.Enum(name="processingstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,133 @@
+"""shared CV documents, processing queue and AI result columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:01
+
+- cv_documents: content-addressed files and their extraction results
+- processing_tasks: durable processing queue (leases, lanes, owners)
+- applications: document link, candidate contact details, extraction
+  method and stored CV embedding
+- jobs: extraction profile and rescoring state
+
+Base.metadata.create_all (API startup) creates missing tables but never
+adds columns to existing ones, so each step only adds what is missing.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def _add_missing_columns(table: str, columns: list[sa.Column]) -> None:
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+    for column in columns:
+        if column.name not in existing:
+            op.add_column(table, column)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    
+    if "cv_documents" not in tables:
+        op.create_table(
+            "cv_documents",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("content_hash", sa.String(64), nullable=False),
+            sa.Column("file_path", sa.String(500), nullable=False),
+            sa.Column("file_size", sa.Integer(), nullable=False),
+            sa.Column("extracted_text", sa.Text(), nullable=True),
+            sa.Column("extraction_method", sa.String(20), nullable=True),
+            sa.Column("extraction_profile", sa.String(20), nullable=True),
+            sa.Column("candidate_name", sa.String(200), nullable=True),
+            sa.Column("candidate_email", sa.String(255), nullable=True),
+            sa.Column("candidate_phone", sa.String(50), nullable=True),
+            sa.Column("cv_embedding", sa.LargeBinary(), nullable=True),
+            sa.Column("embedding_model", sa.String(255), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_cv_documents_id", "cv_documents", ["id"])
+        op.create_index("ix_cv_documents_content_hash", "cv_documents", ["content_hash"], unique=True)
+    else:
+        _add_missing_columns("cv_documents", [
+            sa.Column("extraction_profile", sa.String(20), nullable=True),
+        ])
+    
+    _add_missing_columns("applications", [
+        sa.Column("document_id", sa.Integer(), sa.ForeignKey("cv_documents.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("candidate_email", sa.String(255), nullable=True),
+        sa.Column("candidate_phone", sa.String(50), nullable=True),
+        sa.Column("extraction_method", sa.String(20), nullable=True),
+        sa.Column("cv_embedding", sa.LargeBinary(), nullable=True),
+        sa.Column("embedding_model", sa.String(255), nullable=True),
+    ])
+    if "ix_applications_document_id" not in {index["name"] for index in inspector.get_indexes("applications")}:
+        op.create_index("ix_applications_document_id", "applications", ["document_id"])
+    
+    _add_missing_columns("jobs", [
+        sa.Column("extraction_profile", sa.String(20), nullable=True),
+        sa.Column("rescore_in_progress", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("rescore_lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    ])
+    
+    if "processing_tasks" not in tables:
+        op.create_table(
+            "processing_tasks",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "application_id",
+                sa.Integer(),
+                sa.ForeignKey("applications.id", ondelete="CASCADE"),
+                nullable=False
+            ),
+            sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+            sa.Column("batch_id", sa.String(32), nullable=True),
+            sa.Column(
+                "status",
+                sa.Enum("QUEUED", "RUNNING", "DONE", "FAILED", name="taskstatus"),
+                nullable=False
+            ),
+            sa.Column("lane", sa.Enum("INTERACTIVE", "BULK", name="tasklane"), nullable=False),
+            sa.Column("worker_id", sa.String(150), nullable=True),
+            sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        for column in ("id", "application_id", "owner_id", "batch_id", "status", "lane",
+                       "lease_expires_at", "finished_at"):
+            op.create_index(f"ix_processing_tasks_{column}", "processing_tasks", [column])
+    else:
+        # Created by an earlier build with shorter worker IDs (host:pid)
+        with op.batch_alter_table("processing_tasks") as batch:
+            batch.alter_column("worker_id", type_=sa.String(150), existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.drop_table("processing_tasks")
+    sa.Enum(name="taskstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="tasklane").drop(op.get_bind(), checkfirst=True)
+    
+    with op.batch_alter_table("jobs") as batch:
+        batch.drop_column("rescore_lease_expires_at")
+        batch.drop_column("rescore_in_progress")
+        batch.drop_column("extraction_profile")
+    
+    op.drop_index("ix_applications_document_id", table_name="applications")
+    with op.batch_alter_table("applications") as batch:
+        batch.drop_column("embedding_model")
+        batch.drop_column("cv_embedding")
+        batch.drop_column("extraction_method")
+        batch.drop_column("candidate_phone")
+        batch.drop_column("candidate_email")
+        batch.drop_column("document_id")
+    
+    op.drop_table("cv_documents")
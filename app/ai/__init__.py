@@ -1,12 +1,79 @@
-from app.ai.model_loader import get_name_extraction_model, get_scoring_model
-from app.ai.text_extractor import extract_text_from_cv
-from app.ai.name_extractor import extract_candidate_name
-from app.ai.cv_scorer import calculate_match_score
+from app.ai.model_loader import (
+    get_name_extraction_model,
+    get_scoring_model,
+    load_name_extraction_pipeline
+)
+from app.ai.text_extractor import (
+    extract_text_from_cv,
+    extract_cv_text,
+    ExtractionResult,
+    EXTRACTION_PROFILES
+)
+from app.ai.extraction_cache import get_extraction_cache_stats
+from app.ai.extraction_pool import (
+    extract_cv_text_async,
+    warm_extraction_pool,
+    shutdown_extraction_pool
+)
+from app.ai.inference_executor import run_inference, get_inference_stats
+from app.ai.name_extractor import (
+    extract_candidate_name,
+    extract_candidate_names,
+    extract_candidate_infos,
+    scan_cv_header,
+    get_name_extraction_stats
+)
+from app.ai.cv_scorer import (
+    calculate_match_score,
+    score_batch,
+    embed_cvs,
+    get_embedding_dimension,
+    score_embeddings,
+    cache_job_embedding,
+    invalidate_job_embedding,
+    get_job_embedding_cache_stats
+)
+from app.ai.embedding_store import (
+    get_embedding_tag,
+    is_current_embedding,
+    serialize_embedding,
+    deserialize_embedding,
+    load_embeddings
+)
+from app.ai.warmup import warm_up_models, get_readiness
 
 __all__ = [
     "get_name_extraction_model",
     "get_scoring_model",
+    "load_name_extraction_pipeline",
     "extract_text_from_cv",
+    "extract_cv_text",
+    "ExtractionResult",
+    "EXTRACTION_PROFILES",
+    "get_extraction_cache_stats",
+    "extract_cv_text_async",
+    "warm_extraction_pool",
+    "shutdown_extraction_pool",
+    "run_inference",
+    "get_inference_stats",
     "extract_candidate_name",
+    "extract_candidate_names",
+    "extract_candidate_infos",
+    "scan_cv_header",
+    "get_name_extraction_stats",
     "calculate_match_score",
+    "score_batch",
+    "embed_cvs",
+    "get_embedding_dimension",
+    "score_embeddings",
+    "cache_job_embedding",
+    "invalidate_job_embedding",
+    "get_job_embedding_cache_stats",
+    "get_embedding_tag",
+    "is_current_embedding",
+    "serialize_embedding",
+    "deserialize_embedding",
+    "load_embeddings",
+    "warm_up_models",
+    "get_readiness",
 ]
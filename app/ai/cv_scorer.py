@@ -1,41 +1,329 @@
-from sentence_transformers import util
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
 from app.ai.model_loader import get_scoring_model
+from app.ai.inference_executor import run_inference
+from app.core.config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
-def calculate_match_score(job_description: str, cv_text: str) -> float:
+class JobEmbeddingCache:
     """
-    Calculate semantic similarity between job description and CV
+    Bounded LRU cache for job description embeddings
+    
+    Entries are keyed by (job_id, description_hash), so an edited description
+    can never be served a stale embedding even before it is invalidated.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple[int, str]):
+        """Return cached embedding (or None) and record hit/miss"""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+    
+    def put(self, key: tuple[int, str], embedding) -> None:
+        """Store embedding, evicting least recently used entries"""
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, job_id: int) -> int:
+        """Drop every cached embedding of a job, returns removed count"""
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[0] == job_id]
+            for key in stale_keys:
+                del self._entries[key]
+            return len(stale_keys)
+    
+    def stats(self) -> dict:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+job_embedding_cache = JobEmbeddingCache(settings.JOB_EMBEDDING_CACHE_SIZE)
+
+def _description_hash(job_description: str) -> str:
+    """Stable hash of a job description (cache key component)"""
+    return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+
+def _encode_normalized(texts: list[str], batch_size: Optional[int] = None) -> np.ndarray:
+    """
+    Encode texts into L2-normalized float32 embeddings
+    
+    Inputs are sorted by length before encoding so each forward batch holds
+    texts of similar size (less padding), then restored to input order.
+    """
+    model = get_scoring_model()
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+    
+    embeddings = model.encode(
+        [texts[i] for i in order],
+        batch_size=batch_size or settings.SCORING_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+    
+    restored = np.empty_like(embeddings, dtype=np.float32)
+    restored[order] = embeddings
+    return restored
+
+def get_job_embedding(job_description: str, job_id: Optional[int] = None) -> np.ndarray:
+    """
+    Get job description embedding, served from cache when job_id is known
     
     Args:
         job_description: The job description text
-        cv_text: The candidate's CV text
+        job_id: Job ID used as cache key (no caching when None)
         
     Returns:
-        Match score between 0.0 and 1.0
+        Normalized embedding vector of the job description
     """
-    if not job_description or not cv_text:
-        logger.warning("Empty job description or CV text")
-        return 0.0
+    if job_id is None:
+        return _encode_normalized([job_description])[0]
+    
+    key = (job_id, _description_hash(job_description))
+    embedding = job_embedding_cache.get(key)
     
-    logger.info("🎯 Calculating match score...")
+    if embedding is None:
+        embedding = _encode_normalized([job_description])[0]
+        job_embedding_cache.put(key, embedding)
     
+    return embedding
+
+async def cache_job_embedding(job_id: int, job_description: str) -> None:
+    """Pre-compute job embedding (on the inference executor) so the first CV of a job doesn't pay for it"""
     try:
-        model = get_scoring_model()
+        await run_inference("scoring", get_job_embedding, job_description, job_id)
+        logger.info(f"🧠 Job embedding cached for job {job_id}")
+    except Exception as e:
+        logger.error(f"❌ Failed to cache job embedding for job {job_id}: {e}")
+
+def invalidate_job_embedding(job_id: int) -> None:
+    """Remove cached embeddings of a job (call when its description changes)"""
+    removed = job_embedding_cache.invalidate(job_id)
+    if removed:
+        logger.info(f"♻️ Job embedding cache invalidated for job {job_id}")
+
+def get_job_embedding_cache_stats() -> dict:
+    """Hit/miss counters of the job embedding cache"""
+    return job_embedding_cache.stats()
+
+def get_embedding_dimension() -> int:
+    """Size of the scoring model embedding vectors"""
+    return get_scoring_model().get_sentence_embedding_dimension()
+
+def _chunk_text(text: str) -> list[str]:
+    """
+    Split text into token-bounded windows of the scoring model
+    
+    The text is tokenized once and windows are cut on the tokenizer offsets,
+    so each chunk fits the model max sequence length (no silent truncation).
+    """
+    model = get_scoring_model()
+    
+    # Leave room for the [CLS]/[SEP] special tokens
+    window = min(settings.SCORING_CHUNK_TOKENS, model.max_seq_length) - 2
+    step = max(window - settings.SCORING_CHUNK_OVERLAP, 1)
+    
+    offsets = model.tokenizer(
+        text,
+        add_special_tokens=False,
+        return_offsets_mapping=True,
+        verbose=False
+    )["offset_mapping"]
+    
+    if len(offsets) <= window:
+        return [text]
+    
+    chunks = []
+    for start in range(0, len(offsets), step):
+        end = min(start + window, len(offsets))
+        chunks.append(text[offsets[start][0]:offsets[end - 1][1]])
+        
+        if end == len(offsets) or len(chunks) >= settings.SCORING_MAX_CHUNKS:
+            break
+    
+    return chunks
+
+def _pool_scores(similarities: np.ndarray, chunk_counts: list[int]) -> np.ndarray:
+    """
+    Combine chunk similarities into one score per CV
+    
+    Pooling (SCORING_CHUNK_POOLING): "max", "mean" or "topk" (mean of the
+    SCORING_CHUNK_TOP_K best chunks).
+    """
+    pooling = settings.SCORING_CHUNK_POOLING
+    starts = np.cumsum([0] + chunk_counts[:-1])
+    
+    if pooling == "max":
+        return np.maximum.reduceat(similarities, starts)
+    
+    if pooling == "mean":
+        return np.add.reduceat(similarities, starts) / np.asarray(chunk_counts)
+    
+    if pooling == "topk":
+        top_k = settings.SCORING_CHUNK_TOP_K
+        return np.array([
+            np.sort(similarities[start:start + count])[-top_k:].mean()
+            for start, count in zip(starts, chunk_counts)
+        ])
+    
+    raise ValueError(f"Unknown chunk pooling: {pooling}")
+
+def embed_cvs(cv_texts: list[str], batch_size: Optional[int] = None) -> list[np.ndarray]:
+    """
+    Encode CV texts into normalized embedding matrices
+    
+    Each CV gets a (n_chunks, dim) matrix: a single row by default, or one
+    row per token window when SCORING_CHUNKING is enabled. All chunks of all
+    CVs are encoded together in one batched call.
+    
+    The result can be persisted (see embedding_store) and scored later with
+    score_embeddings without running the encoder again.
+    """
+    if not cv_texts:
+        return []
+    
+    if settings.SCORING_CHUNKING:
+        chunks_per_cv = [_chunk_text(text) for text in cv_texts]
+    else:
+        chunks_per_cv = [[text] for text in cv_texts]
+    
+    flat_chunks = [chunk for chunks in chunks_per_cv for chunk in chunks]
+    matrix = _encode_normalized(flat_chunks, batch_size)
+    
+    embeddings = []
+    start = 0
+    for chunks in chunks_per_cv:
+        embeddings.append(matrix[start:start + len(chunks)])
+        start += len(chunks)
+    
+    return embeddings
+
+def score_embeddings(
+    job_description: str,
+    cv_embeddings: list[np.ndarray],
+    job_id: Optional[int] = None
+) -> list[float]:
+    """
+    Score pre-computed CV embeddings against a job description
+    
+    Args:
+        job_description: The job description text
+        cv_embeddings: One (n_chunks, dim) matrix of normalized embeddings per CV
+        job_id: Optional job ID, enables the job embedding cache
         
-        # Encode both texts
-        job_embedding = model.encode(job_description, convert_to_tensor=True)
-        cv_embedding = model.encode(cv_text, convert_to_tensor=True)
+    Returns:
+        Match scores between 0.0 and 1.0, one per CV
+    """
+    if not cv_embeddings:
+        return []
+    
+    job_embedding = get_job_embedding(job_description, job_id)
+    
+    # Cosine similarity of normalized vectors = dot product (all chunks at once)
+    similarities = np.vstack(cv_embeddings) @ job_embedding
+    
+    chunk_counts = [len(embedding) for embedding in cv_embeddings]
+    if max(chunk_counts) > 1:
+        similarities = _pool_scores(similarities, chunk_counts)
+    
+    return [round(float(similarity), 3) for similarity in similarities]
+
+def score_batch(
+    job_description: str,
+    cv_texts: list[str],
+    job_id: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> list[float]:
+    """
+    Calculate match scores of many CVs against one job description
+    
+    CVs are encoded in batches and cosine similarity is computed as a single
+    matrix-vector product over the normalized embeddings.
+    
+    Args:
+        job_description: The job description text
+        cv_texts: List of CV texts
+        job_id: Optional job ID, enables the job embedding cache
+        batch_size: CVs per encoder forward pass (defaults to settings)
         
-        # Calculate cosine similarity
-        cosine_score = util.pytorch_cos_sim(job_embedding, cv_embedding)
-        score = round(cosine_score.item(), 3)
+    Returns:
+        Match scores between 0.0 and 1.0, in the same order as cv_texts
+    """
+    scores = [0.0] * len(cv_texts)
+    
+    if not job_description:
+        logger.warning("Empty job description")
+        return scores
+    
+    # Empty CVs keep a 0.0 score and are not sent to the encoder
+    indices = [i for i, text in enumerate(cv_texts) if text]
+    if not indices:
+        return scores
+    
+    logger.info(f"🎯 Calculating match scores for {len(indices)} CVs...")
+    
+    try:
+        cv_embeddings = embed_cvs([cv_texts[i] for i in indices], batch_size)
         
-        logger.info(f"✅ Match score calculated: {score * 100:.2f}%")
+        for i, score in zip(indices, score_embeddings(job_description, cv_embeddings, job_id)):
+            scores[i] = score
         
-        return score
+        logger.info(f"✅ {len(indices)} match scores calculated")
         
     except Exception as e:
-        logger.error(f"❌ Score calculation failed: {e}")
+        logger.error(f"❌ Batch score calculation failed: {e}")
+    
+    return scores
+
+def calculate_match_score(
+    job_description: str,
+    cv_text: str,
+    job_id: Optional[int] = None
+) -> float:
+    """
+    Calculate semantic similarity between job description and CV
+    
+    Args:
+        job_description: The job description text
+        cv_text: The candidate's CV text
+        job_id: Optional job ID, enables the job embedding cache
+        
+    Returns:
+        Match score between 0.0 and 1.0
+    """
+    if not job_description or not cv_text:
+        logger.warning("Empty job description or CV text")
         return 0.0
+    
+    score = score_batch(job_description, [cv_text], job_id)[0]
+    logger.info(f"✅ Match score calculated: {score * 100:.2f}%")
+    
+    return score
@@ -0,0 +1,57 @@
+import numpy as np
+from typing import Optional
+from app.core.config import get_settings
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SUPPORTED_DTYPES = {"float16", "float32"}
+
+def get_embedding_tag() -> str:
+    """
+    Tag stored next to every CV embedding
+    
+    Format: "<model>@<version>+<backend>:<chunking>:<dtype>". Embeddings with
+    a different tag were produced by another model, backend or chunking mode
+    (or stored differently) and must be re-encoded. The pooling mode is not part of the
+    tag since it is applied on the stored chunk vectors at scoring time.
+    """
+    if settings.SCORING_CHUNKING:
+        chunking = f"chunks{settings.SCORING_CHUNK_TOKENS}-{settings.SCORING_CHUNK_OVERLAP}"
+    else:
+        chunking = "full"
+    return (
+        f"{settings.SCORING_MODEL}@{settings.EMBEDDING_VERSION}+{settings.SCORING_BACKEND}"
+        f":{chunking}:{settings.EMBEDDING_STORAGE_DTYPE}"
+    )
+
+def is_current_embedding(blob: Optional[bytes], tag: Optional[str]) -> bool:
+    """Check that a stored embedding exists and matches the current model"""
+    return bool(blob) and tag == get_embedding_tag()
+
+def _tag_dtype(tag: str) -> str:
+    """Storage dtype encoded in an embedding tag"""
+    dtype = tag.rsplit(":", 1)[-1]
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype in tag: {tag}")
+    return dtype
+
+def serialize_embedding(embedding: np.ndarray) -> bytes:
+    """Convert a normalized (n_chunks, dim) embedding to compact bytes"""
+    dtype = settings.EMBEDDING_STORAGE_DTYPE
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    return np.asarray(embedding, dtype=dtype).tobytes()
+
+def deserialize_embedding(blob: bytes, tag: str, dim: int) -> np.ndarray:
+    """Load stored embedding bytes back into a (n_chunks, dim) float32 matrix"""
+    return np.frombuffer(blob, dtype=_tag_dtype(tag)).reshape(-1, dim).astype(np.float32)
+
+def load_embeddings(blobs: list[bytes], tag: str, dim: int) -> list[np.ndarray]:
+    """
+    Load many stored embeddings (one matrix per CV) sharing the same tag
+    
+    Use is_current_embedding to filter blobs before loading them.
+    """
+    return [deserialize_embedding(blob, tag, dim) for blob in blobs]
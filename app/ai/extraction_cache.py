@@ -0,0 +1,172 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Optional
+from app.ai.text_extractor import ExtractionResult
+from app.core.config import get_settings
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+def _docling_version() -> str:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return "unknown"
+
+DOCLING_VERSION = _docling_version()
+
+def compute_file_hash(file_path: str) -> str:
+    """SHA-256 of a file, read in blocks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ExtractionCache:
+    """
+    Size-bounded on-disk cache of extraction results
+    
+    One JSON file per entry, keyed by file hash, extraction profile, Docling
+    version and the text-layer settings (anything that changes the output).
+    File mtime is the LRU clock: hits touch the entry, and the oldest
+    entries are evicted once the directory exceeds max_bytes.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    def make_key(self, file_hash: str, profile: str) -> str:
+        """Cache key of a file extracted with a profile under current settings"""
+        fingerprint = ":".join([
+            file_hash,
+            profile,
+            DOCLING_VERSION,
+            f"text-layer={settings.TEXT_LAYER_FAST_PATH}",
+            f"text-layer-min-chars={settings.TEXT_LAYER_MIN_CHARS}",
+            f"text-layer-garbled={settings.TEXT_LAYER_MAX_GARBLED_RATIO}",
+            f"docx={settings.DOCX_FAST_PATH}",
+            f"docx-fallback={settings.DOCX_DOCLING_FALLBACK}",
+            f"max-pages={settings.EXTRACTION_MAX_PAGES}",
+        ])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+    
+    def _entries(self) -> list[os.DirEntry]:
+        entries = []
+        if self.directory.exists():
+            for shard in os.scandir(self.directory):
+                if shard.is_dir():
+                    entries.extend(e for e in os.scandir(shard.path) if e.name.endswith(".json"))
+        return entries
+    
+    def _current_size(self) -> int:
+        """Total size on disk (scanned once, then tracked)"""
+        if self._size is None:
+            self._size = sum(entry.stat().st_size for entry in self._entries())
+        return self._size
+    
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        """Return a cached extraction (or None) and record hit/miss"""
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        return ExtractionResult(data["text"], data["method"], data.get("document"))
+    
+    def put(self, key: str, result: ExtractionResult) -> None:
+        """Store an extraction, evicting least recently used entries"""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        data = {"text": result.text, "method": result.method}
+        if settings.EXTRACTION_CACHE_STORE_DOCUMENT and result.document is not None:
+            data["document"] = result.document
+        
+        # Write to a temp file then move in place, readers never see partial JSON
+        temp_path = path.with_name(f".{uuid.uuid4()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        size = temp_path.stat().st_size
+        
+        with self._lock:
+            current = self._current_size()
+            if path.exists():
+                current -= path.stat().st_size
+            os.replace(temp_path, path)
+            self._size = current + size
+            
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def _evict(self) -> None:
+        """Delete oldest entries until the cache is back under 90% of its budget"""
+        target = int(self.max_bytes * 0.9)
+        for entry in sorted(self._entries(), key=lambda e: e.stat().st_mtime):
+            if self._size <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+    
+    def stats(self) -> dict:
+        """Cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size_mb": round(self._current_size() / 1024 / 1024, 2) if self.enabled else 0.0,
+                "max_size_mb": round(self.max_bytes / 1024 / 1024, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+extraction_cache = ExtractionCache(
+    settings.EXTRACTION_CACHE_DIR,
+    settings.EXTRACTION_CACHE_MAX_MB * 1024 * 1024
+)
+
+def get_extraction_cache_stats() -> dict:
+    """
+    Hit/miss counters and disk usage of the extraction cache
+    
+    Disk usage is shared, but the counters only cover lookups made by this
+    process (they stay at zero in an API process when worker.py extracts).
+    """
+    return {
+        **extraction_cache.stats(),
+        "counters_scope": "process",
+        "pid": os.getpid()
+    }
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+from app.ai.text_extractor import (
+    extract_cv_text,
+    get_pdf_page_count,
+    resolve_extraction_profile,
+    ExtractionResult,
+    EXTRACTION_DOCLING,
+    EXTRACTION_TEXT_LAYER
+)
+from app.ai.extraction_cache import extraction_cache, compute_file_hash
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _init_worker(warm_profile: Optional[str] = None):
+    """
+    Worker process setup: logging like the API process, then Docling warm-up
+    
+    Runs in every worker, including the ones replaced after
+    EXTRACTION_MAX_TASKS_PER_WORKER conversions, so no worker meets its
+    first CV with a cold pipeline.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logging.getLogger('docling').setLevel(logging.WARNING)
+    logging.getLogger('rapidocr').setLevel(logging.WARNING)
+    
+    if warm_profile is not None:
+        try:
+            _warm_worker(warm_profile)
+        except Exception as e:
+            # A failing initializer would break the whole pool, load lazily instead
+            logger.warning(f"⚠️ Extraction worker warm-up failed: {e}")
+
+def _warm_worker(profile: Optional[str] = None) -> None:
+    """Load the Docling pipeline of a profile in the current process"""
+    from docling.datamodel.base_models import InputFormat
+    from app.ai.text_extractor import get_docling_converter
+    
+    get_docling_converter(profile).initialize_pipeline(InputFormat.PDF)
+
+def get_extraction_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared extraction process pool (created on first use)
+    
+    Each worker holds its own cached Docling converters and is replaced
+    after EXTRACTION_MAX_TASKS_PER_WORKER conversions to release leaked
+    memory. With PRELOAD_MODELS, each worker loads the default profile
+    pipeline as it starts. Returns None when EXTRACTION_WORKERS is 0
+    (thread fallback).
+    """
+    global _pool
+    
+    if settings.EXTRACTION_WORKERS <= 0:
+        return None
+    
+    with _pool_lock:
+        if _pool is None:
+            logger.info(f"⚙️ Starting extraction pool ({settings.EXTRACTION_WORKERS} workers)...")
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(resolve_extraction_profile() if settings.PRELOAD_MODELS else None,),
+                max_tasks_per_child=settings.EXTRACTION_MAX_TASKS_PER_WORKER or None
+            )
+        return _pool
+
+def _reset_pool(broken: ProcessPoolExecutor):
+    """Drop a broken pool (a worker crashed) so the next call starts a new one"""
+    global _pool
+    
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+def _split_page_ranges(file_path: str) -> list[tuple[int, int]]:
+    """
+    Page ranges to convert in parallel, or [] to convert the file in one go
+    
+    Only PDFs above EXTRACTION_SPLIT_MIN_PAGES are split, and only when the
+    pool has more than one worker to spread the parts on.
+    """
+    if (
+        settings.EXTRACTION_SPLIT_MIN_PAGES <= 0
+        or settings.EXTRACTION_WORKERS < 2
+        or not file_path.lower().endswith('.pdf')
+    ):
+        return []
+    
+    try:
+        page_count = get_pdf_page_count(file_path)
+    except Exception:
+        # Unreadable for pdfium: let the regular extraction report the error
+        return []
+    
+    if settings.EXTRACTION_MAX_PAGES and page_count > settings.EXTRACTION_MAX_PAGES:
+        logger.warning(
+            f"⚠️ {os.path.basename(file_path)} has {page_count} pages, "
+            f"only the first {settings.EXTRACTION_MAX_PAGES} are extracted"
+        )
+        page_count = settings.EXTRACTION_MAX_PAGES
+    
+    if page_count <= settings.EXTRACTION_SPLIT_MIN_PAGES:
+        return []
+    
+    part = max(settings.EXTRACTION_SPLIT_PAGES_PER_PART, 1)
+    return [
+        (start, min(start + part - 1, page_count))
+        for start in range(1, page_count + 1, part)
+    ]
+
+async def _run_extraction(file_path: str, profile: str, keep_document: bool) -> ExtractionResult:
+    """Convert a file on the pool (split in page ranges when long)"""
+    pool = get_extraction_pool()
+    
+    if pool is None:
+        return await asyncio.to_thread(extract_cv_text, file_path, profile, None, keep_document)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        page_ranges = _split_page_ranges(file_path)
+        
+        if not page_ranges:
+            return await loop.run_in_executor(
+                pool, extract_cv_text, file_path, profile, None, keep_document
+            )
+        
+        logger.info(
+            f"📚 Splitting {os.path.basename(file_path)} into {len(page_ranges)} page ranges"
+        )
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, extract_cv_text, file_path, profile, page_range, keep_document)
+            for page_range in page_ranges
+        ))
+        
+    except BrokenProcessPool:
+        logger.error("❌ Extraction worker died, restarting pool")
+        _reset_pool(pool)
+        raise
+    
+    methods = {part.method for part in parts}
+    return ExtractionResult(
+        "\n\n".join(part.text for part in parts if part.text),
+        EXTRACTION_TEXT_LAYER if methods == {EXTRACTION_TEXT_LAYER} else EXTRACTION_DOCLING,
+        _merge_documents(parts) if keep_document else None
+    )
+
+def _merge_documents(parts: list[ExtractionResult]) -> Optional[dict]:
+    """Concatenate the Docling documents of page-range parts, in page order"""
+    from docling_core.types.doc import DoclingDocument
+    
+    documents = [part.document for part in parts if part.document is not None]
+    if not documents:
+        # Every range went through the text layer fast path
+        return None
+    
+    try:
+        merged = DoclingDocument.concatenate([
+            DoclingDocument.model_validate(document) for document in documents
+        ])
+        return merged.export_to_dict()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to merge split Docling documents: {e}")
+        return None
+
+async def extract_cv_text_async(file_path: str, profile: Optional[str] = None) -> ExtractionResult:
+    """
+    Run extract_cv_text off the event loop
+    
+    Conversions go to the extraction process pool, so CPU-heavy Docling work
+    never blocks API requests (a thread is used when the pool is disabled).
+    Long PDFs are split into page ranges converted on several workers and
+    stitched back in page order. Results are kept in the on-disk extraction
+    cache, so reprocessing a file skips conversion entirely.
+    """
+    profile = resolve_extraction_profile(profile)
+    
+    if not extraction_cache.enabled:
+        return await _run_extraction(file_path, profile, False)
+    
+    file_hash = await asyncio.to_thread(compute_file_hash, file_path)
+    cache_key = extraction_cache.make_key(file_hash, profile)
+    
+    cached = await asyncio.to_thread(extraction_cache.get, cache_key)
+    if cached is not None:
+        logger.info(f"⚡ Extraction cache hit: {os.path.basename(file_path)}")
+        return cached
+    
+    result = await _run_extraction(
+        file_path, profile, settings.EXTRACTION_CACHE_STORE_DOCUMENT
+    )
+    
+    try:
+        await asyncio.to_thread(extraction_cache.put, cache_key, result)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to cache extraction result: {e}")
+    
+    return result
+
+def warm_extraction_pool() -> None:
+    """
+    Start every pool worker and wait until it is warm (blocking)
+    
+    Workers load their Docling pipeline in the pool initializer, before
+    they accept a task, so a no-op task returning means its worker is ready.
+    """
+    pool = get_extraction_pool()
+    
+    if pool is None:
+        _warm_worker()
+        return
+    
+    futures = [pool.submit(os.getpid) for _ in range(settings.EXTRACTION_WORKERS)]
+    for future in futures:
+        future.result()
+    logger.info(f"✅ Extraction pool warmed up ({settings.EXTRACTION_WORKERS} workers)")
+
+def shutdown_extraction_pool() -> None:
+    """Stop the extraction workers (application shutdown)"""
+    global _pool
+    
+    with _pool_lock:
+        pool, _pool = _pool, None
+    
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("✅ Extraction pool stopped")
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import torch
+from app.core.config import get_settings
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for the name extraction and scoring models
+    
+    Keeps transformer inference off the event loop and away from the default
+    asyncio executor. Each model is shared between threads behind its own
+    lock, so name extraction and scoring can overlap while one model never
+    runs twice at once. torch intra-op threads are split between workers so
+    concurrent inference doesn't oversubscribe the cores.
+    """
+    
+    def __init__(self, workers: int, torch_threads: int = 0):
+        self.workers = max(workers, 1)
+        self.torch_threads = torch_threads or max((os.cpu_count() or 1) // self.workers, 1)
+        self._executor = None
+        self._model_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.monotonic()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                # torch intra-op pool is process wide, size it for all workers
+                torch.set_num_threads(self.torch_threads)
+                logger.info(
+                    f"⚙️ Starting inference executor "
+                    f"({self.workers} workers x {self.torch_threads} torch threads)..."
+                )
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="inference"
+                )
+                self._started_at = time.monotonic()
+            return self._executor
+    
+    def _model_lock(self, model: str) -> threading.Lock:
+        with self._lock:
+            return self._model_locks.setdefault(model, threading.Lock())
+    
+    def _call(self, model: str, fn: Callable, args: tuple):
+        """Run one inference call in a worker thread, holding the model lock"""
+        with self._model_lock(model):
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            start = time.monotonic()
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+                    self._busy_seconds += time.monotonic() - start
+    
+    async def run(self, model: str, fn: Callable, *args):
+        """
+        Run fn(*args) on the inference pool
+        
+        Args:
+            model: Model the call uses ("name_extraction" or "scoring")
+            fn: Synchronous inference function
+            
+        Returns:
+            Result of fn
+        """
+        executor = self._get_executor()
+        with self._lock:
+            self._queued += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._call, model, fn, args)
+    
+    def stats(self) -> dict:
+        """Queue depth, active calls and utilization since startup"""
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            return {
+                "workers": self.workers,
+                "torch_threads": self.torch_threads,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "completed": self._completed,
+                "utilization": round(self._busy_seconds / (elapsed * self.workers), 3) if elapsed else 0.0
+            }
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads (application shutdown)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+inference_executor = InferenceExecutor(
+    settings.INFERENCE_WORKERS,
+    settings.INFERENCE_TORCH_THREADS
+)
+
+async def run_inference(model: str, fn: Callable, *args):
+    """Run a name extraction / scoring call on the inference executor"""
+    return await inference_executor.run(model, fn, *args)
+
+def get_inference_stats() -> dict:
+    """Queue depth and utilization of the inference executor"""
+    return inference_executor.stats()
@@ -1,34 +1,94 @@
-from transformers import pipeline
+from transformers import pipeline, AutoTokenizer, AutoModelForQuestionAnswering
 from sentence_transformers import SentenceTransformer
 from functools import lru_cache
+from pathlib import Path
 from app.core.config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-@lru_cache(maxsize=1)
-def get_name_extraction_model():
-    """Load Name Extraction Model (Cached)"""
-    logger.info(f"Loading Name Extraction Model: {settings.NAME_EXTRACTION_MODEL}")
-    try:
-        qa_pipeline = pipeline(
+NAME_EXTRACTION_MODES = ("none", "dynamic-int8", "onnx")
+
+def load_name_extraction_pipeline(mode: str):
+    """
+    Build the question-answering pipeline for a quantization mode
+    
+    Modes:
+    - none: full precision torch model
+    - dynamic-int8: torch dynamic quantization of all Linear layers
+    - onnx: ONNX Runtime graph exported by download_models.py
+    """
+    if mode == "none":
+        return pipeline(
             'question-answering',
             model=settings.NAME_EXTRACTION_MODEL,
             tokenizer=settings.NAME_EXTRACTION_MODEL
         )
+    
+    if mode == "dynamic-int8":
+        import torch
+        
+        tokenizer = AutoTokenizer.from_pretrained(settings.NAME_EXTRACTION_MODEL)
+        model = AutoModelForQuestionAnswering.from_pretrained(settings.NAME_EXTRACTION_MODEL)
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        return pipeline('question-answering', model=model, tokenizer=tokenizer)
+    
+    if mode == "onnx":
+        # Optional dependency: pip install optimum[onnxruntime]
+        from optimum.onnxruntime import ORTModelForQuestionAnswering
+        
+        tokenizer = AutoTokenizer.from_pretrained(settings.NAME_EXTRACTION_ONNX_DIR)
+        model = ORTModelForQuestionAnswering.from_pretrained(settings.NAME_EXTRACTION_ONNX_DIR)
+        return pipeline('question-answering', model=model, tokenizer=tokenizer)
+    
+    raise ValueError(f"Unknown name extraction quantization: {mode}")
+
+@lru_cache(maxsize=1)
+def get_name_extraction_model():
+    """Load Name Extraction Model (Cached)"""
+    mode = settings.NAME_EXTRACTION_QUANTIZATION
+    logger.info(f"Loading Name Extraction Model: {settings.NAME_EXTRACTION_MODEL} (quantization: {mode})")
+    try:
+        qa_pipeline = load_name_extraction_pipeline(mode)
         logger.info("✅ Name Extraction Model loaded successfully")
         return qa_pipeline
     except Exception as e:
         logger.error(f"❌ Failed to load Name Extraction Model: {e}")
         raise
 
+def _get_scoring_onnx_file() -> str:
+    """ONNX graph (relative to SCORING_ONNX_DIR) for the configured backend"""
+    if settings.SCORING_BACKEND == "onnx":
+        return "onnx/model.onnx"
+    
+    # Dynamic int8 export is named model_qint8_<config>.onnx or model_quint8_<config>.onnx
+    onnx_dir = Path(settings.SCORING_ONNX_DIR)
+    matches = sorted(onnx_dir.glob(f"onnx/model_*int8_{settings.SCORING_ONNX_QUANTIZATION}.onnx"))
+    if not matches:
+        raise FileNotFoundError(
+            f"No int8 ONNX model in {onnx_dir}, run download_models.py first"
+        )
+    return matches[0].relative_to(onnx_dir).as_posix()
+
 @lru_cache(maxsize=1)
 def get_scoring_model():
     """Load Sentence Transformer Model for Scoring (Cached)"""
-    logger.info(f"Loading Scoring Model: {settings.SCORING_MODEL}")
+    logger.info(f"Loading Scoring Model: {settings.SCORING_MODEL} (backend: {settings.SCORING_BACKEND})")
     try:
-        model = SentenceTransformer(settings.SCORING_MODEL)
+        if settings.SCORING_BACKEND == "torch":
+            model = SentenceTransformer(settings.SCORING_MODEL)
+        elif settings.SCORING_BACKEND in ("onnx", "onnx-int8"):
+            # Same encode() interface, served by ONNX Runtime
+            model = SentenceTransformer(
+                settings.SCORING_ONNX_DIR,
+                backend="onnx",
+                model_kwargs={"file_name": _get_scoring_onnx_file()}
+            )
+        else:
+            raise ValueError(f"Unknown scoring backend: {settings.SCORING_BACKEND}")
         logger.info("✅ Scoring Model loaded successfully")
         return model
     except Exception as e:
@@ -1,8 +1,66 @@
 import re
+import threading
+import unicodedata
+from typing import NamedTuple, Optional
 from app.ai.model_loader import get_name_extraction_model
+from app.core.config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+NAME_QUESTION = "What is the name of the candidate?"
+NAME_CONTEXT_CHARS = 3000  # Name is near the top, longer contexts only cost time
+
+# Header scanner (fast path that skips the QA model)
+HEADER_SCAN_LINES = 12
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+PHONE_PATTERN = re.compile(r'\+?\(?\d[\d\s().-]{7,18}\d')
+NAME_WORD_PATTERN = re.compile(r"^[^\W\d_](?:[^\W\d_]|['’.-])*$")
+HEADER_NOISE_PATTERN = re.compile(r'^[#*|>\s-]+|[*|\s]+$')
+NAME_LABEL_PATTERN = re.compile(r'^(Nom|Name|Full name|Prénom et nom|الاسم)\s*[:\-]\s*', re.IGNORECASE)
+
+# Words that make a header line a title/section rather than a person name
+NON_NAME_WORDS = {
+    "curriculum", "vitae", "cv", "resume", "résumé", "profile", "profil", "contact",
+    "experience", "expérience", "education", "formation", "skills", "compétences",
+    "summary", "objective", "about", "me", "senior", "junior", "lead", "developer",
+    "développeur", "engineer", "ingénieur", "manager", "designer", "analyst",
+    "consultant", "intern", "stagiaire", "student", "étudiant", "full", "stack",
+    "software", "data", "web", "project", "projet", "references", "languages",
+    # Common job titles
+    "sales", "marketing", "representative", "coordinator", "assistant", "specialist",
+    "director", "officer", "administrator", "executive", "associate", "supervisor",
+    "technician", "accountant", "architect", "programmer", "teacher", "nurse",
+    "head", "chief", "commercial", "chef", "responsable", "technicien", "comptable",
+    # Arabic CV titles and sections (no letter case, the capital check never applies)
+    "السيرة", "سيرة", "الذاتية", "ذاتية", "المعلومات", "الشخصية", "الخبرات",
+    "المهارات", "التعليم", "المؤهلات", "الملخص", "مهندس", "مطور", "مدير",
+}
+
+class CandidateInfo(NamedTuple):
+    """Candidate details found in a CV"""
+    name: str
+    confidence: float
+    email: Optional[str] = None
+    phone: Optional[str] = None
+
+_path_counters = {"heuristic": 0, "model": 0}
+_path_counters_lock = threading.Lock()
+
+def _count_path(path: str, count: int = 1):
+    """Record which extraction path produced names"""
+    with _path_counters_lock:
+        _path_counters[path] += count
+
+def get_name_extraction_stats() -> dict:
+    """How often the header heuristic avoided the QA model"""
+    with _path_counters_lock:
+        total = sum(_path_counters.values())
+        return {
+            **_path_counters,
+            "model_avoided_rate": round(_path_counters["heuristic"] / total, 3) if total else 0.0
+        }
 
 def clean_extracted_name(raw_name: str) -> str:
     """
@@ -23,6 +81,164 @@ def clean_extracted_name(raw_name: str) -> str:
     
     return cleaned.strip() or "Unknown"
 
+def _ascii_fold(text: str) -> str:
+    """Lowercase, strip accents and punctuation (for name/email comparison)"""
+    folded = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode().lower()
+    return re.sub(r"['’.-]", '', folded)
+
+def _parse_name_line(line: str) -> Optional[tuple[str, bool]]:
+    """Return (name, labeled) if the line looks like a person name, else None"""
+    stripped = HEADER_NOISE_PATTERN.sub('', line)
+    candidate = NAME_LABEL_PATTERN.sub('', stripped)
+    words = candidate.split()
+    
+    if not 2 <= len(words) <= 4 or len(candidate) > 50:
+        return None
+    
+    for word in words:
+        # Letters only, and capitalized for scripts that have case
+        if not NAME_WORD_PATTERN.match(word) or word[0].islower():
+            return None
+        if word.lower().strip(".") in NON_NAME_WORDS:
+            return None
+    
+    return ' '.join(words), candidate != stripped
+
+def _find_phone(line: str) -> Optional[str]:
+    """First phone-like number in a line (9 to 15 digits)"""
+    for match in PHONE_PATTERN.finditer(line):
+        digits = sum(char.isdigit() for char in match.group())
+        if 9 <= digits <= 15:
+            return match.group().strip()
+    return None
+
+def scan_cv_header(cv_text: str) -> CandidateInfo:
+    """
+    Single-pass heuristic scan of the CV header for name, email and phone
+    
+    Every name-like header line is scored and the best one kept. A line is
+    only confident (above NAME_HEURISTIC_THRESHOLD) when it matches the
+    email address or carries an explicit "Name:" label; position and
+    heading markup only break ties. Capitalized job titles and, for scripts
+    without letter case, any two words look like names, so a line backed
+    by neither is left to the QA model.
+    
+    Args:
+        cv_text: Full CV text content
+        
+    Returns:
+        CandidateInfo (name is "Unknown" with 0.0 confidence when not found)
+    """
+    candidates = []
+    email, phone = None, None
+    
+    lines = (line for line in (cv_text or "").splitlines() if line.strip())
+    for index, line in enumerate(lines):
+        if index >= HEADER_SCAN_LINES:
+            break
+        
+        if email is None:
+            email_match = EMAIL_PATTERN.search(line)
+            email = email_match.group() if email_match else None
+        if phone is None:
+            phone = _find_phone(line)
+        
+        parsed = _parse_name_line(line)
+        if parsed:
+            candidates.append((index, line.lstrip().startswith('#'), *parsed))
+    
+    if not candidates:
+        return CandidateInfo("Unknown", 0.0, email, phone)
+    
+    email_user = _ascii_fold(email.split('@')[0]) if email else ""
+    
+    def score(candidate) -> float:
+        index, is_heading, name, labeled = candidate
+        confidence = 0.4
+        if any(len(token) >= 3 and token in email_user for token in _ascii_fold(name).split()):
+            confidence += 0.35
+        if labeled:
+            confidence += 0.35
+        if index == 0:
+            confidence += 0.1
+        if is_heading:
+            confidence += 0.05
+        return confidence
+    
+    # max() keeps the earliest line on ties
+    best = max(candidates, key=score)
+    
+    return CandidateInfo(best[2], round(min(score(best), 0.99), 2), email, phone)
+
+def _extract_names_with_model(
+    cv_texts: list[str],
+    batch_size: Optional[int] = None
+) -> list[tuple[str, float]]:
+    """Run the QA model over many CV texts in one pipeline call"""
+    results = [("Unknown", 0.0)] * len(cv_texts)
+    
+    # Too short CVs keep "Unknown" and are not sent to the model
+    indices = [i for i, text in enumerate(cv_texts) if text and len(text.strip()) >= 50]
+    if not indices:
+        return results
+    
+    logger.info(f"🤖 Extracting {len(indices)} candidate names using AI...")
+    
+    try:
+        qa_pipeline = get_name_extraction_model()
+        
+        outputs = qa_pipeline(
+            [
+                {'question': NAME_QUESTION, 'context': cv_texts[i][:NAME_CONTEXT_CHARS]}
+                for i in indices
+            ],
+            batch_size=batch_size or settings.NAME_EXTRACTION_BATCH_SIZE
+        )
+        
+        # The pipeline unwraps single-element lists
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        
+        for i, output in zip(indices, outputs):
+            results[i] = (clean_extracted_name(output['answer']), round(output['score'], 2))
+        
+        _count_path("model", len(indices))
+        logger.info(f"✅ {len(indices)} names extracted")
+        
+    except Exception as e:
+        logger.error(f"❌ Batch name extraction failed: {e}")
+    
+    return results
+
+def extract_candidate_infos(
+    cv_texts: list[str],
+    batch_size: Optional[int] = None
+) -> list[CandidateInfo]:
+    """
+    Extract name, email and phone of many CVs
+    
+    The header scanner runs first; only CVs whose heuristic confidence is
+    below NAME_HEURISTIC_THRESHOLD are sent (as one batch) to the QA model.
+    
+    Args:
+        cv_texts: List of full CV text contents
+        batch_size: Contexts per model forward pass (defaults to settings)
+        
+    Returns:
+        List of CandidateInfo, in input order
+    """
+    infos = [scan_cv_header(text) for text in cv_texts]
+    
+    fallback = [i for i, info in enumerate(infos) if info.confidence < settings.NAME_HEURISTIC_THRESHOLD]
+    _count_path("heuristic", len(infos) - len(fallback))
+    
+    if fallback:
+        model_names = _extract_names_with_model([cv_texts[i] for i in fallback], batch_size)
+        for i, (name, confidence) in zip(fallback, model_names):
+            infos[i] = infos[i]._replace(name=name, confidence=confidence)
+    
+    return infos
+
 def extract_candidate_name(cv_text: str) -> tuple[str, float]:
     """
     Extract candidate name from CV text using AI
@@ -37,16 +253,23 @@ def extract_candidate_name(cv_text: str) -> tuple[str, float]:
         logger.warning("CV text too short for name extraction")
         return "Unknown", 0.0
     
+    # Fast path: confident header heuristic, no model call
+    header = scan_cv_header(cv_text)
+    if header.confidence >= settings.NAME_HEURISTIC_THRESHOLD:
+        _count_path("heuristic")
+        logger.info(f"✅ Name found in header: '{header.name}' (confidence: {header.confidence})")
+        return header.name, header.confidence
+    
     logger.info("🤖 Extracting candidate name using AI...")
     
     try:
         qa_pipeline = get_name_extraction_model()
         
         # Use first 3000 chars for better accuracy
-        context = cv_text[:3000]
+        context = cv_text[:NAME_CONTEXT_CHARS]
         
         result = qa_pipeline({
-            'question': "What is the name of the candidate?",
+            'question': NAME_QUESTION,
             'context': context
         })
         
@@ -54,6 +277,7 @@ def extract_candidate_name(cv_text: str) -> tuple[str, float]:
         confidence = round(result['score'], 2)
         
         cleaned_name = clean_extracted_name(raw_name)
+        _count_path("model")
         
         logger.info(f"✅ Name extracted: '{cleaned_name}' (confidence: {confidence})")
         
@@ -62,3 +286,19 @@ def extract_candidate_name(cv_text: str) -> tuple[str, float]:
     except Exception as e:
         logger.error(f"❌ Name extraction failed: {e}")
         return "Unknown", 0.0
+
+def extract_candidate_names(
+    cv_texts: list[str],
+    batch_size: Optional[int] = None
+) -> list[tuple[str, float]]:
+    """
+    Extract candidate names from many CV texts in one pipeline call
+    
+    Args:
+        cv_texts: List of full CV text contents
+        batch_size: Contexts per model forward pass (defaults to settings)
+        
+    Returns:
+        List of (candidate_name, confidence_score) tuples, in input order
+    """
+    return [(info.name, info.confidence) for info in extract_candidate_infos(cv_texts, batch_size)]
@@ -1,22 +1,67 @@
 import os
 import unicodedata
+from typing import NamedTuple, Optional, Tuple
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+import docx
+from docx.oxml.ns import nsmap
+from docx.table import Table
+from lxml import etree
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
 from functools import lru_cache
+from app.core.config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
-@lru_cache(maxsize=1)
-def get_docling_converter():
-    """Initialize Docling Converter (Cached)"""
-    logger.info("⚙️ Initializing Docling converter...")
+# Extraction paths recorded on each application
+EXTRACTION_TEXT_LAYER = "text-layer"
+EXTRACTION_DOCX = "docx"
+EXTRACTION_DOCLING = "docling"
+
+# Text boxes (often holding the CV header), skipping the legacy VML copy
+TEXT_BOX_PARAGRAPHS = etree.XPath(
+    ".//w:txbxContent[not(ancestor::mc:Fallback)]/w:p",
+    namespaces={**nsmap, "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006"}
+)
+
+class ExtractionResult(NamedTuple):
+    """Extracted CV text and the path that produced it"""
+    text: str
+    method: str
+    document: Optional[dict] = None  # Serialized DoclingDocument (keep_document only)
+
+# Docling pipeline options per extraction profile
+EXTRACTION_PROFILES = {
+    "fast": {"do_ocr": False, "do_table_structure": False, "table_mode": TableFormerMode.FAST},
+    "balanced": {"do_ocr": True, "do_table_structure": True, "table_mode": TableFormerMode.FAST},
+    "accurate": {"do_ocr": True, "do_table_structure": True, "table_mode": TableFormerMode.ACCURATE},
+}
+
+def resolve_extraction_profile(profile: Optional[str] = None) -> str:
+    """Validate a profile name, falling back to DEFAULT_EXTRACTION_PROFILE"""
+    profile = profile or settings.DEFAULT_EXTRACTION_PROFILE
+    if profile not in EXTRACTION_PROFILES:
+        raise ValueError(f"Unknown extraction profile: {profile}")
+    return profile
+
+def get_docling_converter(profile: Optional[str] = None) -> DocumentConverter:
+    """Get the Docling converter of a profile (default profile when None)"""
+    return _get_profile_converter(resolve_extraction_profile(profile))
+
+@lru_cache(maxsize=len(EXTRACTION_PROFILES))
+def _get_profile_converter(profile: str) -> DocumentConverter:
+    """Initialize Docling Converter for one profile (Cached)"""
+    logger.info(f"⚙️ Initializing Docling converter ({profile} profile)...")
     
+    options = EXTRACTION_PROFILES[profile]
     pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = True
-    pipeline_options.do_table_structure = True
-    pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
+    pipeline_options.do_ocr = options["do_ocr"]
+    pipeline_options.do_table_structure = options["do_table_structure"]
+    pipeline_options.table_structure_options.mode = options["table_mode"]
     
     converter = DocumentConverter(
         format_options={
@@ -33,30 +78,247 @@ def clean_text(text: str) -> str:
         return ""
     return unicodedata.normalize('NFKC', text)
 
-def extract_text_from_cv(file_path: str) -> str:
+def _is_garbled(text: str) -> bool:
+    """Text layer made of replacement/control characters (broken font encoding)"""
+    if not text:
+        return False
+    garbled = sum(
+        1 for char in text
+        if char == '\ufffd' or (unicodedata.category(char) == 'Cc' and char not in '\r\n\t')
+    )
+    return garbled / len(text) > settings.TEXT_LAYER_MAX_GARBLED_RATIO
+
+def get_pdf_page_count(file_path: str) -> int:
+    """Number of pages of a PDF (cheap, no parsing of page content)"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+def _capped_page_range(file_path: str, page_range: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    1-based inclusive page range to extract, limited to EXTRACTION_MAX_PAGES
+    
+    Pages past the cap are dropped so a pathological file can't monopolize
+    an extraction worker (CV content sits on the first pages).
+    """
+    page_count = get_pdf_page_count(file_path)
+    max_pages = settings.EXTRACTION_MAX_PAGES or page_count
+    start, end = page_range or (1, page_count)
+    end = min(end, page_count)
+    
+    if end > max_pages:
+        logger.warning(
+            f"⚠️ {os.path.basename(file_path)} has {page_count} pages, "
+            f"only the first {max_pages} are extracted"
+        )
+    
+    return start, min(end, max_pages)
+
+def _extract_text_layer(file_path: str, page_range: Tuple[int, int]) -> Optional[str]:
+    """
+    Read the embedded PDF text layer with pypdfium2 (no layout/OCR models)
+    
+    Returns None when the PDF needs the full Docling pipeline: a page with
+    images but almost no text (scanned), a garbled text layer, or too little
+    text overall.
+    """
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        pages = []
+        for page_number in range(page_range[0], page_range[1] + 1):
+            page = pdf[page_number - 1]
+            try:
+                textpage = page.get_textpage()
+                text = textpage.get_text_bounded().replace('\r\n', '\n')
+                textpage.close()
+                
+                if _is_garbled(text):
+                    logger.info(f"🔎 Page {page_number} has a garbled text layer")
+                    return None
+                
+                if len(text.strip()) < settings.TEXT_LAYER_MIN_CHARS:
+                    has_images = next(
+                        page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE], max_depth=2),
+                        None
+                    ) is not None
+                    if has_images:
+                        logger.info(f"🔎 Page {page_number} looks scanned")
+                        return None
+                
+                pages.append(text.strip())
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    
+    text = "\n\n".join(page for page in pages if page)
+    if len(text) < settings.TEXT_LAYER_MIN_CHARS:
+        return None
+    return text
+
+def _docx_paragraph_markdown(paragraph) -> str:
+    """One DOCX paragraph as a markdown line (heading, list item or text)"""
+    text = paragraph.text.strip()
+    if not text:
+        return ""
+    
+    style = paragraph.style.name if paragraph.style is not None else ""
+    
+    if style == "Title":
+        return f"# {text}"
+    if style.startswith("Heading"):
+        level = style.rsplit(" ", 1)[-1]
+        return f"{'#' * (int(level) if level.isdigit() else 1)} {text}"
+    
+    p_pr = paragraph._p.pPr
+    if style.startswith("List") or (p_pr is not None and p_pr.numPr is not None):
+        return f"- {text}"
+    
+    return text
+
+def _docx_table_markdown(table: Table) -> str:
+    """DOCX table as a markdown table (first row as header)"""
+    rows = [
+        [" ".join(cell.text.split()).replace("|", "\\|") for cell in row.cells]
+        for row in table.rows
+    ]
+    if not rows:
+        return ""
+    
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * len(rows[0])]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+def _extract_docx(file_path: str) -> str:
+    """
+    Convert a DOCX file to markdown with python-docx (no Docling pipeline)
+    
+    Keeps document order of headings, paragraphs, list items, tables and
+    text boxes; page header paragraphs (contact details) come first.
     """
-    Extract text from PDF/DOCX file using Docling
+    document = docx.Document(file_path)
+    blocks = []
+    
+    for section in document.sections[:1]:
+        if not section.header.is_linked_to_previous:
+            blocks.extend(_docx_paragraph_markdown(p) for p in section.header.paragraphs)
+    
+    for item in document.iter_inner_content():
+        if isinstance(item, Table):
+            blocks.append(_docx_table_markdown(item))
+            continue
+        
+        for text_box_p in TEXT_BOX_PARAGRAPHS(item._p):
+            blocks.append(" ".join(
+                t.text for t in text_box_p.iter(f"{{{nsmap['w']}}}t") if t.text
+            ).strip())
+        blocks.append(_docx_paragraph_markdown(item))
+    
+    return "\n\n".join(block for block in blocks if block)
+
+def _extract_with_docling(
+    file_path: str,
+    profile: str,
+    page_range: Optional[Tuple[int, int]] = None,
+    keep_document: bool = False
+) -> tuple[str, Optional[dict]]:
+    """Docling conversion (layout, tables, OCR per profile) as markdown (+ serialized document)"""
+    converter = get_docling_converter(profile)
+    if page_range:
+        result = converter.convert(file_path, page_range=page_range)
+    else:
+        result = converter.convert(file_path)
+    document = result.document.export_to_dict() if keep_document else None
+    return result.document.export_to_markdown(), document
+
+def extract_cv_text(
+    file_path: str,
+    profile: Optional[str] = None,
+    page_range: Optional[Tuple[int, int]] = None,
+    keep_document: bool = False
+) -> ExtractionResult:
+    """
+    Extract text from PDF/DOCX file, cheapest path first
+    
+    Born-digital PDFs are read straight from their text layer (tens of ms)
+    and DOCX files are converted with python-docx (a few ms). Docling
+    layout/OCR only runs for scanned or broken PDFs, when the fast paths are
+    disabled, or as opt-in fallback for DOCX files (DOCX_DOCLING_FALLBACK).
     
     Args:
         file_path: Path to the CV file
+        profile: Docling extraction profile (defaults to settings)
+        page_range: 1-based inclusive PDF pages to extract (default: all,
+            up to EXTRACTION_MAX_PAGES)
+        keep_document: Also return the serialized Docling document (when
+            Docling ran)
         
     Returns:
-        Cleaned text content
+        Cleaned text content and the extraction method used
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
     logger.info(f"📄 Extracting text from: {os.path.basename(file_path)}")
     
+    profile = resolve_extraction_profile(profile)
+    
     try:
-        converter = get_docling_converter()
-        result = converter.convert(file_path)
-        raw_text = result.document.export_to_markdown()
+        raw_text = None
+        document = None
+        method = EXTRACTION_DOCLING
+        
+        if file_path.lower().endswith('.pdf'):
+            page_range = _capped_page_range(file_path, page_range)
+            
+            if settings.TEXT_LAYER_FAST_PATH:
+                try:
+                    raw_text = _extract_text_layer(file_path, page_range)
+                except Exception as e:
+                    logger.warning(f"⚠️ Text layer extraction failed, using Docling: {e}")
+                
+                if raw_text is not None:
+                    method = EXTRACTION_TEXT_LAYER
+        
+        elif settings.DOCX_FAST_PATH and file_path.lower().endswith('.docx'):
+            try:
+                raw_text = _extract_docx(file_path)
+            except Exception as e:
+                if not settings.DOCX_DOCLING_FALLBACK:
+                    raise
+                logger.warning(f"⚠️ DOCX extraction failed, using Docling: {e}")
+            
+            if raw_text is not None:
+                method = EXTRACTION_DOCX
+                
+                if len(raw_text.strip()) < settings.TEXT_LAYER_MIN_CHARS and settings.DOCX_DOCLING_FALLBACK:
+                    logger.info("🔎 DOCX yielded too little text, using Docling")
+                    raw_text = None
+                    method = EXTRACTION_DOCLING
+        
+        if raw_text is None:
+            raw_text, document = _extract_with_docling(file_path, profile, page_range, keep_document)
+        
         cleaned_text = clean_text(raw_text)
         
-        logger.info(f"✅ Text extracted successfully ({len(cleaned_text)} chars)")
-        return cleaned_text
+        logger.info(f"✅ Text extracted successfully via {method} ({len(cleaned_text)} chars)")
+        return ExtractionResult(cleaned_text, method, document)
         
     except Exception as e:
         logger.error(f"❌ Failed to extract text: {e}")
         raise
+
+def extract_text_from_cv(file_path: str, profile: Optional[str] = None) -> str:
+    """
+    Extract text from PDF/DOCX file
+    
+    Args:
+        file_path: Path to the CV file
+        profile: Docling extraction profile (defaults to settings)
+        
+    Returns:
+        Cleaned text content
+    """
+    return extract_cv_text(file_path, profile).text
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from app.core.config import get_settings
+import logging
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+WARMUP_CV_TEXT = (
+    "John Smith\n"
+    "john.smith@example.com\n"
+    "Software engineer with five years of Python and FastAPI experience."
+)
+
+# Readiness state, only "pending" until warm-up finishes when PRELOAD_MODELS is on
+_model_status: dict[str, dict] = {}
+_ready = not settings.PRELOAD_MODELS
+
+async def _warm_docling():
+    """Start the extraction workers and load their Docling PDF pipeline"""
+    from app.ai.extraction_pool import warm_extraction_pool
+    
+    await asyncio.to_thread(warm_extraction_pool)
+
+def _infer_name_extraction():
+    from app.ai.model_loader import get_name_extraction_model
+    from app.ai.name_extractor import NAME_QUESTION
+    
+    get_name_extraction_model()({'question': NAME_QUESTION, 'context': WARMUP_CV_TEXT})
+
+def _infer_scoring():
+    from app.ai.model_loader import get_scoring_model
+    
+    get_scoring_model().encode([WARMUP_CV_TEXT])
+
+async def _warm_name_extraction():
+    """Load the QA model and run one dummy inference (on the inference executor)"""
+    from app.ai.inference_executor import run_inference
+    
+    await run_inference("name_extraction", _infer_name_extraction)
+
+async def _warm_scoring():
+    """Load the scoring model and run one dummy inference (on the inference executor)"""
+    from app.ai.inference_executor import run_inference
+    
+    await run_inference("scoring", _infer_scoring)
+
+WARMUP_STEPS = {
+    "docling": _warm_docling,
+    "name_extraction": _warm_name_extraction,
+    "scoring": _warm_scoring,
+}
+
+async def _run_warmup_step(name: str) -> None:
+    """Run one warm-up step and record its status and duration"""
+    _model_status[name] = {"status": "loading"}
+    start = time.perf_counter()
+    try:
+        await WARMUP_STEPS[name]()
+        load_time = round(time.perf_counter() - start, 2)
+        _model_status[name] = {"status": "ready", "load_time_s": load_time}
+        logger.info(f"✅ Model warmed up: {name} ({load_time}s)")
+    except Exception as e:
+        load_time = round(time.perf_counter() - start, 2)
+        _model_status[name] = {"status": "failed", "load_time_s": load_time, "error": str(e)}
+        logger.error(f"❌ Model warm-up failed: {name} ({e})")
+
+async def warm_up_models() -> None:
+    """
+    Preload every model and run a dummy inference, off the event loop
+    
+    Steps run concurrently (PRELOAD_MODELS_CONCURRENTLY) or one by one.
+    The app reports ready once all steps finished, failed ones included:
+    those models will simply load lazily on first use.
+    """
+    global _ready
+    
+    logger.info("🔥 Warming up AI models...")
+    start = time.perf_counter()
+    
+    for name in WARMUP_STEPS:
+        _model_status[name] = {"status": "pending"}
+    
+    if settings.PRELOAD_MODELS_CONCURRENTLY:
+        await asyncio.gather(*(_run_warmup_step(name) for name in WARMUP_STEPS))
+    else:
+        for name in WARMUP_STEPS:
+            await _run_warmup_step(name)
+    
+    _ready = True
+    logger.info(f"✅ Model warm-up finished in {time.perf_counter() - start:.2f}s")
+
+def get_readiness() -> dict:
+    """Readiness flag and per-model warm-up status / load time"""
+    return {
+        "ready": _ready,
+        "preload_models": settings.PRELOAD_MODELS,
+        "models": dict(_model_status),
+    }
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+import math
 from app.database import get_db
 from app.schemas.application import ApplicationResponse, ApplicationDetail, BulkUploadResponse
 from app.services.cv_service import (
+    get_or_create_document,
     create_application,
     get_application_by_id,
     get_job_applications,
@@ -11,7 +13,8 @@ from app.services.cv_service import (
 )
 from app.services.job_service import get_job_by_id
 from app.utils.file_handler import save_upload_file
-from app.utils.background_tasks import process_cv_application
+from app.utils.work_queue import enqueue_applications, get_queue_status, QueueStatus
+from app.utils.progress import progress_broker, application_event
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.core.config import get_settings
@@ -21,10 +24,45 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Retry-After when no CV finished recently (drain time unknown)
+DEFAULT_RETRY_AFTER = 60
+
+def _check_queue_capacity(queue_status: QueueStatus, file_count: int) -> None:
+    """
+    Admission control: reject an upload that would push the processing
+    backlog past MAX_QUEUED_CVS (all users) or MAX_QUEUED_CVS_PER_USER
+    
+    Raises 429 with Retry-After set to the estimated time for the queue to
+    drain enough to accept the upload.
+    """
+    limits = [
+        (settings.MAX_QUEUED_CVS, queue_status.depth, "Processing queue is full"),
+        (settings.MAX_QUEUED_CVS_PER_USER, queue_status.owner_depth, "Too many of your CVs are waiting for processing"),
+    ]
+    
+    # An upload larger than a limit would never be accepted, retrying won't help
+    for limit, _, _ in limits:
+        if 0 < limit < file_count:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Too many files for the processing queue. Max: {limit}"
+            )
+    
+    for limit, depth, reason in limits:
+        if limit <= 0 or depth + file_count <= limit:
+            continue
+        
+        wait = queue_status.drain_seconds(depth + file_count - limit)
+        retry_after = max(math.ceil(wait), 1) if wait is not None else DEFAULT_RETRY_AFTER
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"{reason} ({depth} CVs queued, max {limit}). Retry in {retry_after}s",
+            headers={"Retry-After": str(retry_after)}
+        )
+
 @router.post("/{job_id}/upload", response_model=BulkUploadResponse)
 async def upload_cvs(
     job_id: int,
-    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -35,7 +73,11 @@ async def upload_cvs(
     - **job_id**: Job posting ID
     - **files**: List of CV files (max 1000 files, max 10MB each)
     
-    Files are saved immediately and processed in background
+    Files are saved immediately and queued for processing by the queue
+    workers (durable: survives restarts). Uploads that would overfill the
+    queue are rejected with 429 and Retry-After. A file that
+    was already uploaded (to any job) reuses its extracted text, candidate
+    details and embedding: only the match score is computed.
     """
     # Verify job ownership
     job = await get_job_by_id(db, job_id, current_user.id)
@@ -52,40 +94,82 @@ async def upload_cvs(
             detail=f"Too many files. Max: {settings.MAX_FILES_PER_UPLOAD}"
         )
     
+    # Refuse new work before touching the disk when the backlog is too deep
+    queue_status = await get_queue_status(db, job.created_by)
+    _check_queue_capacity(queue_status, len(files))
+    
+    # Don't keep the transaction of these reads open while files are saved
+    await db.commit()
+    
     uploaded_count = 0
     failed_count = 0
     failed_files = []
+    applications = []
     
+    saved_files = []
     for file in files:
         try:
-            # Save file to disk
-            file_path, original_filename = await save_upload_file(file, job_id)
-            
-            # Create application record
-            application = await create_application(
-                db, job_id, file_path, original_filename
-            )
+            # Save file to disk (content-addressed)
+            saved_files.append((file.filename, await save_upload_file(file)))
+        except Exception as e:
+            failed_count += 1
+            failed_files.append(file.filename)
+            logger.error(f"❌ Failed to upload {file.filename}: {e}")
+    
+    # Applications are committed together with their queue tasks, so the
+    # reaper never sees one that is still waiting to be queued
+    for filename, (file_path, original_filename, content_hash, file_size) in saved_files:
+        try:
+            async with db.begin_nested():
+                # Shared document record: duplicates reuse its extraction results
+                document = await get_or_create_document(db, content_hash, file_path, file_size)
+                
+                # Create application record
+                application = await create_application(
+                    db, job_id, file_path, original_filename, document.id, commit=False
+                )
             
-            # Schedule background processing
-            background_tasks.add_task(
-                process_cv_application,
-                application.id,
-                db
-            )
+            applications.append(application)
             
             uploaded_count += 1
             logger.info(f"✅ Uploaded: {original_filename}")
             
         except Exception as e:
             failed_count += 1
-            failed_files.append(file.filename)
-            logger.error(f"❌ Failed to upload {file.filename}: {e}")
+            failed_files.append(filename)
+            logger.error(f"❌ Failed to upload {filename}: {e}")
+    
+    def admit(current: QueueStatus, cv_count: int) -> None:
+        nonlocal queue_status
+        _check_queue_capacity(current, cv_count)
+        queue_status = current
+    
+    # Queue for processing (workers claim them in groups for batched scoring;
+    # small uploads go to the interactive lane, owners take turns). Capacity
+    # is checked again under the admission lock: concurrent uploads may have
+    # filled the queue while these files were saved
+    try:
+        batch_id = await enqueue_applications(
+            db, [application.id for application in applications], owner_id=job.created_by, admit=admit
+        )
+    except HTTPException:
+        # Applications were never committed, nothing is left behind
+        await db.rollback()
+        raise
+    
+    # Open progress streams count the new applications as pending
+    await progress_broker.publish(db, [
+        application_event(application, None, batch_id) for application in applications
+    ])
     
     return BulkUploadResponse(
         total_files=len(files),
         uploaded=uploaded_count,
         failed=failed_count,
         failed_files=failed_files,
+        batch_id=batch_id,
+        queue_depth=queue_status.depth + uploaded_count,
+        estimated_drain_seconds=queue_status.drain_seconds(queue_status.depth + uploaded_count),
         message=f"Successfully uploaded {uploaded_count}/{len(files)} files. Processing started in background."
     )
 
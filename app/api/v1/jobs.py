@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+import asyncio
 from app.database import get_db
 from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobDetail
 from app.services.job_service import (
@@ -12,14 +14,20 @@ from app.services.job_service import (
     delete_job,
     get_job_statistics
 )
+from app.ai.cv_scorer import cache_job_embedding
+from app.utils.work_queue import request_rescore
+from app.utils.progress import progress_broker, format_sse, apply_progress_event
+from app.core.config import get_settings
 from app.api.deps import get_current_active_user
 from app.models.user import User
 
 router = APIRouter()
+settings = get_settings()
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_job(
     job_data: JobCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -30,6 +38,12 @@ async def create_new_job(
     - **description**: Full job description for AI matching
     """
     job = await create_job(db, job_data, current_user.id)
+    
+    # Pre-compute job embedding once, instead of on the first CV
+    # (only useful where CVs are scored, i.e. with the embedded worker)
+    if settings.RUN_EMBEDDED_WORKER:
+        background_tasks.add_task(cache_job_embedding, job.id, job.description)
+    
     return job
 
 @router.get("/", response_model=List[JobResponse])
@@ -74,13 +88,26 @@ async def get_job_details(
 async def update_job_details(
     job_id: int,
     job_data: JobUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update job title or description
+    
+    Changing the description re-ranks existing applications on the queue
+    workers (see **rescore_in_progress** on the job)
     """
     updated_job = await update_job(db, job_id, current_user.id, job_data)
+    
+    # Old embedding was invalidated by update_job, recompute it in background
+    if job_data.description is not None and settings.RUN_EMBEDDED_WORKER:
+        background_tasks.add_task(cache_job_embedding, updated_job.id, updated_job.description)
+    
+    # Existing match scores are stale, a queue worker rescores from stored CV embeddings
+    if job_data.description is not None and updated_job.rescore_in_progress:
+        request_rescore()
+    
     updated_job.application_count = len(updated_job.applications) if updated_job.applications else 0
     return updated_job
 
@@ -107,3 +134,63 @@ async def get_job_stats(
     """
     stats = await get_job_statistics(db, job_id, current_user.id)
     return stats
+
+@router.get("/{job_id}/progress")
+async def stream_job_progress(
+    job_id: int,
+    request: Request,
+    batch_id: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream processing progress of a job (Server-Sent Events)
+    
+    - **batch_id**: Only report applications of one upload (from the upload response)
+    
+    Events:
+    - `statistics`: Same counts as GET /statistics, sent first and after
+      every transition (kept up to date without querying the database)
+    - `application`: Status transition of one application (with candidate
+      name and match score once completed)
+    """
+    # Subscribe before the snapshot: a transition published in between
+    # may be applied on top of the snapshot but is never lost
+    queue = progress_broker.subscribe(job_id)
+    try:
+        stats = await get_job_statistics(db, job_id, current_user.id)
+    except Exception:
+        progress_broker.unsubscribe(job_id, queue)
+        raise
+    
+    # The stream must not hold a pooled connection while it is open
+    await db.close()
+    
+    async def event_stream():
+        try:
+            yield format_sse("statistics", stats)
+            
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.PROGRESS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                
+                # Broker closed (shutdown)
+                if event is None:
+                    break
+                
+                apply_progress_event(stats, event)
+                
+                if batch_id is None or event["batch_id"] == batch_id:
+                    yield format_sse("application", event)
+                yield format_sse("statistics", stats)
+        finally:
+            progress_broker.unsubscribe(job_id, queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
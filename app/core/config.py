@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RESERVED_FOR_API: int = 10  # Connections background processing never takes
     
     # Security
     SECRET_KEY: str
@@ -26,8 +29,89 @@ class Settings(BaseSettings):
     
     # AI Models
     NAME_EXTRACTION_MODEL: str = "timpal0l/mdeberta-v3-base-squad2"
+    NAME_EXTRACTION_QUANTIZATION: str = "none"  # none, dynamic-int8 or onnx
+    NAME_EXTRACTION_ONNX_DIR: str = "./models/name-extraction-onnx"
+    NAME_EXTRACTION_BATCH_SIZE: int = 8  # CV contexts per QA forward pass
+    NAME_HEURISTIC_THRESHOLD: float = 0.7  # Header scan confidence to skip the QA model (>1 = always use model)
     SCORING_MODEL: str = "paraphrase-multilingual-MiniLM-L12-v2"
     ACCEPTANCE_THRESHOLD: float = 0.45
+    JOB_EMBEDDING_CACHE_SIZE: int = 256  # Max job description embeddings kept in memory
+    SCORING_BATCH_SIZE: int = 32  # CVs per encoder forward pass
+    CV_PROCESSING_GROUP_SIZE: int = 16  # CVs handled per background task
+    EMBEDDING_VERSION: str = "1"  # Bump to invalidate stored CV embeddings
+    EMBEDDING_STORAGE_DTYPE: str = "float16"  # float16 or float32
+    
+    # Long CV Chunking (scoring model truncates at its max sequence length)
+    SCORING_CHUNKING: bool = False
+    SCORING_CHUNK_TOKENS: int = 128  # Tokens per window (capped to model max)
+    SCORING_CHUNK_OVERLAP: int = 16  # Tokens shared by consecutive windows
+    SCORING_MAX_CHUNKS: int = 64  # Max windows per CV
+    SCORING_CHUNK_POOLING: str = "max"  # max, mean or topk
+    SCORING_CHUNK_TOP_K: int = 3  # Used by topk pooling
+    
+    # Scoring Model Backend (onnx backends need: python download_models.py)
+    SCORING_BACKEND: str = "torch"  # torch, onnx or onnx-int8
+    SCORING_ONNX_DIR: str = "./models/scoring-onnx"
+    SCORING_ONNX_QUANTIZATION: str = "avx2"  # avx2, avx512, avx512_vnni or arm64
+    
+    # Text Extraction (PDF text layer first, Docling OCR only when needed)
+    TEXT_LAYER_FAST_PATH: bool = True
+    TEXT_LAYER_MIN_CHARS: int = 100  # Below this a page with images counts as scanned
+    TEXT_LAYER_MAX_GARBLED_RATIO: float = 0.05
+    DEFAULT_EXTRACTION_PROFILE: str = "accurate"  # fast, balanced or accurate
+    DOCX_FAST_PATH: bool = True  # python-docx instead of Docling for .docx
+    DOCX_DOCLING_FALLBACK: bool = False  # Retry with Docling when python-docx fails/finds too little
+    
+    # Extraction Worker Pool (Docling runs in separate processes)
+    EXTRACTION_WORKERS: int = 2  # 0 = run in a thread of the API process
+    EXTRACTION_MAX_TASKS_PER_WORKER: int = 100  # Recycle worker after N CVs (0 = never)
+    EXTRACTION_SPLIT_MIN_PAGES: int = 10  # Split PDFs with more pages across workers (0 = never)
+    EXTRACTION_SPLIT_PAGES_PER_PART: int = 5
+    EXTRACTION_MAX_PAGES: int = 50  # Hard cap, later pages are ignored (0 = no cap)
+    
+    # Extraction Result Cache (on disk, LRU)
+    EXTRACTION_CACHE_DIR: str = "./cache/extraction"
+    EXTRACTION_CACHE_MAX_MB: int = 512  # 0 = disabled
+    EXTRACTION_CACHE_STORE_DOCUMENT: bool = False  # Also keep the serialized Docling document
+    
+    # Inference Executor (name extraction + scoring threads)
+    INFERENCE_WORKERS: int = 2
+    INFERENCE_TORCH_THREADS: int = 0  # 0 = CPU cores / INFERENCE_WORKERS
+    
+    # Processing Queue (durable, drained by queue workers)
+    RUN_EMBEDDED_WORKER: bool = True  # Also drain the queue inside the API process
+    QUEUE_POLL_INTERVAL: float = 2.0  # Seconds between polls when the queue is empty
+    MAX_CONCURRENT_CVS: int = 64  # CVs in flight per process (also capped by the DB pool)
+    
+    # Processing Pipeline (stages linked by bounded queues)
+    PIPELINE_QUEUE_SIZE: int = 64  # CVs waiting in front of each stage
+    PIPELINE_EXTRACT_WORKERS: int = 4  # Parallel extraction units (extraction pool does the work)
+    PIPELINE_IDENTIFY_WORKERS: int = 1
+    PIPELINE_SCORE_WORKERS: int = 1
+    
+    # Scheduling (priority lanes + fair share between job owners)
+    INTERACTIVE_UPLOAD_MAX_CVS: int = 5  # Uploads up to this size use the interactive lane
+    MAX_IN_FLIGHT_PER_USER: int = 32  # Running CVs per job owner, all workers (0 = no cap)
+    
+    # Admission Control (uploads get 429 + Retry-After past these backlogs)
+    MAX_QUEUED_CVS: int = 5000  # Queued + running CVs, all users (0 = no limit)
+    MAX_QUEUED_CVS_PER_USER: int = 1000  # 0 = no limit
+    QUEUE_THROUGHPUT_WINDOW: int = 300  # Seconds of finished tasks used to estimate drain time
+    
+    # Task Leases (recovery of CVs claimed by a dead worker)
+    TASK_LEASE_SECONDS: int = 120  # Claim expires unless the worker heartbeat renews it
+    TASK_HEARTBEAT_INTERVAL: float = 30.0
+    REAPER_INTERVAL: float = 60.0  # Also runs once when a worker starts
+    MAX_TASK_ATTEMPTS: int = 3  # Claims before a CV is marked FAILED
+    RESCORE_LEASE_SECONDS: int = 600  # A rescore not finished by then is run again by another worker
+    
+    # Progress Streams (SSE)
+    PROGRESS_NOTIFY: bool = True  # Share events between processes via Postgres LISTEN/NOTIFY
+    PROGRESS_KEEPALIVE_SECONDS: float = 15.0
+    
+    # Model Warm-up (preload at startup, /ready waits for it)
+    PRELOAD_MODELS: bool = False
+    PRELOAD_MODELS_CONCURRENTLY: bool = True
     
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
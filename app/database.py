@@ -10,10 +10,20 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW
 )
 
+def get_processing_session_limit() -> int:
+    """
+    Connections background CV processing may hold at once
+    
+    The pool capacity (pool_size + max_overflow) minus the connections kept
+    for API requests (DB_POOL_RESERVED_FOR_API), at least 1.
+    """
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    return max(capacity - settings.DB_POOL_RESERVED_FOR_API, 1)
+
 # Session Factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -1,10 +1,20 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from app.core.config import get_settings
 from app.database import engine, Base
 from app.api.v1 import api_router
+from app.ai.warmup import warm_up_models, get_readiness
+from app.ai.extraction_pool import shutdown_extraction_pool
+from app.ai.inference_executor import inference_executor, get_inference_stats
+from app.ai.extraction_cache import get_extraction_cache_stats
+from app.ai.cv_scorer import get_job_embedding_cache_stats
+from app.ai.name_extractor import get_name_extraction_stats
+from app.utils.work_queue import run_worker, get_processing_stats
+from app.utils.progress import progress_broker
 import logging
 from app.core.config import get_settings
 
@@ -52,12 +62,41 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     
     logger.info("✅ Database tables created/verified")
+    
+    # Preload models in background, /ready turns green when done
+    warmup_task = None
+    if settings.PRELOAD_MODELS:
+        warmup_task = asyncio.create_task(warm_up_models())
+    
+    # Drain the processing queue in this process (worker.py scales it out)
+    worker_stop = asyncio.Event()
+    worker_task = None
+    if settings.RUN_EMBEDDED_WORKER:
+        worker_task = asyncio.create_task(run_worker(worker_stop))
+    
+    # Progress events of CVs processed by other workers (SSE streams)
+    listener_stop = asyncio.Event()
+    listener_task = None
+    if settings.PROGRESS_NOTIFY:
+        listener_task = asyncio.create_task(progress_broker.listen(listener_stop))
+    
     logger.info("✅ Application startup complete")
     
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down application...")
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    progress_broker.close()
+    if worker_task:
+        worker_stop.set()
+        await worker_task
+    if listener_task:
+        listener_stop.set()
+        await listener_task
+    shutdown_extraction_pool()
+    inference_executor.shutdown()
     await engine.dispose()
     logger.info("✅ Shutdown complete")
 
@@ -104,6 +143,29 @@ async def health_check():
         "version": settings.VERSION
     }
 
+# Readiness endpoint (models warmed up)
+@app.get("/ready", tags=["Root"])
+async def readiness_check():
+    """
+    Readiness Check Endpoint (503 until model warm-up finished)
+    
+    Also reports the counters of this process: inference, caches and
+    background processing.
+    """
+    readiness = get_readiness()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            **readiness,
+            "inference": get_inference_stats(),
+            "job_embedding_cache": get_job_embedding_cache_stats(),
+            "extraction_cache": get_extraction_cache_stats(),
+            "name_extraction": get_name_extraction_stats(),
+            "processing": get_processing_stats(),
+            "version": settings.VERSION
+        }
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1,5 +1,16 @@
 from app.models.user import User
 from app.models.job import Job
 from app.models.application import Application, ProcessingStatus
+from app.models.cv_document import CVDocument
+from app.models.processing_task import ProcessingTask, TaskStatus, TaskLane
 
-__all__ = ["User", "Job", "Application", "ProcessingStatus"]
+__all__ = [
+    "User",
+    "Job",
+    "Application",
+    "ProcessingStatus",
+    "CVDocument",
+    "ProcessingTask",
+    "TaskStatus",
+    "TaskLane",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -19,6 +19,12 @@ class Application(Base):
     
     # Foreign Keys
     job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(
+        Integer,
+        ForeignKey("cv_documents.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True
+    )
     
     # File Information
     cv_file_path = Column(String(500), nullable=False)
@@ -26,8 +32,15 @@ class Application(Base):
     
     # AI Results
     candidate_name = Column(String(200), nullable=True)
+    candidate_email = Column(String(255), nullable=True)
+    candidate_phone = Column(String(50), nullable=True)
     match_score = Column(Float, nullable=True)  # 0.0 to 1.0
     extracted_text = Column(Text, nullable=True)
+    extraction_method = Column(String(20), nullable=True)  # "text-layer", "docx" or "docling"
+    
+    # Stored CV embedding (normalized vectors) + embedding_store tag
+    cv_embedding = Column(LargeBinary, nullable=True)
+    embedding_model = Column(String(255), nullable=True)
     
     # Processing Status
     status = Column(
@@ -44,6 +57,7 @@ class Application(Base):
     
     # Relationships
     job = relationship("Job", back_populates="applications")
+    document = relationship("CVDocument", back_populates="applications")
     
     def __repr__(self):
         return f"<Application {self.original_filename} - {self.status}>"
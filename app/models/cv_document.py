@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, LargeBinary
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+class CVDocument(Base):
+    """
+    Content-addressed CV file shared by every application uploading it
+    
+    Job-independent AI results (text, candidate details, CV embedding) are
+    computed once per unique file and reused by later applications of jobs
+    using the same extraction profile.
+    """
+    __tablename__ = "cv_documents"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # File Information
+    content_hash = Column(String(64), unique=True, nullable=False, index=True)  # SHA-256
+    file_path = Column(String(500), nullable=False)
+    file_size = Column(Integer, nullable=False)
+    
+    # Extraction Results (None until first processed)
+    extracted_text = Column(Text, nullable=True)
+    extraction_method = Column(String(20), nullable=True)
+    extraction_profile = Column(String(20), nullable=True)  # Profile the text was extracted with
+    candidate_name = Column(String(200), nullable=True)
+    candidate_email = Column(String(255), nullable=True)
+    candidate_phone = Column(String(50), nullable=True)
+    
+    # CV embedding + embedding_store tag
+    cv_embedding = Column(LargeBinary, nullable=True)
+    embedding_model = Column(String(255), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    applications = relationship("Application", back_populates="document")
+    
+    def __repr__(self):
+        return f"<CVDocument {self.content_hash[:12]}>"
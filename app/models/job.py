@@ -1,8 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+import enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
+class ExtractionProfile(str, enum.Enum):
+    """Docling pipeline profile used for a job's CVs"""
+    FAST = "fast"          # No OCR, no table structure
+    BALANCED = "balanced"  # OCR + fast TableFormer
+    ACCURATE = "accurate"  # OCR + accurate TableFormer
+
 class Job(Base):
     """Job Posting Model"""
     __tablename__ = "jobs"
@@ -11,6 +18,14 @@ class Job(Base):
     title = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=False)
     
+    # Extraction profile for this job's CVs (None = DEFAULT_EXTRACTION_PROFILE)
+    extraction_profile = Column(String(20), nullable=True)
+    
+    # True while match scores are being recomputed after a description change
+    rescore_in_progress = Column(Boolean, default=False, server_default="false", nullable=False)
+    # Claim of the worker running the rescore (None = waiting for a worker)
+    rescore_lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Foreign Keys
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
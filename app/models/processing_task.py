@@ -0,0 +1,79 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Enum
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+import enum
+from app.database import Base
+
+class TaskStatus(str, enum.Enum):
+    """Work Queue Task Status"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class TaskLane(str, enum.Enum):
+    """Scheduling lane (interactive tasks are always claimed first)"""
+    INTERACTIVE = "interactive"  # Small uploads, someone is waiting for the result
+    BULK = "bulk"                # Large batch uploads
+
+class ProcessingTask(Base):
+    """
+    Durable CV processing queue entry
+    
+    One row per application to process. Workers (API process or worker.py)
+    claim queued rows with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    processes or nodes can drain the queue concurrently and nothing is lost
+    on restart. Claims serve the interactive lane first and take turns
+    between job owners so one bulk upload can't hold up everyone else.
+    
+    A claim holds a lease that the worker's heartbeat keeps extending; when
+    a worker dies, the reaper re-queues its tasks once the lease expires
+    (FAILED after MAX_TASK_ATTEMPTS claims, so a poison file can't loop).
+    """
+    __tablename__ = "processing_tasks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # Foreign Keys
+    application_id = Column(
+        Integer,
+        ForeignKey("applications.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    owner_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True
+    )  # Job.created_by, for per-user fairness
+    batch_id = Column(String(32), nullable=True, index=True)  # Upload the task came from
+    
+    # Queue State
+    status = Column(
+        Enum(TaskStatus),
+        default=TaskStatus.QUEUED,
+        nullable=False,
+        index=True
+    )
+    lane = Column(
+        Enum(TaskLane),
+        default=TaskLane.BULK,
+        nullable=False,
+        index=True
+    )
+    worker_id = Column(String(150), nullable=True)  # host:pid:uuid
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Extended by heartbeats
+    error_message = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Drain rate estimate
+    
+    # Relationships
+    application = relationship("Application")
+    
+    def __repr__(self):
+        return f"<ProcessingTask {self.application_id} - {self.status}>"
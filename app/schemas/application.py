@@ -17,6 +17,9 @@ class ApplicationResponse(BaseModel):
     job_id: int
     original_filename: str
     candidate_name: Optional[str] = None
+    candidate_email: Optional[str] = None
+    candidate_phone: Optional[str] = None
+    extraction_method: Optional[str] = None
     match_score: Optional[float] = None
     status: ProcessingStatus
     error_message: Optional[str] = None
@@ -38,4 +41,7 @@ class BulkUploadResponse(BaseModel):
     uploaded: int
     failed: int
     failed_files: list[str] = []
+    batch_id: Optional[str] = None  # Filters GET /jobs/{job_id}/progress
+    queue_depth: Optional[int] = None  # CVs queued or processing (all users), this upload included
+    estimated_drain_seconds: Optional[float] = None  # None until throughput is known
     message: str
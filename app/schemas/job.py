@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
+from app.models.job import ExtractionProfile
 
 # استخدام TYPE_CHECKING لتجنب Circular Import
 if TYPE_CHECKING:
@@ -13,19 +14,22 @@ class JobBase(BaseModel):
 
 class JobCreate(JobBase):
     """Job Creation Schema"""
-    pass
+    extraction_profile: Optional[ExtractionProfile] = None
 
 class JobUpdate(BaseModel):
     """Job Update Schema"""
     title: Optional[str] = Field(None, min_length=3, max_length=200)
     description: Optional[str] = Field(None, min_length=10)
+    extraction_profile: Optional[ExtractionProfile] = None
 
 class JobResponse(JobBase):
     """Job Response Schema"""
     id: int
     created_by: int
     created_at: datetime
+    extraction_profile: Optional[ExtractionProfile] = None
     application_count: int = 0
+    rescore_in_progress: bool = False
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -14,6 +14,7 @@ from app.services.job_service import (
     get_job_statistics
 )
 from app.services.cv_service import (
+    get_or_create_document,
     create_application,
     get_application_by_id,
     get_job_applications,
@@ -35,6 +36,7 @@ __all__ = [
     "delete_job",
     "get_job_statistics",
     # CV
+    "get_or_create_document",
     "create_application",
     "get_application_by_id",
     "get_job_applications",
@@ -1,19 +1,41 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from fastapi import HTTPException, status
 from app.models.application import Application, ProcessingStatus
+from app.models.cv_document import CVDocument
 from app.models.job import Job
 import logging
 
 logger = logging.getLogger(__name__)
 
+async def get_or_create_document(
+    db: AsyncSession,
+    content_hash: str,
+    file_path: str,
+    file_size: int
+) -> CVDocument:
+    """Get the shared document of a file hash, creating it on first upload"""
+    # ON CONFLICT keeps concurrent uploads of the same file on one record
+    await db.execute(
+        insert(CVDocument)
+        .values(content_hash=content_hash, file_path=file_path, file_size=file_size)
+        .on_conflict_do_nothing(index_elements=[CVDocument.content_hash])
+    )
+    result = await db.execute(
+        select(CVDocument).where(CVDocument.content_hash == content_hash)
+    )
+    return result.scalar_one()
+
 async def create_application(
     db: AsyncSession,
     job_id: int,
     cv_file_path: str,
-    original_filename: str
+    original_filename: str,
+    document_id: int | None = None,
+    commit: bool = True
 ) -> Application:
-    """Create new CV application"""
+    """Create new CV application (commit=False: only flushed, the caller commits)"""
     
     # Verify job exists
     result = await db.execute(select(Job).where(Job.id == job_id))
@@ -30,11 +52,15 @@ async def create_application(
         job_id=job_id,
         cv_file_path=cv_file_path,
         original_filename=original_filename,
+        document_id=document_id,
         status=ProcessingStatus.PENDING
     )
     
     db.add(db_application)
-    await db.commit()
+    if commit:
+        await db.commit()
+    else:
+        await db.flush()
     await db.refresh(db_application)
     
     logger.info(f"✅ Application created: {db_application.id} for job {job_id}")
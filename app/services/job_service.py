@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 from app.models.job import Job
 from app.models.application import Application
 from app.schemas.job import JobCreate, JobUpdate
+from app.ai.cv_scorer import invalidate_job_embedding
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,7 @@ async def create_job(db: AsyncSession, job_data: JobCreate, user_id: int) -> Job
     db_job = Job(
         title=job_data.title,
         description=job_data.description,
+        extraction_profile=job_data.extraction_profile,
         created_by=user_id
     )
     
@@ -88,8 +90,17 @@ async def update_job(
     # تحديث الحقول إذا كانت موجودة في الطلب
     if job_data.title is not None:
         job.title = job_data.title
-    if job_data.description is not None:
+    if job_data.extraction_profile is not None:
+        # Applies to CVs processed from now on
+        job.extraction_profile = job_data.extraction_profile
+    if job_data.description is not None and job_data.description != job.description:
         job.description = job_data.description
+        invalidate_job_embedding(job.id)
+        
+        # Existing match scores are stale now, a queue worker runs the rescoring pass
+        if job.applications:
+            job.rescore_in_progress = True
+            job.rescore_lease_expires_at = None
     
     await db.commit()
     
@@ -101,7 +112,7 @@ async def update_job(
     await db.execute(
         select(Job).options(selectinload(Job.applications)).where(Job.id == job.id)
     )
-
+    
     logger.info(f"✅ Job updated: {job.id}")
     return job
 
@@ -1,17 +1,38 @@
 from app.utils.file_handler import (
     validate_file_extension,
     validate_file_size,
+    compute_content_hash,
     save_upload_file,
     delete_cv_file,
     get_file_size_mb
 )
-from app.utils.background_tasks import process_cv_application
+from app.utils.background_tasks import rescore_job_applications
+from app.utils.pipeline import CVPipeline
+from app.utils.progress import progress_broker, format_sse
+from app.utils.work_queue import (
+    enqueue_applications,
+    claim_tasks,
+    get_queue_status,
+    reap_expired_tasks,
+    run_worker,
+    get_processing_stats
+)
 
 __all__ = [
     "validate_file_extension",
     "validate_file_size",
+    "compute_content_hash",
     "save_upload_file",
     "delete_cv_file",
     "get_file_size_mb",
-    "process_cv_application",
+    "rescore_job_applications",
+    "CVPipeline",
+    "progress_broker",
+    "format_sse",
+    "enqueue_applications",
+    "claim_tasks",
+    "get_queue_status",
+    "reap_expired_tasks",
+    "run_worker",
+    "get_processing_stats",
 ]
@@ -1,99 +1,430 @@
+import asyncio
 import logging
+from collections import defaultdict
+import numpy as np
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.orm import selectinload
+from app.database import AsyncSessionLocal
 from app.models.application import Application, ProcessingStatus
 from app.models.job import Job
-from app.ai.text_extractor import extract_text_from_cv
-from app.ai.name_extractor import extract_candidate_name
-from app.ai.cv_scorer import calculate_match_score
+from app.models.cv_document import CVDocument
+from app.ai.extraction_pool import extract_cv_text_async
+from app.ai.text_extractor import resolve_extraction_profile
+from app.ai.name_extractor import extract_candidate_infos
+from app.ai.cv_scorer import embed_cvs, score_embeddings, get_embedding_dimension
+from app.ai.inference_executor import run_inference
+from app.ai.embedding_store import (
+    get_embedding_tag,
+    is_current_embedding,
+    serialize_embedding,
+    load_embeddings
+)
 
 logger = logging.getLogger(__name__)
 
-async def process_cv_application(application_id: int, db: AsyncSession):
+def _mark_failed(application: Application, error: Exception):
+    """Set FAILED status on an application (caller commits)"""
+    logger.error(f"❌ Processing failed for Application {application.id}: {error}")
+    application.status = ProcessingStatus.FAILED
+    application.error_message = str(error)
+    application.processed_at = datetime.utcnow()
+
+async def _embed_applications(applications: list[Application]) -> list[np.ndarray]:
     """
-    Background task to process a single CV application
+    CV embeddings of applications, encoding each unique file at most once
     
-    Steps:
-    1. Extract text from CV file
-    2. Extract candidate name
-    3. Calculate match score against job description
-    4. Update application record
+    A current embedding stored on the shared document is reused, new ones
+    are stored on it for later uploads of the same file.
+    """
+    embedding_tag = get_embedding_tag()
     
-    Args:
-        application_id: ID of the application to process
-        db: Database session
+    to_encode = {}
+    for application in applications:
+        document = application.document
+        if document is None or not is_current_embedding(document.cv_embedding, document.embedding_model):
+            to_encode.setdefault(application.cv_file_path, application.extracted_text)
+    
+    encoded = {}
+    if to_encode:
+        new_embeddings = await run_inference("scoring", embed_cvs, list(to_encode.values()))
+        encoded = dict(zip(to_encode, new_embeddings))
+    
+    embeddings = []
+    for application in applications:
+        document = application.document
+        embedding = encoded.get(application.cv_file_path)
+        
+        if embedding is None:
+            embedding = load_embeddings(
+                [document.cv_embedding], embedding_tag, get_embedding_dimension()
+            )[0]
+        elif document is not None:
+            document.cv_embedding = serialize_embedding(embedding)
+            document.embedding_model = embedding_tag
+        
+        embeddings.append(embedding)
+    
+    return embeddings
+
+async def load_applications(db: AsyncSession, application_ids: list[int]) -> list[Application]:
+    """Fetch applications with their shared document (missing IDs are logged)"""
+    result = await db.execute(
+        select(Application)
+        .options(selectinload(Application.document))
+        .where(Application.id.in_(application_ids))
+    )
+    applications = result.scalars().all()
+    
+    missing = set(application_ids) - {a.id for a in applications}
+    for application_id in missing:
+        logger.error(f"❌ Application {application_id} not found")
+    
+    return applications
+
+async def load_job_profiles(db: AsyncSession, applications: list[Application]) -> dict:
+    """Extraction profile of each application's job (None = default profile)"""
+    result = await db.execute(
+        select(Job.id, Job.extraction_profile).where(
+            Job.id.in_({application.job_id for application in applications})
+        )
+    )
+    return dict(result.all())
+
+async def load_jobs(db: AsyncSession, applications: list[Application]) -> dict[int, Job]:
+    """Jobs of the applications, by ID"""
+    result = await db.execute(
+        select(Job).where(Job.id.in_({application.job_id for application in applications}))
+    )
+    return {job.id: job for job in result.scalars().all()}
+
+def _reset_document(document, profile: str) -> None:
+    """Forget results derived from text extracted with another profile"""
+    if document.extraction_profile != profile:
+        document.candidate_name = None
+        document.candidate_email = None
+        document.candidate_phone = None
+        document.cv_embedding = None
+        document.embedding_model = None
+
+async def extract_applications_text(
+    applications: list[Application],
+    profiles: dict
+) -> list[Application]:
     """
-    logger.info(f"🚀 Starting processing for Application ID: {application_id}")
+    Step 1: Extract text of each unique file in parallel (extraction worker pool)
     
-    try:
-        # Fetch application with job details
-        result = await db.execute(
-            select(Application).where(Application.id == application_id)
+    Uses the job's extraction profile (see load_job_profiles). Applications
+    that already have text (retry after a later stage failed) or whose
+    document was extracted before with the same profile are not extracted
+    again. Extracting with another profile replaces the document's text and
+    drops the details derived from it. No database access: the caller
+    persists the results.
+    
+    Returns:
+        Applications with text (the others are marked FAILED)
+    """
+    to_extract = set()
+    for application in applications:
+        document = application.document
+        profile = resolve_extraction_profile(profiles.get(application.job_id))
+        if application.extracted_text:
+            continue
+        if document is not None and document.extracted_text and document.extraction_profile == profile:
+            logger.info(f"♻️ Reusing extracted text for: {application.original_filename}")
+        elif (application.cv_file_path, profile) not in to_extract:
+            logger.info(f"📄 Extracting text from: {application.original_filename} ({profile})")
+            to_extract.add((application.cv_file_path, profile))
+    
+    to_extract = list(to_extract)
+    results = await asyncio.gather(
+        *(extract_cv_text_async(path, profile) for path, profile in to_extract),
+        return_exceptions=True
+    )
+    extractions = dict(zip(to_extract, results))
+    
+    extracted_applications = []
+    
+    for application in applications:
+        document = application.document
+        profile = resolve_extraction_profile(profiles.get(application.job_id))
+        try:
+            if application.extracted_text:
+                extracted_applications.append(application)
+                continue
+            
+            if (application.cv_file_path, profile) in extractions:
+                extraction = extractions[(application.cv_file_path, profile)]
+                if isinstance(extraction, BaseException):
+                    raise extraction
+                
+                extracted_text, method = extraction.text, extraction.method
+                
+                if not extracted_text or len(extracted_text.strip()) < 50:
+                    raise Exception("Extracted text is too short or empty")
+                
+                if document is not None:
+                    _reset_document(document, profile)
+                    document.extracted_text = extracted_text
+                    document.extraction_method = method
+                    document.extraction_profile = profile
+            else:
+                extracted_text, method = document.extracted_text, document.extraction_method
+            
+            application.extracted_text = extracted_text
+            application.extraction_method = method
+            extracted_applications.append(application)
+            
+        except Exception as e:
+            _mark_failed(application, e)
+    
+    return extracted_applications
+
+async def identify_candidates(applications: list[Application]) -> None:
+    """
+    Step 2: Extract candidate name/email/phone of each unique file
+    
+    Header scan first, QA model batch as fallback. Applications already
+    identified (retry) are kept as they are.
+    """
+    logger.info(f"👤 Extracting candidate names...")
+    to_identify = {}
+    for application in applications:
+        document = application.document
+        if application.candidate_name is not None:
+            continue
+        if document is None or document.candidate_name is None:
+            to_identify.setdefault(application.cv_file_path, application.extracted_text)
+    
+    identified = {}
+    if to_identify:
+        infos = await run_inference(
+            "name_extraction",
+            extract_candidate_infos,
+            list(to_identify.values())
         )
-        application = result.scalar_one_or_none()
+        identified = dict(zip(to_identify, infos))
+    
+    for application in applications:
+        if application.candidate_name is not None:
+            continue
         
-        if not application:
-            logger.error(f"❌ Application {application_id} not found")
-            return
+        document = application.document
+        info = identified.get(application.cv_file_path)
         
-        # Update status to PROCESSING
-        application.status = ProcessingStatus.PROCESSING
-        await db.commit()
+        if info is not None:
+            details = (info.name, info.email, info.phone)
+            if document is not None:
+                document.candidate_name, document.candidate_email, document.candidate_phone = details
+        else:
+            details = (document.candidate_name, document.candidate_email, document.candidate_phone)
         
-        # Fetch job description
-        result = await db.execute(
-            select(Job).where(Job.id == application.job_id)
-        )
-        job = result.scalar_one_or_none()
+        application.candidate_name, application.candidate_email, application.candidate_phone = details
+
+async def score_applications(applications: list[Application], jobs: dict[int, Job]) -> None:
+    """
+    Step 3: Encode all CVs of a job in one batched pass and score them
+    
+    Sets the CV embedding and match score and marks the applications
+    COMPLETED (FAILED when their job is gone or scoring fails). Jobs come
+    from load_jobs, fetched after extraction so a description edited
+    meanwhile is taken into account. No database access: the caller
+    persists the results.
+    """
+    by_job = defaultdict(list)
+    for application in applications:
+        by_job[application.job_id].append(application)
+    
+    embedding_tag = get_embedding_tag()
+    
+    for job_id, group in by_job.items():
+        job = jobs.get(job_id)
         
         if not job:
-            raise Exception("Job not found")
-        
-        # Step 1: Extract text from CV
-        logger.info(f"📄 Extracting text from: {application.original_filename}")
-        extracted_text = extract_text_from_cv(application.cv_file_path)
-        
-        if not extracted_text or len(extracted_text.strip()) < 50:
-            raise Exception("Extracted text is too short or empty")
+            for application in group:
+                _mark_failed(application, Exception("Job not found"))
+            continue
         
-        # Step 2: Extract candidate name
-        logger.info(f"👤 Extracting candidate name...")
-        candidate_name, name_confidence = extract_candidate_name(extracted_text)
+        logger.info(f"🎯 Calculating match scores for {len(group)} CVs...")
+        try:
+            embeddings = await _embed_applications(group)
+            scores = await run_inference(
+                "scoring", score_embeddings, job.description, embeddings, job.id
+            )
+        except Exception as e:
+            for application in group:
+                _mark_failed(application, e)
+            continue
         
-        # Step 3: Calculate match score
-        logger.info(f"🎯 Calculating match score...")
-        match_score = calculate_match_score(job.description, extracted_text)
+        # Persist CV embeddings so rescoring never re-runs the encoder
+        for application, embedding, match_score in zip(group, embeddings, scores):
+            application.cv_embedding = serialize_embedding(embedding)
+            application.embedding_model = embedding_tag
+            application.match_score = match_score
+            application.status = ProcessingStatus.COMPLETED
+            application.processed_at = datetime.utcnow()
+            
+            logger.info(
+                f"✅ Processing completed for Application {application.id}\n"
+                f"   Candidate: {application.candidate_name}\n"
+                f"   Score: {match_score * 100:.2f}%"
+            )
+
+async def fail_unfinished(
+    db: AsyncSession,
+    application_ids: list[int],
+    error: Exception
+) -> list[Application]:
+    """Roll back and mark applications still PENDING/PROCESSING as FAILED, return them"""
+    failed = []
+    try:
+        await db.rollback()
+        result = await db.execute(
+            select(Application).where(
+                Application.id.in_(application_ids),
+                Application.status.in_([ProcessingStatus.PENDING, ProcessingStatus.PROCESSING])
+            )
+        )
+        failed = result.scalars().all()
+        for application in failed:
+            _mark_failed(application, error)
+        await db.commit()
+    except Exception as db_error:
+        logger.error(f"Failed to update error status: {db_error}")
+        failed = []
+    return failed
+
+async def rescore_job_applications(job_id: int):
+    """
+    Recompute match scores after a job description change
+    
+    Run by a queue worker that claimed the job (see claim_rescores), so a
+    pass interrupted by a crash or deploy is picked up again. A failed pass
+    keeps the job flagged: it is retried once its claim expires.
+    
+    Stored CV embeddings are reused (the application's, else the shared
+    document's); only CVs without a current embedding are re-encoded (in
+    batches) from their extracted text. All scores are computed in one
+    vectorized pass. Reads and writes use two short sessions, no
+    transaction stays open during inference. Scores are written row by
+    row, so applications deleted meanwhile are simply skipped.
+    
+    Args:
+        job_id: ID of the job to rescore
+    """
+    logger.info(f"♻️ Rescoring applications of job {job_id}")
+    
+    try:
+        async with AsyncSessionLocal() as db:
+            description = (
+                await db.execute(select(Job.description).where(Job.id == job_id))
+            ).scalar_one_or_none()
+            if description is None:
+                logger.error(f"❌ Job {job_id} not found for rescoring")
+                return
+            
+            result = await db.execute(
+                select(
+                    Application.id,
+                    Application.cv_embedding,
+                    Application.embedding_model,
+                    Application.extracted_text,
+                    CVDocument.cv_embedding.label("document_embedding"),
+                    CVDocument.embedding_model.label("document_embedding_model"),
+                    CVDocument.extracted_text.label("document_text")
+                )
+                .outerjoin(CVDocument, CVDocument.id == Application.document_id)
+                .where(
+                    Application.job_id == job_id,
+                    Application.status == ProcessingStatus.COMPLETED
+                )
+            )
+            rows = result.all()
         
-        # Update application with results
-        application.extracted_text = extracted_text
-        application.candidate_name = candidate_name
-        application.match_score = match_score
-        application.status = ProcessingStatus.COMPLETED
-        application.processed_at = datetime.utcnow()
+        embedding_tag = get_embedding_tag()
+        stored, stored_blobs, missing, texts, unscored = [], [], [], [], []
+        for row in rows:
+            if is_current_embedding(row.cv_embedding, row.embedding_model):
+                stored.append(row)
+                stored_blobs.append(row.cv_embedding)
+            elif is_current_embedding(row.document_embedding, row.document_embedding_model):
+                stored.append(row)
+                stored_blobs.append(row.document_embedding)
+            elif row.extracted_text or row.document_text:
+                missing.append(row)
+                texts.append(row.extracted_text or row.document_text)
+            else:
+                unscored.append(row.id)
         
-        await db.commit()
+        if unscored:
+            logger.warning(
+                f"⚠️ {len(unscored)} applications of job {job_id} have no embedding "
+                f"nor text and keep their old score: {unscored}"
+            )
         
-        logger.info(
-            f"✅ Processing completed for Application {application_id}\n"
-            f"   Candidate: {candidate_name}\n"
-            f"   Score: {match_score * 100:.2f}%"
-        )
+        # Re-encode only CVs without a usable stored embedding
+        new_embeddings = []
+        if missing:
+            logger.info(f"🧠 Re-encoding {len(missing)} CVs without stored embedding")
+            new_embeddings = await run_inference("scoring", embed_cvs, texts)
         
-    except Exception as e:
-        logger.error(f"❌ Processing failed for Application {application_id}: {e}")
+        embeddings = []
+        if stored:
+            embeddings.extend(load_embeddings(stored_blobs, embedding_tag, get_embedding_dimension()))
+        embeddings.extend(new_embeddings)
         
-        # Update status to FAILED
-        try:
-            result = await db.execute(
-                select(Application).where(Application.id == application_id)
+        scores = []
+        if embeddings:
+            scores = await run_inference(
+                "scoring", score_embeddings, description, embeddings, job_id
             )
-            application = result.scalar_one_or_none()
+        
+        async with AsyncSessionLocal() as db:
+            # A newer description was saved meanwhile: its own pass will write scores
+            current_description = (
+                await db.execute(
+                    select(Job.description).where(Job.id == job_id).with_for_update()
+                )
+            ).scalar_one_or_none()
+            if current_description != description:
+                logger.info(f"⏭️ Job {job_id} changed during rescoring, skipping write")
+                return
+            
+            applications = Application.__table__
+            connection = await db.connection()
             
-            if application:
-                application.status = ProcessingStatus.FAILED
-                application.error_message = str(e)
-                application.processed_at = datetime.utcnow()
-                await db.commit()
-        except Exception as db_error:
-            logger.error(f"Failed to update error status: {db_error}")
+            application_ids = [row.id for row in stored] + [row.id for row in missing]
+            if application_ids:
+                await connection.execute(
+                    update(applications)
+                    .where(applications.c.id == bindparam("application_id"))
+                    .values(match_score=bindparam("score")),
+                    [
+                        {"application_id": application_id, "score": score}
+                        for application_id, score in zip(application_ids, scores)
+                    ]
+                )
+            if missing:
+                await connection.execute(
+                    update(applications)
+                    .where(applications.c.id == bindparam("application_id"))
+                    .values(cv_embedding=bindparam("embedding"), embedding_model=embedding_tag),
+                    [
+                        {"application_id": row.id, "embedding": serialize_embedding(embedding)}
+                        for row, embedding in zip(missing, new_embeddings)
+                    ]
+                )
+            
+            await db.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(rescore_in_progress=False, rescore_lease_expires_at=None)
+            )
+            await db.commit()
+        
+        logger.info(f"✅ Rescored {len(application_ids)} applications of job {job_id}")
+        
+    except Exception as e:
+        # The flag stays set: claim_rescores retries once the claim expires
+        logger.error(f"❌ Rescoring failed for job {job_id}, will retry: {e}")
@@ -1,5 +1,6 @@
 import os
 import uuid
+import hashlib
 import aiofiles
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
@@ -24,16 +25,22 @@ def generate_unique_filename(original_filename: str) -> str:
     unique_name = f"{uuid.uuid4()}{ext}"
     return unique_name
 
-async def save_upload_file(upload_file: UploadFile, job_id: int) -> tuple[str, str]:
+def compute_content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of file bytes (content address of a CV)"""
+    return hashlib.sha256(content).hexdigest()
+
+async def save_upload_file(upload_file: UploadFile) -> tuple[str, str, str, int]:
     """
-    Save uploaded CV file to disk
+    Save uploaded CV file to disk, content-addressed by its SHA-256
+    
+    Identical files (same CV uploaded to several jobs, re-uploads) share
+    one file on disk and are only written once.
     
     Args:
         upload_file: The uploaded file
-        job_id: ID of the job posting
         
     Returns:
-        Tuple of (file_path, original_filename)
+        Tuple of (file_path, original_filename, content_hash, file_size)
     """
     # Validate extension
     if not validate_file_extension(upload_file.filename):
@@ -42,36 +49,45 @@ async def save_upload_file(upload_file: UploadFile, job_id: int) -> tuple[str, s
             detail=f"File type not allowed. Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}"
         )
     
-    # Create job-specific directory
-    job_folder = Path(settings.UPLOAD_FOLDER) / "cvs" / str(job_id)
-    job_folder.mkdir(parents=True, exist_ok=True)
+    content = await upload_file.read()
+    
+    # Validate size
+    if not validate_file_size(len(content)):
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Max size: {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
+        )
+    
+    content_hash = compute_content_hash(content)
+    
+    # Sharded content-addressed directory
+    hash_folder = Path(settings.UPLOAD_FOLDER) / "cvs" / content_hash[:2]
+    hash_folder.mkdir(parents=True, exist_ok=True)
+    
+    ext = Path(upload_file.filename).suffix.lower()
+    file_path = hash_folder / f"{content_hash}{ext}"
+    
+    if file_path.exists():
+        logger.info(f"♻️ Duplicate file, reusing: {file_path}")
+        return str(file_path), upload_file.filename, content_hash, len(content)
     
-    # Generate unique filename
-    unique_filename = generate_unique_filename(upload_file.filename)
-    file_path = job_folder / unique_filename
+    # Write under a unique temp name, then move in place (atomic)
+    temp_path = hash_folder / f".{generate_unique_filename(upload_file.filename)}"
     
     try:
         # Save file asynchronously
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await upload_file.read()
-            
-            # Validate size
-            if not validate_file_size(len(content)):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large. Max size: {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
-                )
-            
+        async with aiofiles.open(temp_path, 'wb') as f:
             await f.write(content)
+        os.replace(temp_path, file_path)
         
         logger.info(f"✅ File saved: {file_path}")
-        return str(file_path), upload_file.filename
+        return str(file_path), upload_file.filename, content_hash, len(content)
         
     except Exception as e:
         logger.error(f"❌ Failed to save file: {e}")
         # Clean up partial file if exists
-        if file_path.exists():
-            file_path.unlink()
+        if temp_path.exists():
+            temp_path.unlink()
         raise HTTPException(status_code=500, detail="Failed to save file")
 
 def delete_cv_file(file_path: str) -> bool:
@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+from app.models.application import Application, ProcessingStatus
+from app.models.processing_task import ProcessingTask, TaskLane
+from app.utils.progress import progress_broker, application_event
+from app.utils.background_tasks import (
+    load_applications,
+    load_job_profiles,
+    load_jobs,
+    extract_applications_text,
+    identify_candidates,
+    score_applications,
+    fail_unfinished
+)
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# prepare(applications, db) -> context: short reads, the transaction is
+# committed right after; run(applications, context): the long part
+# (extraction pool / inference), called without any session
+StagePrepare = Callable[[list[Application], AsyncSession], Awaitable[Any]]
+StageRun = Callable[[list[Application], Any], Awaitable[Any]]
+
+async def _prepare_extract(applications: list[Application], db: AsyncSession) -> dict:
+    for application in applications:
+        application.status = ProcessingStatus.PROCESSING
+    return await load_job_profiles(db, applications)
+
+async def _prepare_identify(applications: list[Application], db: AsyncSession) -> None:
+    return None
+
+async def _run_identify(applications: list[Application], context: None) -> None:
+    await identify_candidates(applications)
+
+class Stage:
+    """One pipeline stage: a bounded input queue (interactive lane first) and its workers"""
+    
+    def __init__(
+        self,
+        name: str,
+        prepare: StagePrepare,
+        run: StageRun,
+        workers: int,
+        queue_size: int,
+        batch_size: int
+    ):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max(queue_size, 1))
+        self.next: Optional["Stage"] = None
+        self.active = 0
+        self.processed = 0
+        self.failed = 0
+        self._order = itertools.count()
+    
+    async def put(self, task: ProcessingTask) -> None:
+        """Queue a task; interactive tasks overtake bulk ones, FIFO within a lane"""
+        priority = 0 if task.lane == TaskLane.INTERACTIVE else 1
+        await self.queue.put((priority, next(self._order), task))
+    
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": self.queue.qsize(),
+            "max_queued": self.queue.maxsize,
+            "active": self.active,
+            "processed": self.processed,
+            "failed": self.failed
+        }
+
+class CVPipeline:
+    """
+    Staged CV processing: extract -> identify -> score -> finish
+    
+    Stages are linked by bounded queues (PIPELINE_QUEUE_SIZE) and each has
+    its own worker count, so a slow stage applies back-pressure instead of
+    piling up work, and extraction of the next CVs overlaps with scoring of
+    the previous ones. Workers drain up to CV_PROCESSING_GROUP_SIZE tasks per
+    unit, which keeps model calls batched. Interactive-lane tasks overtake
+    bulk ones in every stage queue.
+    
+    A unit reads what it needs on a short-lived session and commits, runs
+    the long part (extraction pool, inference) without holding a session,
+    connection or session slot, then writes its output (text, candidate
+    details, embedding/score) on a second short session before handing
+    tasks on. Applications deleted meanwhile are dropped at write time
+    instead of failing their whole group.
+    Steps skip what is already stored, so a task retried after a scoring
+    failure goes straight to scoring without being re-extracted.
+    """
+    
+    def __init__(
+        self,
+        session_scope: Callable,
+        finish: Callable[[list[ProcessingTask]], Awaitable[None]],
+        on_finished: Callable[[int], None]
+    ):
+        group_size = settings.CV_PROCESSING_GROUP_SIZE
+        queue_size = settings.PIPELINE_QUEUE_SIZE
+        
+        self.stages = [
+            Stage("extract", _prepare_extract, extract_applications_text,
+                  settings.PIPELINE_EXTRACT_WORKERS, queue_size, group_size),
+            Stage("identify", _prepare_identify, _run_identify,
+                  settings.PIPELINE_IDENTIFY_WORKERS, queue_size, group_size),
+            Stage("score", load_jobs, score_applications,
+                  settings.PIPELINE_SCORE_WORKERS, queue_size, group_size),
+        ]
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.next = next_stage
+        
+        # Closes queue entries; unbounded so the last stage never blocks on it
+        self.finish_queue: asyncio.Queue[ProcessingTask] = asyncio.Queue()
+        self._session_scope = session_scope
+        self._finish = finish
+        self._on_finished = on_finished
+        self._workers: list[asyncio.Task] = []
+    
+    def start(self) -> None:
+        """Start the stage workers (once)"""
+        if self._workers:
+            return
+        for stage in self.stages:
+            for _ in range(stage.workers):
+                self._workers.append(asyncio.create_task(self._run_stage(stage)))
+        self._workers.append(asyncio.create_task(self._run_finish()))
+    
+    async def submit(self, tasks: list[ProcessingTask]) -> None:
+        """Feed claimed tasks to the first stage (waits while it is full)"""
+        for task in tasks:
+            await self.stages[0].put(task)
+    
+    @staticmethod
+    async def _take_batch(queue: asyncio.Queue, limit: Optional[int]) -> list:
+        """Wait for one item, then take whatever else is ready (up to limit)"""
+        batch = [await queue.get()]
+        while not queue.empty() and (limit is None or len(batch) < limit):
+            batch.append(queue.get_nowait())
+        return batch
+    
+    async def _run_stage(self, stage: Stage) -> None:
+        while True:
+            tasks = [task for _, _, task in await self._take_batch(stage.queue, stage.batch_size)]
+            stage.active += 1
+            try:
+                try:
+                    forward, done = await self._run_unit(stage, tasks)
+                except Exception as e:
+                    logger.error(f"❌ Stage {stage.name} error: {e}")
+                    forward, done = [], tasks
+                
+                for task in done:
+                    await self.finish_queue.put(task)
+                for task in forward:
+                    await stage.next.put(task)
+            finally:
+                stage.active -= 1
+                for _ in tasks:
+                    stage.queue.task_done()
+    
+    async def _run_unit(self, stage: Stage, tasks: list[ProcessingTask]):
+        """Run one stage on a group of tasks, return (forward, done)"""
+        application_ids = [task.application_id for task in tasks]
+        tasks_by_application = {task.application_id: task for task in tasks}
+        applications, previous, error = [], {}, None
+        
+        # Read phase
+        async with self._session_scope():
+            async with AsyncSessionLocal() as db:
+                try:
+                    applications = await load_applications(db, application_ids)
+                    previous = {application.id: application.status for application in applications}
+                    context = await stage.prepare(applications, db)
+                    await db.commit()
+                except Exception as e:
+                    error = e
+        
+        # Long phase, detached instances only
+        if error is None:
+            try:
+                await stage.run(applications, context)
+            except Exception as e:
+                error = e
+        
+        # Write phase
+        async with self._session_scope():
+            async with AsyncSessionLocal() as db:
+                if error is None:
+                    try:
+                        # Lock the rows still there: an application deleted during
+                        # the long phase is dropped, not failed with its group
+                        result = await db.execute(
+                            select(Application.id)
+                            .where(Application.id.in_([a.id for a in applications]))
+                            .with_for_update()
+                        )
+                        existing = set(result.scalars().all())
+                        for application in applications:
+                            if application.id not in existing:
+                                logger.warning(f"⚠️ Application {application.id} was deleted during {stage.name}")
+                        applications = [a for a in applications if a.id in existing]
+                        
+                        db.add_all(applications)
+                        await db.commit()
+                    except Exception as e:
+                        error = e
+                
+                if error is None:
+                    statuses = {application.id: application.status for application in applications}
+                    changed = [a for a in applications if a.status != previous[a.id]]
+                else:
+                    logger.error(f"❌ Stage {stage.name} failed for Applications {application_ids}: {error}")
+                    changed = await fail_unfinished(db, application_ids, error)
+                    statuses = {}
+                
+                try:
+                    await progress_broker.publish(db, [
+                        application_event(a, previous.get(a.id), tasks_by_application[a.id].batch_id)
+                        for a in changed
+                    ])
+                except Exception as e:
+                    logger.error(f"❌ Failed to publish progress: {e}")
+        
+        forward, done = [], []
+        for task in tasks:
+            status = statuses.get(task.application_id)
+            if status == ProcessingStatus.PROCESSING and stage.next is not None:
+                forward.append(task)
+            else:
+                done.append(task)
+                if status != ProcessingStatus.COMPLETED:
+                    stage.failed += 1
+        
+        stage.processed += len(tasks)
+        return forward, done
+    
+    async def _run_finish(self) -> None:
+        while True:
+            tasks = await self._take_batch(self.finish_queue, None)
+            try:
+                await self._finish(tasks)
+            except Exception as e:
+                logger.error(f"❌ Failed to close queue tasks: {e}")
+            finally:
+                self._on_finished(len(tasks))
+                for _ in tasks:
+                    self.finish_queue.task_done()
+    
+    async def join(self) -> None:
+        """Wait until every submitted task went through all stages"""
+        for stage in self.stages:
+            await stage.queue.join()
+        await self.finish_queue.join()
+    
+    async def stop(self) -> None:
+        """Cancel the stage workers"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    
+    def stats(self) -> dict:
+        """Queue depth, active units and counters of each stage"""
+        stats = {stage.name: stage.stats() for stage in self.stages}
+        stats["finish"] = {"queued": self.finish_queue.qsize()}
+        return stats
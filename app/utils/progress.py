@@ -0,0 +1,176 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Optional
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import engine
+from app.models.application import Application, ProcessingStatus
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PROGRESS_CHANNEL = "cv_progress"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7500
+
+# Tags this process' notifications, they are delivered locally already
+PROCESS_ID = uuid.uuid4().hex
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def application_event(
+    application: Application,
+    previous_status: Optional[ProcessingStatus],
+    batch_id: Optional[str]
+) -> dict:
+    """Status transition of an application (previous_status None = just uploaded)"""
+    return {
+        "application_id": application.id,
+        "job_id": application.job_id,
+        "batch_id": batch_id,
+        "previous_status": previous_status.value if previous_status else None,
+        "status": application.status.value,
+        "candidate_name": application.candidate_name,
+        "match_score": application.match_score,
+        "error_message": application.error_message
+    }
+
+def apply_progress_event(stats: dict, event: dict) -> None:
+    """Update job statistics (get_job_statistics counts) with one status transition"""
+    if event["previous_status"] is None:
+        stats["total_applications"] += 1
+    else:
+        stats[event["previous_status"]] = max(stats[event["previous_status"]] - 1, 0)
+    stats[event["status"]] += 1
+
+class ProgressBroker:
+    """
+    In-process pub/sub of CV processing events, per job
+    
+    Uploads publish new applications and the pipeline publishes status
+    transitions after each stage commits.
+    Subscribers in this process get them directly; with PROGRESS_NOTIFY
+    they are also sent with Postgres NOTIFY, and listen() forwards events
+    published by other workers, so a stream sees every transition whichever
+    process ran the CV.
+    """
+    
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = defaultdict(set)
+    
+    def subscribe(self, job_id: int) -> asyncio.Queue:
+        """Start receiving the events of a job (None = broker closed)"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[job_id].add(queue)
+        return queue
+    
+    def unsubscribe(self, job_id: int, queue: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[job_id]
+    
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+    
+    def deliver(self, events: list[dict]) -> None:
+        """Hand events to local subscribers (a subscriber that can't keep up loses events)"""
+        for event in events:
+            for queue in self._subscribers.get(event["job_id"], ()):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning(f"⚠️ Progress subscriber of job {event['job_id']} is lagging, event dropped")
+    
+    async def publish(self, db: AsyncSession, events: list[dict]) -> None:
+        """
+        Publish events locally and, with PROGRESS_NOTIFY, to other processes
+        
+        The NOTIFY is sent on the given session and delivered when it commits.
+        """
+        if not events:
+            return
+        
+        self.deliver(events)
+        
+        if settings.PROGRESS_NOTIFY:
+            for payload in self._payloads(events):
+                await db.execute(select(func.pg_notify(PROGRESS_CHANNEL, payload)))
+            await db.commit()
+    
+    @staticmethod
+    def _payloads(events: list[dict]) -> list[str]:
+        """Split events into NOTIFY payloads under the size limit"""
+        def payload(chunk: list[str]) -> str:
+            return f'{{"origin": "{PROCESS_ID}", "events": [{", ".join(chunk)}]}}'
+        
+        payloads, chunk, size = [], [], 0
+        for event in events:
+            encoded = json.dumps(event, ensure_ascii=False)
+            event_size = len(encoded.encode("utf-8")) + 2
+            if chunk and size + event_size > MAX_NOTIFY_PAYLOAD - 100:
+                payloads.append(payload(chunk))
+                chunk, size = [], 0
+            chunk.append(encoded)
+            size += event_size
+        if chunk:
+            payloads.append(payload(chunk))
+        return payloads
+    
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") != PROCESS_ID:
+            self.deliver(message.get("events", []))
+    
+    async def listen(self, stop_event: asyncio.Event) -> None:
+        """Forward NOTIFY events of other processes until stop_event is set (reconnects)"""
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        
+        while not stop_event.is_set():
+            connection: Optional[asyncpg.Connection] = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(PROGRESS_CHANNEL, self._on_notify)
+                logger.info(f"📡 Listening for progress events on '{PROGRESS_CHANNEL}'")
+                
+                # Wake up now and then to notice a dropped connection
+                while not stop_event.is_set() and not connection.is_closed():
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=settings.PROGRESS_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
+            except Exception as e:
+                logger.error(f"❌ Progress listener error: {e}")
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+    
+    def close(self) -> None:
+        """End every open stream (application shutdown)"""
+        for subscribers in self._subscribers.values():
+            for queue in subscribers:
+                try:
+                    queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    queue.get_nowait()
+                    queue.put_nowait(None)
+
+progress_broker = ProgressBroker()
@@ -0,0 +1,666 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, func, case, exists
+from typing import Callable, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal, get_processing_session_limit
+from app.models.application import Application, ProcessingStatus
+from app.models.job import Job
+from app.models.processing_task import ProcessingTask, TaskStatus, TaskLane
+from app.utils.pipeline import CVPipeline
+from app.utils.progress import progress_broker, application_event
+from app.utils.background_tasks import rescore_job_applications
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Unique per process: a restarted container often gets the same hostname
+# and PID, and must not renew the leases of the process it replaced
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+
+# Advisory lock serializing upload admission (capacity check + enqueue)
+QUEUE_ADMISSION_LOCK = 0x53524149
+
+# Wakes the worker loop of this process right after an enqueue (no poll delay)
+_wakeup = asyncio.Event()
+
+# Tasks this worker failed to close: left to expire so the reaper recovers them
+_unrenewed_task_ids: set[int] = set()
+_rescore_wakeup = asyncio.Event()
+
+class LaneWaitStats:
+    """Queue wait (enqueue -> claim) of the tasks this process claimed, per lane"""
+    
+    def __init__(self, window: int = 100):
+        self.claimed = 0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+        self._recent = deque(maxlen=window)
+    
+    def record(self, wait: float) -> None:
+        self.claimed += 1
+        self.max_wait = max(self.max_wait, wait)
+        self._total_wait += wait
+        self._recent.append(wait)
+    
+    def stats(self) -> dict:
+        return {
+            "claimed": self.claimed,
+            "avg_wait_seconds": round(self._total_wait / self.claimed, 2) if self.claimed else 0.0,
+            "recent_avg_wait_seconds": round(sum(self._recent) / len(self._recent), 2) if self._recent else 0.0,
+            "max_wait_seconds": round(self.max_wait, 2)
+        }
+
+lane_wait_stats = {lane: LaneWaitStats() for lane in TaskLane}
+
+async def enqueue_applications(
+    db: AsyncSession,
+    application_ids: list[int],
+    owner_id: Optional[int] = None,
+    lane: Optional[TaskLane] = None,
+    admit: Optional[Callable[["QueueStatus", int], None]] = None
+) -> Optional[str]:
+    """
+    Add applications to the durable processing queue
+    
+    Args:
+        db: Database session
+        application_ids: IDs of the applications to process
+        owner_id: Owner of the job (fair share between users)
+        lane: Scheduling lane (default: interactive for uploads of up to
+            INTERACTIVE_UPLOAD_MAX_CVS CVs, bulk otherwise)
+        admit: Admission check called with the current backlog and the
+            number of CVs. Concurrent enqueues wait for each other's commit,
+            so two uploads can't both pass against the same backlog. When it
+            raises, nothing is queued and the caller must roll back.
+            
+    Returns:
+        Batch ID of the queued tasks (filters progress streams), None if
+        nothing was queued
+    """
+    if not application_ids:
+        return None
+    
+    if lane is None:
+        lane = TaskLane.INTERACTIVE if len(application_ids) <= settings.INTERACTIVE_UPLOAD_MAX_CVS else TaskLane.BULK
+    
+    if admit is not None:
+        await db.execute(select(func.pg_advisory_xact_lock(QUEUE_ADMISSION_LOCK)))
+        admit(await get_queue_status(db, owner_id), len(application_ids))
+    
+    batch_id = uuid.uuid4().hex
+    db.add_all(
+        ProcessingTask(application_id=application_id, owner_id=owner_id, lane=lane, batch_id=batch_id)
+        for application_id in application_ids
+    )
+    await db.commit()
+    _wakeup.set()
+    
+    logger.info(f"📥 Queued {len(application_ids)} applications for processing ({lane.value} lane)")
+    return batch_id
+
+class QueueStatus(NamedTuple):
+    """Backlog of the processing queue (queued + running tasks)"""
+    depth: int
+    owner_depth: int
+    throughput: float  # Tasks finished per second, all workers (QUEUE_THROUGHPUT_WINDOW)
+    
+    def drain_seconds(self, cvs: Optional[int] = None) -> Optional[float]:
+        """Estimated time to process `cvs` CVs (default: the whole backlog), None if unknown"""
+        cvs = self.depth if cvs is None else cvs
+        if cvs <= 0:
+            return 0.0
+        if self.throughput <= 0:
+            return None
+        return round(cvs / self.throughput, 1)
+
+async def get_queue_status(db: AsyncSession, owner_id: Optional[int] = None) -> QueueStatus:
+    """Queue depth (global and for one job owner) and recent drain rate, in one query"""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.QUEUE_THROUGHPUT_WINDOW)
+    pending = ProcessingTask.status.in_([TaskStatus.QUEUED, TaskStatus.RUNNING])
+    
+    result = await db.execute(
+        select(
+            func.count(ProcessingTask.id).filter(pending).label("depth"),
+            func.count(ProcessingTask.id).filter(pending, ProcessingTask.owner_id == owner_id).label("owner_depth"),
+            func.count(ProcessingTask.id).filter(ProcessingTask.finished_at >= cutoff).label("finished")
+        )
+        .where(pending | (ProcessingTask.finished_at >= cutoff))
+    )
+    row = result.first()
+    
+    return QueueStatus(
+        depth=row.depth,
+        owner_depth=row.owner_depth if owner_id is not None else 0,
+        throughput=row.finished / settings.QUEUE_THROUGHPUT_WINDOW
+    )
+
+async def claim_tasks(db: AsyncSession, limit: int) -> list[ProcessingTask]:
+    """
+    Claim up to `limit` queued tasks for this worker
+    
+    Scheduling order:
+    1. Interactive lane before bulk lane
+    2. Round robin between job owners: each owner's queued tasks are ranked
+       (interactive ones first), offset by what the owner already has
+       running, and lower turns go first. Turns are shared by both lanes, so
+       an owner doesn't get a turn in each of them
+    3. Oldest first
+    
+    Owners with MAX_IN_FLIGHT_PER_USER tasks running (on any worker) are
+    skipped. Tasks without an owner share one turn sequence and cap, so they
+    are scheduled like a single owner. Rows locked by another worker are
+    skipped too (FOR UPDATE SKIP LOCKED), so concurrent workers never claim
+    the same task. Each claim counts as an attempt and holds a
+    TASK_LEASE_SECONDS lease.
+    """
+    # No user has ID 0: ownerless tasks form their own group
+    owner = func.coalesce(ProcessingTask.owner_id, 0)
+    lane_order = case((ProcessingTask.lane == TaskLane.INTERACTIVE, 0), else_=1)
+    
+    running = (
+        select(owner.label("owner"), func.count().label("running"))
+        .where(ProcessingTask.status == TaskStatus.RUNNING)
+        .group_by(owner)
+        .subquery()
+    )
+    ranked = (
+        select(
+            ProcessingTask.id,
+            func.row_number().over(
+                partition_by=owner,
+                order_by=(lane_order, ProcessingTask.id)
+            ).label("rank")
+        )
+        .where(ProcessingTask.status == TaskStatus.QUEUED)
+        .subquery()
+    )
+    turn = ranked.c.rank + func.coalesce(running.c.running, 0)
+    
+    query = (
+        select(ProcessingTask)
+        .join(ranked, ranked.c.id == ProcessingTask.id)
+        .outerjoin(running, running.c.owner == owner)
+    )
+    if settings.MAX_IN_FLIGHT_PER_USER > 0:
+        query = query.where(turn <= settings.MAX_IN_FLIGHT_PER_USER)
+    
+    result = await db.execute(
+        query
+        .order_by(
+            lane_order,
+            turn,
+            ProcessingTask.id
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=ProcessingTask)
+    )
+    tasks = result.scalars().all()
+    
+    now = datetime.now(timezone.utc)
+    for task in tasks:
+        _unrenewed_task_ids.discard(task.id)
+        task.status = TaskStatus.RUNNING
+        task.worker_id = WORKER_ID
+        task.started_at = now
+        task.attempts += 1
+        task.lease_expires_at = now + timedelta(seconds=settings.TASK_LEASE_SECONDS)
+        if task.created_at is not None:
+            lane_wait_stats[task.lane].record((now - task.created_at).total_seconds())
+    await db.commit()
+    
+    return tasks
+
+async def _finish_tasks(tasks: list[ProcessingTask]) -> None:
+    """
+    Close claimed tasks according to the outcome of their application
+    
+    Updates are grouped by outcome and matched by ID, so tasks deleted
+    meanwhile (job or application deleted mid-processing) are just skipped.
+    If closing fails, the heartbeat stops renewing these leases and the
+    reaper recovers the tasks once they expire.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Application.id, Application.status, Application.error_message).where(
+                    Application.id.in_([task.application_id for task in tasks])
+                )
+            )
+            outcomes = {row.id: row for row in result.all()}
+            
+            groups: dict[tuple[TaskStatus, Optional[str]], list[int]] = {}
+            for task in tasks:
+                outcome = outcomes.get(task.application_id)
+                if outcome is not None and outcome.status == ProcessingStatus.COMPLETED:
+                    key = (TaskStatus.DONE, None)
+                else:
+                    key = (TaskStatus.FAILED, outcome.error_message if outcome else "Application not found")
+                groups.setdefault(key, []).append(task.id)
+            
+            now = datetime.now(timezone.utc)
+            for (task_status, error_message), task_ids in groups.items():
+                values = {"status": task_status, "lease_expires_at": None, "finished_at": now}
+                if task_status == TaskStatus.FAILED:
+                    values["error_message"] = error_message
+                await db.execute(
+                    update(ProcessingTask)
+                    .where(ProcessingTask.id.in_(task_ids))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+    except Exception:
+        _unrenewed_task_ids.update(task.id for task in tasks)
+        raise
+
+async def renew_leases(db: AsyncSession) -> None:
+    """Heartbeat: extend the leases of every task this worker is running"""
+    query = update(ProcessingTask).where(
+        ProcessingTask.worker_id == WORKER_ID,
+        ProcessingTask.status == TaskStatus.RUNNING
+    )
+    if _unrenewed_task_ids:
+        query = query.where(ProcessingTask.id.not_in(list(_unrenewed_task_ids)))
+    
+    await db.execute(
+        query
+        .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=settings.TASK_LEASE_SECONDS))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+async def reap_expired_tasks(db: AsyncSession) -> tuple[int, int]:
+    """
+    Recover CVs whose worker died
+    
+    - Running tasks with an expired lease are queued again, or marked
+      FAILED (with their application) after MAX_TASK_ATTEMPTS claims.
+      Tasks whose application already finished are just closed
+    - Applications left PENDING/PROCESSING without any queued or running
+      task (e.g. their tasks were deleted) are queued
+      again, keeping the attempts of their previous tasks, or marked FAILED
+      once those reached MAX_TASK_ATTEMPTS
+    
+    Status changes are published to progress streams. Safe to run from
+    several workers at once (FOR UPDATE SKIP LOCKED).
+    
+    Returns:
+        (requeued, failed) application counts
+    """
+    now = datetime.now(timezone.utc)
+    gave_up = f"Processing did not finish after {settings.MAX_TASK_ATTEMPTS} attempts"
+    
+    result = await db.execute(
+        select(ProcessingTask)
+        .where(
+            ProcessingTask.status == TaskStatus.RUNNING,
+            ProcessingTask.lease_expires_at < now
+        )
+        .with_for_update(skip_locked=True)
+    )
+    expired = result.scalars().all()
+    
+    # The worker may have written the result and died before closing its task
+    outcomes = {}
+    if expired:
+        result = await db.execute(
+            select(Application.id, Application.status, Application.error_message).where(
+                Application.id.in_([task.application_id for task in expired])
+            )
+        )
+        outcomes = {row.id: row for row in result.all()}
+    
+    # (application_id, batch_id, give up?) of everything to recover
+    recovered = []
+    finished = 0
+    for task in expired:
+        task.worker_id = None
+        task.lease_expires_at = None
+        outcome = outcomes.get(task.application_id)
+        if outcome is not None and outcome.status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+            # Close it like _finish_tasks would, the result is kept
+            task.status = TaskStatus.DONE if outcome.status == ProcessingStatus.COMPLETED else TaskStatus.FAILED
+            if outcome.status == ProcessingStatus.FAILED:
+                task.error_message = outcome.error_message
+            task.finished_at = now
+            finished += 1
+        elif task.attempts >= settings.MAX_TASK_ATTEMPTS:
+            task.status = TaskStatus.FAILED
+            task.error_message = gave_up
+            task.finished_at = now
+            recovered.append((task.application_id, task.batch_id, True))
+        else:
+            task.status = TaskStatus.QUEUED
+            recovered.append((task.application_id, task.batch_id, False))
+    
+    # Unfinished applications nobody will pick up (uploads commit applications
+    # with their tasks; the grace period covers other callers of
+    # enqueue_applications between creating and enqueueing)
+    active_task = exists().where(
+        ProcessingTask.application_id == Application.id,
+        ProcessingTask.status.in_([TaskStatus.QUEUED, TaskStatus.RUNNING])
+    )
+    previous_attempts = (
+        select(func.coalesce(func.max(ProcessingTask.attempts), 0))
+        .where(ProcessingTask.application_id == Application.id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(Application.id, Job.created_by, previous_attempts)
+        .join(Job, Job.id == Application.job_id)
+        .where(
+            Application.status.in_([ProcessingStatus.PENDING, ProcessingStatus.PROCESSING]),
+            Application.created_at < now - timedelta(seconds=settings.TASK_LEASE_SECONDS),
+            ~active_task
+        )
+        .with_for_update(skip_locked=True, of=Application)
+    )
+    expired_ids = {application_id for application_id, _, _ in recovered}
+    for application_id, owner_id, attempts in result.all():
+        if application_id in expired_ids:
+            continue
+        if attempts >= settings.MAX_TASK_ATTEMPTS:
+            recovered.append((application_id, None, True))
+        else:
+            db.add(ProcessingTask(
+                application_id=application_id,
+                owner_id=owner_id,
+                lane=TaskLane.BULK,
+                attempts=attempts
+            ))
+            recovered.append((application_id, None, False))
+    
+    if finished:
+        logger.info(f"♻️ Reaper closed {finished} expired tasks of finished CVs")
+    
+    if not recovered:
+        await db.commit()
+        return 0, 0
+    
+    result = await db.execute(
+        select(Application).where(Application.id.in_([application_id for application_id, _, _ in recovered]))
+    )
+    applications = {application.id: application for application in result.scalars().all()}
+    
+    events = []
+    requeued, failed = 0, 0
+    for application_id, batch_id, give_up in recovered:
+        application = applications.get(application_id)
+        if application is None:
+            continue
+        
+        previous_status = application.status
+        if give_up:
+            application.status = ProcessingStatus.FAILED
+            application.error_message = gave_up
+            failed += 1
+        else:
+            application.status = ProcessingStatus.PENDING
+            requeued += 1
+        
+        if application.status != previous_status:
+            events.append(application_event(application, previous_status, batch_id))
+    await db.commit()
+    
+    try:
+        await progress_broker.publish(db, events)
+    except Exception as e:
+        logger.error(f"❌ Failed to publish progress: {e}")
+    
+    if requeued or failed:
+        logger.warning(f"♻️ Reaper re-queued {requeued} CVs, gave up on {failed}")
+        _wakeup.set()
+    
+    return requeued, failed
+
+def request_rescore() -> None:
+    """Wake the rescore loop of this process (job flagged rescore_in_progress)"""
+    _rescore_wakeup.set()
+
+async def claim_rescores(db: AsyncSession, limit: int = 1) -> list[int]:
+    """
+    Claim jobs waiting for a rescoring pass
+    
+    A job flagged rescore_in_progress is claimable while it has no lease or
+    its lease expired (the worker running it died), so a description change
+    is always rescored eventually. Jobs locked by another worker are skipped.
+    
+    Returns:
+        IDs of the claimed jobs
+    """
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        select(Job.id)
+        .where(
+            Job.rescore_in_progress.is_(True),
+            (Job.rescore_lease_expires_at.is_(None)) | (Job.rescore_lease_expires_at < now)
+        )
+        .order_by(Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    job_ids = result.scalars().all()
+    
+    if job_ids:
+        # Keep updated_at: a claim is not an edit of the job
+        await db.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids))
+            .values(
+                rescore_lease_expires_at=now + timedelta(seconds=settings.RESCORE_LEASE_SECONDS),
+                updated_at=Job.updated_at
+            )
+        )
+    await db.commit()
+    
+    return list(job_ids)
+
+async def _run_rescores(stop_event: asyncio.Event) -> None:
+    """Run claimed rescoring passes one at a time until stop_event is set"""
+    while not stop_event.is_set():
+        _rescore_wakeup.clear()
+        try:
+            async with AsyncSessionLocal() as db:
+                job_ids = await claim_rescores(db)
+        except Exception as e:
+            logger.error(f"❌ Rescore claim failed: {e}")
+            job_ids = []
+        
+        for job_id in job_ids:
+            await rescore_job_applications(job_id)
+        
+        if job_ids:
+            continue
+        
+        waiters = [
+            asyncio.create_task(stop_event.wait()),
+            asyncio.create_task(_rescore_wakeup.wait())
+        ]
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=settings.QUEUE_POLL_INTERVAL,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+async def _keep_leases(stop_event: asyncio.Event) -> None:
+    """Renew this worker's leases and reap expired ones until stop_event is set"""
+    last_reap = time.monotonic()
+    
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.TASK_HEARTBEAT_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        
+        try:
+            async with AsyncSessionLocal() as db:
+                await renew_leases(db)
+                
+                if time.monotonic() - last_reap >= settings.REAPER_INTERVAL:
+                    last_reap = time.monotonic()
+                    await reap_expired_tasks(db)
+        except Exception as e:
+            logger.error(f"❌ Lease maintenance failed: {e}")
+
+class ProcessingLimiter:
+    """
+    Bounds background processing in this process
+    
+    Two budgets: CVs in flight (MAX_CONCURRENT_CVS, memory/CPU), held from
+    claim until the task is closed, and DB sessions, held by one pipeline
+    unit at a time and sized from the connection pool so bulk uploads never
+    starve API requests of connections.
+    """
+    
+    def __init__(self, max_cvs: int, max_sessions: int):
+        self.max_cvs = max(max_cvs, 1)
+        self.max_sessions = max(max_sessions, 1)
+        self.cvs_in_flight = 0
+        self.sessions_in_use = 0
+        self._cv_slots = asyncio.Semaphore(self.max_cvs)
+        self._session_slots = asyncio.Semaphore(self.max_sessions)
+    
+    async def acquire(self, max_cvs: int) -> int:
+        """Wait for at least one CV slot, take up to max_cvs slots"""
+        await self._cv_slots.acquire()
+        
+        acquired = 1
+        while acquired < max_cvs and not self._cv_slots.locked():
+            await self._cv_slots.acquire()
+            acquired += 1
+        
+        self.cvs_in_flight += acquired
+        return acquired
+    
+    def release(self, cvs: int) -> None:
+        """Give back CV slots"""
+        for _ in range(cvs):
+            self._cv_slots.release()
+        self.cvs_in_flight -= cvs
+    
+    @asynccontextmanager
+    async def session(self):
+        """Hold one DB session slot"""
+        async with self._session_slots:
+            self.sessions_in_use += 1
+            try:
+                yield
+            finally:
+                self.sessions_in_use -= 1
+    
+    def stats(self) -> dict:
+        return {
+            "cvs_in_flight": self.cvs_in_flight,
+            "max_cvs": self.max_cvs,
+            "sessions_in_use": self.sessions_in_use,
+            "max_sessions": self.max_sessions
+        }
+
+processing_limiter = ProcessingLimiter(
+    min(settings.MAX_CONCURRENT_CVS, get_processing_session_limit() * settings.CV_PROCESSING_GROUP_SIZE),
+    get_processing_session_limit()
+)
+
+def _on_tasks_finished(count: int) -> None:
+    """Free the CV slots of closed tasks and let the worker claim more"""
+    processing_limiter.release(count)
+    _wakeup.set()
+
+pipeline = CVPipeline(processing_limiter.session, _finish_tasks, _on_tasks_finished)
+
+def get_processing_stats() -> dict:
+    """CVs and DB sessions used by background processing, per-stage queues and per-lane waits"""
+    return {
+        **processing_limiter.stats(),
+        "stages": pipeline.stats(),
+        "lanes": {lane.value: stats.stats() for lane, stats in lane_wait_stats.items()}
+    }
+
+async def _wait_for_work(stop_event: asyncio.Event) -> None:
+    """Sleep until new work is queued here, stop is requested or the poll interval ends"""
+    waiters = [
+        asyncio.create_task(stop_event.wait()),
+        asyncio.create_task(_wakeup.wait())
+    ]
+    try:
+        await asyncio.wait(
+            waiters,
+            timeout=settings.QUEUE_POLL_INTERVAL,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+async def run_worker(stop_event: asyncio.Event) -> None:
+    """
+    Drain the processing queue until stop_event is set
+    
+    Claims groups of up to CV_PROCESSING_GROUP_SIZE tasks whenever the
+    processing limiter has room and feeds them to the staged pipeline
+    (extract -> identify -> score). Polls every QUEUE_POLL_INTERVAL seconds
+    when idle. Runs inside the API process (RUN_EMBEDDED_WORKER) or
+    standalone via worker.py. Claimed tasks are finished before returning.
+    
+    Reaps expired leases on start (CVs left behind by a previous deploy or
+    a crashed worker) and then every REAPER_INTERVAL, while a heartbeat
+    keeps this worker's own leases alive. Jobs waiting for a rescore after
+    a description change are claimed and rescored alongside.
+    """
+    logger.info(
+        f"👷 Queue worker started ({WORKER_ID}, "
+        f"max {processing_limiter.max_cvs} CVs / {processing_limiter.max_sessions} sessions)"
+    )
+    
+    try:
+        async with AsyncSessionLocal() as db:
+            await reap_expired_tasks(db)
+    except Exception as e:
+        logger.error(f"❌ Startup recovery failed: {e}")
+    
+    pipeline.start()
+    # Heartbeats continue until claimed tasks are drained, not just until stop
+    leases_stop = asyncio.Event()
+    leases = asyncio.create_task(_keep_leases(leases_stop))
+    rescores = asyncio.create_task(_run_rescores(stop_event))
+    
+    while not stop_event.is_set():
+        _wakeup.clear()
+        slots = await processing_limiter.acquire(settings.CV_PROCESSING_GROUP_SIZE)
+        
+        try:
+            async with processing_limiter.session():
+                async with AsyncSessionLocal() as db:
+                    tasks = await claim_tasks(db, slots)
+        except Exception as e:
+            logger.error(f"❌ Queue worker error: {e}")
+            tasks = []
+        
+        processing_limiter.release(slots - len(tasks))
+        
+        if not tasks:
+            await _wait_for_work(stop_event)
+            continue
+        
+        await pipeline.submit(tasks)
+    
+    await pipeline.join()
+    await pipeline.stop()
+    await rescores
+    leases_stop.set()
+    await leases
+    
+    logger.info(f"👷 Queue worker stopped ({WORKER_ID})")
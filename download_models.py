@@ -12,6 +12,7 @@ Run this file ONCE with internet access (Task Component / local docker).
 """
 
 import os
+import time
 from pathlib import Path
 
 # ============================================================
@@ -28,6 +29,74 @@ os.environ["TRANSFORMERS_CACHE"] = str(CACHE_DIR)
 os.environ["SENTENCE_TRANSFORMERS_HOME"] = str(CACHE_DIR)
 os.environ["TORCH_HOME"] = str(CACHE_DIR)
 
+NAME_EXTRACTION_MODEL = os.getenv("NAME_EXTRACTION_MODEL", "timpal0l/mdeberta-v3-base-squad2")
+NAME_EXTRACTION_ONNX_DIR = Path(os.getenv("NAME_EXTRACTION_ONNX_DIR", "./models/name-extraction-onnx"))
+
+SCORING_MODEL = os.getenv("SCORING_MODEL", "paraphrase-multilingual-MiniLM-L12-v2")
+SCORING_ONNX_DIR = Path(os.getenv("SCORING_ONNX_DIR", "./models/scoring-onnx"))
+SCORING_ONNX_QUANTIZATION = os.getenv("SCORING_ONNX_QUANTIZATION", "avx2")
+
+# ============================================================
+# Scoring Backend Parity Check
+# ============================================================
+
+# Fixed corpus: first entry is the job description, the rest are CV snippets
+PARITY_CORPUS = [
+    "Senior Python developer with FastAPI, PostgreSQL and Docker experience.",
+    "Backend engineer, 6 years of Python, FastAPI and async SQLAlchemy.",
+    "Data scientist skilled in pandas, scikit-learn and PyTorch.",
+    "Frontend developer: React, TypeScript, Tailwind CSS.",
+    "Développeur Python senior, expérience Django et PostgreSQL.",
+    "مهندس برمجيات خبرة خمس سنوات في بايثون وقواعد البيانات",
+    "Accountant with 10 years of experience in auditing and tax reporting.",
+    "DevOps engineer: Kubernetes, Docker, CI/CD pipelines, AWS.",
+    "Stagiaire en marketing digital, gestion des réseaux sociaux.",
+]
+
+def _timed_encode(model, runs: int = 5):
+    """Encode the parity corpus and return (embeddings, best time in seconds)"""
+    model.encode(PARITY_CORPUS, normalize_embeddings=True)  # warm-up
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        embeddings = model.encode(PARITY_CORPUS, normalize_embeddings=True)
+        best = min(best, time.perf_counter() - start)
+    return embeddings, best
+
+def check_scoring_backend_parity():
+    """Compare ONNX backends against torch on the fixed corpus and report speedup"""
+    from sentence_transformers import SentenceTransformer
+
+    torch_model = SentenceTransformer(SCORING_MODEL, cache_folder=str(CACHE_DIR))
+    reference, torch_time = _timed_encode(torch_model)
+    reference_scores = reference[1:] @ reference[0]
+
+    print(f"   torch      : {torch_time * 1000:.1f} ms")
+
+    onnx_files = {"onnx": "onnx/model.onnx"}
+    for path in sorted(SCORING_ONNX_DIR.glob(f"onnx/model_*int8_{SCORING_ONNX_QUANTIZATION}.onnx")):
+        onnx_files["onnx-int8"] = path.relative_to(SCORING_ONNX_DIR).as_posix()
+
+    for backend, file_name in onnx_files.items():
+        model = SentenceTransformer(
+            str(SCORING_ONNX_DIR),
+            backend="onnx",
+            model_kwargs={"file_name": file_name}
+        )
+        embeddings, backend_time = _timed_encode(model)
+
+        # Embeddings are normalized: row-wise dot product = cosine similarity
+        min_cosine = float((embeddings * reference).sum(axis=1).min())
+        max_score_diff = float(abs(embeddings[1:] @ embeddings[0] - reference_scores).max())
+        status = "✅" if max_score_diff <= 0.02 else "⚠️"
+
+        print(
+            f"   {backend:<11}: {backend_time * 1000:.1f} ms "
+            f"(speedup x{torch_time / backend_time:.2f}), "
+            f"min cosine vs torch {min_cosine:.4f}, "
+            f"max score diff {max_score_diff:.4f} {status}"
+        )
+
 # ============================================================
 # Main Downloader
 # ============================================================
@@ -40,7 +109,7 @@ def download_all_models():
     # --------------------------------------------------------
     # 1️⃣ Docling + OCR Models
     # --------------------------------------------------------
-    print("\n[1/3] Downloading Docling & OCR models...")
+    print("\n[1/5] Downloading Docling & OCR models...")
     try:
         from docling.document_converter import DocumentConverter, PdfFormatOption
         from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
@@ -68,11 +137,11 @@ def download_all_models():
     # --------------------------------------------------------
     # 2️⃣ Name Extraction (QA Transformer)
     # --------------------------------------------------------
-    print("\n[2/3] Downloading Name Extraction model...")
+    print("\n[2/5] Downloading Name Extraction model...")
     try:
         from transformers import AutoTokenizer, AutoModelForQuestionAnswering
 
-        model_name = "timpal0l/mdeberta-v3-base-squad2"
+        model_name = NAME_EXTRACTION_MODEL
 
         AutoTokenizer.from_pretrained(
             model_name,
@@ -92,12 +161,12 @@ def download_all_models():
     # --------------------------------------------------------
     # 3️⃣ CV Scoring (Sentence Transformer)
     # --------------------------------------------------------
-    print("\n[3/3] Downloading CV Scoring model...")
+    print("\n[3/5] Downloading CV Scoring model...")
     try:
         from sentence_transformers import SentenceTransformer
 
         SentenceTransformer(
-            "paraphrase-multilingual-MiniLM-L12-v2",
+            SCORING_MODEL,
             cache_folder=str(CACHE_DIR)
         )
 
@@ -107,6 +176,63 @@ def download_all_models():
         print("❌ Failed to download Sentence Transformer model")
         raise e
 
+    # --------------------------------------------------------
+    # 4️⃣ CV Scoring ONNX export (SCORING_BACKEND=onnx / onnx-int8)
+    # --------------------------------------------------------
+    print("\n[4/5] Exporting CV Scoring model to ONNX (+ int8)...")
+    try:
+        from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+        onnx_model = SentenceTransformer(
+            SCORING_MODEL,
+            backend="onnx",
+            cache_folder=str(CACHE_DIR)
+        )
+        onnx_model.save_pretrained(str(SCORING_ONNX_DIR))
+
+        export_dynamic_quantized_onnx_model(
+            onnx_model,
+            SCORING_ONNX_QUANTIZATION,
+            str(SCORING_ONNX_DIR)
+        )
+
+        print(f"✅ ONNX models ready in {SCORING_ONNX_DIR}")
+        print("🔎 Parity check against torch backend:")
+        check_scoring_backend_parity()
+
+    except ImportError:
+        print("⚠️ Skipped: ONNX export needs `pip install optimum[onnxruntime]`")
+    except Exception as e:
+        print("❌ Failed to export ONNX scoring model")
+        raise e
+
+    # --------------------------------------------------------
+    # 5️⃣ Name Extraction ONNX export (NAME_EXTRACTION_QUANTIZATION=onnx)
+    # --------------------------------------------------------
+    print("\n[5/5] Exporting Name Extraction model to ONNX...")
+    try:
+        from optimum.onnxruntime import ORTModelForQuestionAnswering
+        from transformers import AutoTokenizer
+
+        ORTModelForQuestionAnswering.from_pretrained(
+            NAME_EXTRACTION_MODEL,
+            export=True,
+            cache_dir=CACHE_DIR
+        ).save_pretrained(NAME_EXTRACTION_ONNX_DIR)
+        AutoTokenizer.from_pretrained(
+            NAME_EXTRACTION_MODEL,
+            cache_dir=CACHE_DIR
+        ).save_pretrained(NAME_EXTRACTION_ONNX_DIR)
+
+        print(f"✅ ONNX model ready in {NAME_EXTRACTION_ONNX_DIR}")
+        print("🔎 Compare modes with: python evaluate_name_extraction.py <samples.jsonl>")
+
+    except ImportError:
+        print("⚠️ Skipped: ONNX export needs `pip install optimum[onnxruntime]`")
+    except Exception as e:
+        print("❌ Failed to export Name Extraction ONNX model")
+        raise e
+
     # --------------------------------------------------------
     # DONE
     # --------------------------------------------------------
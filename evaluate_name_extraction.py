@@ -0,0 +1,151 @@
+"""
+Smart Recruit AI - Name Extraction Accuracy Harness
+===================================================
+
+Compares the name extraction quantization modes (none / dynamic-int8 / onnx)
+on a labeled sample of CVs, so the accuracy vs. speed/memory trade-off of
+NAME_EXTRACTION_QUANTIZATION can be chosen with real numbers.
+
+Sample file (JSONL), one labeled CV per line:
+    {"file": "samples/cv_1.pdf", "name": "Jane Doe"}
+    {"text": "Jane Doe\\nSenior Python Developer ...", "name": "Jane Doe"}
+
+Usage:
+    python evaluate_name_extraction.py samples.jsonl
+    python evaluate_name_extraction.py samples.jsonl --modes none dynamic-int8
+
+The "onnx" mode needs the graph exported by download_models.py.
+Each mode runs in its own process so memory numbers don't overlap.
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# ============================================================
+# Scoring helpers
+# ============================================================
+
+def normalize_name(name: str) -> str:
+    """Lowercase and collapse whitespace for comparison"""
+    return " ".join(name.lower().split())
+
+def token_f1(predicted: str, expected: str) -> float:
+    """Token overlap F1 between predicted and expected names"""
+    predicted_tokens = normalize_name(predicted).split()
+    expected_tokens = normalize_name(expected).split()
+    common = set(predicted_tokens) & set(expected_tokens)
+    if not common:
+        return 0.0
+    precision = len(common) / len(predicted_tokens)
+    recall = len(common) / len(expected_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+def load_samples(path: str) -> list[dict]:
+    """Load labeled samples, extracting text from CV files when needed"""
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                samples.append(json.loads(line))
+
+    if any("text" not in sample for sample in samples):
+        from app.ai.text_extractor import extract_text_from_cv
+
+        for sample in samples:
+            if "text" not in sample:
+                sample["text"] = extract_text_from_cv(sample["file"])
+
+    return samples
+
+# ============================================================
+# Per-mode evaluation (runs in a fresh process)
+# ============================================================
+
+def evaluate_mode(mode: str, samples: list[dict]) -> dict:
+    """Load the pipeline for one mode and measure accuracy, latency and memory"""
+    import psutil
+    from app.ai.model_loader import load_name_extraction_pipeline
+    from app.ai.name_extractor import clean_extracted_name, NAME_QUESTION, NAME_CONTEXT_CHARS
+
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+
+    start = time.perf_counter()
+    qa_pipeline = load_name_extraction_pipeline(mode)
+    load_time = time.perf_counter() - start
+
+    rss_loaded = process.memory_info().rss
+
+    latencies, exact_matches, f1_scores = [], [], []
+    for sample in samples:
+        start = time.perf_counter()
+        result = qa_pipeline({
+            "question": NAME_QUESTION,
+            "context": sample["text"][:NAME_CONTEXT_CHARS]
+        })
+        latencies.append(time.perf_counter() - start)
+
+        predicted = clean_extracted_name(result["answer"])
+        exact_matches.append(normalize_name(predicted) == normalize_name(sample["name"]))
+        f1_scores.append(token_f1(predicted, sample["name"]))
+
+    return {
+        "mode": mode,
+        "load_time_s": load_time,
+        "model_rss_mb": (rss_loaded - rss_before) / 1024 / 1024,
+        "peak_rss_mb": process.memory_info().rss / 1024 / 1024,
+        "latency_ms_median": statistics.median(latencies) * 1000,
+        "latency_ms_p95": sorted(latencies)[math.ceil(0.95 * len(latencies)) - 1] * 1000,
+        "exact_match": sum(exact_matches) / len(exact_matches),
+        "token_f1": statistics.mean(f1_scores),
+    }
+
+# ============================================================
+# Entry Point
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare name extraction quantization modes")
+    parser.add_argument("samples", help="JSONL file with labeled CVs")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["none", "dynamic-int8", "onnx"],
+        help="Modes to compare (default: all)"
+    )
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    print(f"📄 {len(samples)} labeled CVs loaded")
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for mode in args.modes:
+        print(f"🤖 Evaluating mode: {mode}")
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results.append(executor.submit(evaluate_mode, mode, samples).result())
+        except Exception as e:
+            print(f"❌ Mode {mode} failed: {e}")
+
+    print("\n" + "=" * 100)
+    print(
+        f"{'mode':<14}{'exact':>8}{'f1':>8}{'median ms':>12}{'p95 ms':>10}"
+        f"{'model MB':>11}{'peak MB':>10}{'load s':>9}"
+    )
+    print("-" * 100)
+    for r in results:
+        print(
+            f"{r['mode']:<14}{r['exact_match']:>8.2%}{r['token_f1']:>8.3f}"
+            f"{r['latency_ms_median']:>12.1f}{r['latency_ms_p95']:>10.1f}"
+            f"{r['model_rss_mb']:>11.0f}{r['peak_rss_mb']:>10.0f}{r['load_time_s']:>9.1f}"
+        )
+    print("=" * 100)
+
+if __name__ == "__main__":
+    main()
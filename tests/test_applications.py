@@ -6,6 +6,10 @@ Test CV upload, processing, and retrieval
 import pytest
 from httpx import AsyncClient
 from io import BytesIO
+from fastapi import HTTPException
+from app.api.v1 import applications as applications_module
+from app.api.v1.applications import _check_queue_capacity, DEFAULT_RETRY_AFTER
+from app.utils.work_queue import QueueStatus
 
 # ==========================================
 # Helper Functions
@@ -19,6 +23,12 @@ def create_fake_docx():
     """إنشاء ملف DOCX وهمي للاختبار"""
     return BytesIO(b"PK fake DOCX content")
 
+@pytest.fixture
+def small_queue(monkeypatch):
+    """حدود طابور منخفضة: 40 سيرة للجميع و25 لكل مستخدم"""
+    monkeypatch.setattr(applications_module.settings, "MAX_QUEUED_CVS", 40)
+    monkeypatch.setattr(applications_module.settings, "MAX_QUEUED_CVS_PER_USER", 25)
+
 
 # ==========================================
 # Upload CV Tests
@@ -86,6 +96,65 @@ async def test_upload_multiple_cvs(authenticated_client):
     assert data["uploaded"] >= 1  # على الأقل واحد نجح
 
 
+@pytest.mark.asyncio
+async def test_upload_same_cv_to_two_jobs(authenticated_client):
+    """
+    Test: رفع نفس السيرة الذاتية لوظيفتين (ملف مشترك واحد)
+    """
+    client, _ = authenticated_client
+    
+    job_ids = []
+    for title in ("First Job", "Second Job"):
+        job_response = await client.post(
+            "/api/v1/jobs/",
+            json={"title": title, "description": "Test Description"}
+        )
+        job_ids.append(job_response.json()["id"])
+    
+    for job_id in job_ids:
+        response = await client.post(
+            f"/api/v1/applications/{job_id}/upload",
+            files={"files": ("same_cv.pdf", create_fake_pdf(), "application/pdf")}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["uploaded"] == 1
+    
+    # نفس الملف على القرص لكلا الطلبين
+    paths = set()
+    for job_id in job_ids:
+        list_response = await client.get(f"/api/v1/applications/{job_id}/applications")
+        application_id = list_response.json()[0]["id"]
+        detail_response = await client.get(f"/api/v1/applications/application/{application_id}")
+        paths.add(detail_response.json()["cv_file_path"])
+    
+    assert len(paths) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_reports_queue_depth(authenticated_client):
+    """
+    Test: رد الرفع يتضمن عمق الطابور
+    """
+    client, _ = authenticated_client
+    
+    job_response = await client.post(
+        "/api/v1/jobs/",
+        json={"title": "Queue Job", "description": "Test Description"}
+    )
+    job_id = job_response.json()["id"]
+    
+    response = await client.post(
+        f"/api/v1/applications/{job_id}/upload",
+        files={"files": ("queued_cv.pdf", create_fake_pdf(), "application/pdf")}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["queue_depth"] >= 1
+    assert "estimated_drain_seconds" in data
+
+
 @pytest.mark.asyncio
 async def test_upload_cv_invalid_extension(authenticated_client):
     """
@@ -259,3 +328,79 @@ async def test_delete_application(authenticated_client):
         response = await client.delete(f"/api/v1/applications/application/{app_id}")
         
         assert response.status_code == 204
+
+
+# ==========================================
+# Admission Control Tests
+# ==========================================
+
+def test_queue_capacity_accepts_upload_within_limits(small_queue):
+    """
+    Test: قبول الرفع ضمن حدود الطابور
+    """
+    _check_queue_capacity(QueueStatus(depth=30, owner_depth=20, throughput=1.0), 5)
+
+
+def test_queue_capacity_rejects_full_owner_queue(small_queue):
+    """
+    Test: رفض الرفع بـ 429 مع Retry-After عند امتلاء طابور المستخدم
+    """
+    with pytest.raises(HTTPException) as error:
+        _check_queue_capacity(QueueStatus(depth=30, owner_depth=20, throughput=0.5), 8)
+    
+    assert error.value.status_code == 429
+    # 3 سير زائدة بمعدل 0.5 في الثانية
+    assert error.value.headers["Retry-After"] == "6"
+
+
+def test_queue_capacity_rejects_full_global_queue(small_queue):
+    """
+    Test: رفض الرفع عند امتلاء الطابور العام، مع مهلة افتراضية دون معدل معروف
+    """
+    with pytest.raises(HTTPException) as error:
+        _check_queue_capacity(QueueStatus(depth=40, owner_depth=0, throughput=0.0), 1)
+    
+    assert error.value.status_code == 429
+    assert error.value.headers["Retry-After"] == str(DEFAULT_RETRY_AFTER)
+
+
+def test_queue_capacity_rejects_upload_larger_than_limit(small_queue):
+    """
+    Test: رفض الرفع الأكبر من الحد بـ 400 (إعادة المحاولة لا تفيد)
+    """
+    with pytest.raises(HTTPException) as error:
+        _check_queue_capacity(QueueStatus(depth=0, owner_depth=0, throughput=1.0), 26)
+    
+    assert error.value.status_code == 400
+    assert error.value.headers is None or "Retry-After" not in error.value.headers
+
+
+@pytest.mark.asyncio
+async def test_upload_rejected_when_owner_queue_full(authenticated_client, monkeypatch):
+    """
+    Test: الرفع يعيد 429 مع Retry-After عند امتلاء طابور المستخدم
+    """
+    monkeypatch.setattr(applications_module.settings, "MAX_QUEUED_CVS_PER_USER", 1)
+    client, _ = authenticated_client
+    
+    job_response = await client.post(
+        "/api/v1/jobs/",
+        json={"title": "Full Queue Job", "description": "Test Description"}
+    )
+    job_id = job_response.json()["id"]
+    
+    first = await client.post(
+        f"/api/v1/applications/{job_id}/upload",
+        files={"files": ("first_cv.pdf", create_fake_pdf(), "application/pdf")}
+    )
+    second = await client.post(
+        f"/api/v1/applications/{job_id}/upload",
+        files={"files": ("second_cv.pdf", create_fake_pdf(), "application/pdf")}
+    )
+    
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+    
+    listed = await client.get(f"/api/v1/applications/{job_id}/applications")
+    assert len(listed.json()) == 1
@@ -0,0 +1,252 @@
+"""
+CV Scorer Tests
+Test the job embedding cache, batch scoring and chunk pooling (no model)
+"""
+
+import numpy as np
+from app.ai import cv_scorer
+from app.ai.cv_scorer import JobEmbeddingCache
+
+# ==========================================
+# Helper Functions
+# ==========================================
+
+class FakeScoringModel:
+    """نموذج وهمي يعيد تمثيلات ثابتة لكل نص ويسجّل ما أُرسل للترميز"""
+    
+    def __init__(self, vectors: dict):
+        self.vectors = vectors
+        self.encoded = []
+        self.tokenizer = FakeTokenizer()
+        self.max_seq_length = 512
+    
+    def encode(self, texts, batch_size=None, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+class FakeTokenizer:
+    """مُرمّز وهمي: كل كلمة رمز واحد مع مواضعها في النص"""
+    
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=True, verbose=False):
+        offsets, position = [], 0
+        for word in text.split():
+            start = text.index(word, position)
+            position = start + len(word)
+            offsets.append((start, position))
+        return {"offset_mapping": offsets}
+
+def use_fake_model(monkeypatch, vectors: dict) -> FakeScoringModel:
+    """استبدال نموذج التقييم وذاكرة تمثيلات الوظائف بنسخ للاختبار"""
+    model = FakeScoringModel(vectors)
+    monkeypatch.setattr(cv_scorer, "get_scoring_model", lambda: model)
+    monkeypatch.setattr(cv_scorer, "job_embedding_cache", JobEmbeddingCache(max_size=4))
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNKING", False)
+    return model
+
+# ==========================================
+# Job Embedding Cache Tests
+# ==========================================
+
+def test_job_embedding_cache_evicts_least_recently_used():
+    """
+    Test: الإزاحة تبدأ بالمدخل الأقدم استخداماً
+    """
+    cache = JobEmbeddingCache(max_size=2)
+    cache.put((1, "a"), np.ones(2))
+    cache.put((2, "b"), np.ones(2))
+    
+    cache.get((1, "a"))
+    cache.put((3, "c"), np.ones(2))
+    
+    assert cache.get((1, "a")) is not None
+    assert cache.get((2, "b")) is None
+    assert cache.get((3, "c")) is not None
+
+
+def test_job_embedding_cache_counts_hits_and_misses():
+    """
+    Test: تسجيل الإصابات والإخفاقات ونسبة الإصابة
+    """
+    cache = JobEmbeddingCache(max_size=4)
+    cache.put((1, "a"), np.ones(2))
+    
+    cache.get((1, "a"))
+    cache.get((1, "b"))
+    
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["size"] == 1
+
+
+def test_job_embedding_cache_invalidate_drops_every_entry_of_job():
+    """
+    Test: الإبطال يحذف كل تمثيلات الوظيفة فقط
+    """
+    cache = JobEmbeddingCache(max_size=4)
+    cache.put((1, "old"), np.ones(2))
+    cache.put((1, "new"), np.ones(2))
+    cache.put((2, "other"), np.ones(2))
+    
+    assert cache.invalidate(1) == 2
+    assert cache.get((1, "new")) is None
+    assert cache.get((2, "other")) is not None
+
+
+def test_edited_description_misses_cache(monkeypatch):
+    """
+    Test: تعديل وصف الوظيفة يغيّر مفتاح الذاكرة المؤقتة فلا يُعاد تمثيل قديم
+    """
+    encoded = []
+    
+    def fake_encode(texts, batch_size=None):
+        encoded.extend(texts)
+        return np.ones((len(texts), 2), dtype=np.float32)
+    
+    monkeypatch.setattr(cv_scorer, "_encode_normalized", fake_encode)
+    monkeypatch.setattr(cv_scorer, "job_embedding_cache", JobEmbeddingCache(max_size=4))
+    
+    cv_scorer.get_job_embedding("Python developer", job_id=1)
+    cv_scorer.get_job_embedding("Python developer", job_id=1)
+    cv_scorer.get_job_embedding("Senior Python developer", job_id=1)
+    
+    assert encoded == ["Python developer", "Senior Python developer"]
+
+
+# ==========================================
+# Batch Scoring Tests
+# ==========================================
+
+def test_score_batch_preserves_input_order(monkeypatch):
+    """
+    Test: الدرجات تعود بترتيب السير الذاتية رغم فرزها حسب الطول قبل الترميز
+    """
+    use_fake_model(monkeypatch, {
+        "job": [1.0, 0.0],
+        "exact match CV": [1.0, 0.0],
+        "unrelated": [0.0, 1.0],
+        "partial match, much longer CV text": [0.6, 0.8]
+    })
+    
+    scores = cv_scorer.score_batch("job", ["unrelated", "partial match, much longer CV text", "exact match CV"])
+    
+    assert scores == [0.0, 0.6, 1.0]
+
+
+def test_score_batch_skips_empty_cvs(monkeypatch):
+    """
+    Test: السير الفارغة تأخذ 0.0 ولا تُرسل إلى النموذج
+    """
+    model = use_fake_model(monkeypatch, {"job": [1.0, 0.0], "cv": [1.0, 0.0]})
+    
+    scores = cv_scorer.score_batch("job", ["", "cv", ""])
+    
+    assert scores == [0.0, 1.0, 0.0]
+    assert "" not in model.encoded
+
+
+def test_score_batch_empty_input(monkeypatch):
+    """
+    Test: قائمة فارغة أو وصف فارغ لا يستدعي النموذج
+    """
+    model = use_fake_model(monkeypatch, {})
+    
+    assert cv_scorer.score_batch("job", []) == []
+    assert cv_scorer.score_batch("", ["cv"]) == [0.0]
+    assert model.encoded == []
+
+
+# ==========================================
+# Chunking Tests
+# ==========================================
+
+def test_chunk_text_short_text_single_chunk(monkeypatch):
+    """
+    Test: النص القصير يبقى مقطعاً واحداً كما هو
+    """
+    use_fake_model(monkeypatch, {})
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_TOKENS", 10)
+    
+    assert cv_scorer._chunk_text("one two three") == ["one two three"]
+
+
+def test_chunk_text_overlapping_windows(monkeypatch):
+    """
+    Test: النص الطويل يُقسّم إلى نوافذ متداخلة ضمن حد الرموز (مع حجز رمزين خاصين)
+    """
+    use_fake_model(monkeypatch, {})
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_TOKENS", 6)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_OVERLAP", 1)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_MAX_CHUNKS", 64)
+    
+    chunks = cv_scorer._chunk_text("w1 w2 w3 w4 w5 w6 w7 w8 w9 w10")
+    
+    assert chunks == ["w1 w2 w3 w4", "w4 w5 w6 w7", "w7 w8 w9 w10"]
+
+
+def test_chunk_text_respects_max_chunks(monkeypatch):
+    """
+    Test: عدد المقاطع لا يتجاوز SCORING_MAX_CHUNKS
+    """
+    use_fake_model(monkeypatch, {})
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_TOKENS", 4)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_OVERLAP", 0)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_MAX_CHUNKS", 2)
+    
+    chunks = cv_scorer._chunk_text(" ".join(f"w{i}" for i in range(20)))
+    
+    assert chunks == ["w0 w1", "w2 w3"]
+
+
+# ==========================================
+# Chunk Pooling Tests
+# ==========================================
+
+SIMILARITIES = np.array([0.2, 0.9, 0.4, 0.5, 0.1, 0.3, 0.6])
+CHUNK_COUNTS = [3, 1, 3]
+
+def test_pool_scores_max(monkeypatch):
+    """
+    Test: التجميع بالحد الأقصى لكل سيرة
+    """
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_POOLING", "max")
+    
+    assert np.allclose(cv_scorer._pool_scores(SIMILARITIES, CHUNK_COUNTS), [0.9, 0.5, 0.6])
+
+
+def test_pool_scores_mean(monkeypatch):
+    """
+    Test: التجميع بالمتوسط لكل سيرة
+    """
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_POOLING", "mean")
+    
+    assert np.allclose(cv_scorer._pool_scores(SIMILARITIES, CHUNK_COUNTS), [0.5, 0.5, 1 / 3])
+
+
+def test_pool_scores_topk(monkeypatch):
+    """
+    Test: متوسط أفضل k مقاطع، والسيرة ذات المقاطع الأقل تستخدم كل مقاطعها
+    """
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_POOLING", "topk")
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_TOP_K", 2)
+    
+    assert np.allclose(cv_scorer._pool_scores(SIMILARITIES, CHUNK_COUNTS), [0.65, 0.5, 0.45])
+
+
+def test_score_batch_pools_chunked_cvs(monkeypatch):
+    """
+    Test: تقييم السير المقسّمة يجمع تشابه مقاطعها في درجة واحدة
+    """
+    use_fake_model(monkeypatch, {
+        "job": [1.0, 0.0],
+        "w1 w2": [0.0, 1.0],
+        "w3 w4": [0.8, 0.6],
+        "short": [0.6, 0.8]
+    })
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNKING", True)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_TOKENS", 4)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_OVERLAP", 0)
+    monkeypatch.setattr(cv_scorer.settings, "SCORING_CHUNK_POOLING", "max")
+    
+    assert cv_scorer.score_batch("job", ["w1 w2 w3 w4", "short"]) == [0.8, 0.6]
@@ -0,0 +1,79 @@
+"""
+Extraction Cache Tests
+Test cache keys, round trips and size-bounded eviction (temporary directory)
+"""
+
+import os
+from app.ai import extraction_cache as cache_module
+from app.ai.extraction_cache import ExtractionCache
+from app.ai.text_extractor import ExtractionResult, EXTRACTION_TEXT_LAYER
+
+# ==========================================
+# Cache Key Tests
+# ==========================================
+
+def test_key_depends_on_file_and_profile(tmp_path):
+    """
+    Test: المفتاح يختلف باختلاف الملف أو ملف الاستخراج ويثبت لنفس المدخلات
+    """
+    cache = ExtractionCache(str(tmp_path), max_bytes=1024)
+    
+    assert cache.make_key("abc", "fast") == cache.make_key("abc", "fast")
+    assert cache.make_key("abc", "fast") != cache.make_key("abc", "accurate")
+    assert cache.make_key("abc", "fast") != cache.make_key("abd", "fast")
+
+
+def test_key_changes_with_extraction_settings(tmp_path, monkeypatch):
+    """
+    Test: تغيير إعدادات تؤثر على الناتج (حد الصفحات، المسار السريع) يغيّر المفتاح
+    """
+    cache = ExtractionCache(str(tmp_path), max_bytes=1024)
+    key = cache.make_key("abc", "fast")
+    
+    monkeypatch.setattr(cache_module.settings, "EXTRACTION_MAX_PAGES", 7)
+    capped_key = cache.make_key("abc", "fast")
+    monkeypatch.setattr(cache_module.settings, "TEXT_LAYER_FAST_PATH", not cache_module.settings.TEXT_LAYER_FAST_PATH)
+    
+    assert len({key, capped_key, cache.make_key("abc", "fast")}) == 3
+
+
+# ==========================================
+# Storage Tests
+# ==========================================
+
+def test_put_then_get_round_trip(tmp_path):
+    """
+    Test: القيمة المخزنة تُقرأ كما هي مع تسجيل الإصابة والإخفاق
+    """
+    cache = ExtractionCache(str(tmp_path), max_bytes=1024 * 1024)
+    key = cache.make_key("abc", "fast")
+    
+    assert cache.get(key) is None
+    cache.put(key, ExtractionResult("محمد أحمد\nPython", EXTRACTION_TEXT_LAYER))
+    
+    assert cache.get(key) == ExtractionResult("محمد أحمد\nPython", EXTRACTION_TEXT_LAYER, None)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    """
+    Test: تجاوز الحجم يحذف أقدم المدخلات استخداماً ويبقي الحجم ضمن الميزانية
+    """
+    entry_text = "x" * 400
+    cache = ExtractionCache(str(tmp_path), max_bytes=1100)
+    keys = [cache.make_key(f"file-{i}", "fast") for i in range(3)]
+    
+    for age, key in zip((300, 200), keys[:2]):
+        cache.put(key, ExtractionResult(entry_text, EXTRACTION_TEXT_LAYER))
+        os.utime(cache._entry_path(key), (0, 1_000_000 - age))
+    
+    # A hit refreshes the oldest entry, the other one becomes the LRU
+    cache.get(keys[0])
+    cache.put(keys[2], ExtractionResult(entry_text, EXTRACTION_TEXT_LAYER))
+    
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.evictions == 1
+    assert cache._current_size() <= 1100
@@ -172,6 +172,61 @@ async def test_update_job_success(authenticated_client):
     assert data["description"] == "Original Description"  # لم يتغير
 
 
+@pytest.mark.asyncio
+async def test_update_job_description_without_applications(authenticated_client):
+    """
+    Test: تغيير الوصف لوظيفة بدون طلبات لا يبدأ إعادة التقييم
+    """
+    client, _ = authenticated_client
+    
+    create_response = await client.post(
+        "/api/v1/jobs/",
+        json={"title": "Original Title", "description": "Original Description"}
+    )
+    job_id = create_response.json()["id"]
+    
+    response = await client.put(
+        f"/api/v1/jobs/{job_id}",
+        json={"description": "Updated Description"}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["description"] == "Updated Description"
+    assert data["rescore_in_progress"] is False
+
+
+@pytest.mark.asyncio
+async def test_update_job_extraction_profile(authenticated_client):
+    """
+    Test: اختيار ملف استخراج النصوص للوظيفة
+    """
+    client, _ = authenticated_client
+    
+    create_response = await client.post(
+        "/api/v1/jobs/",
+        json={"title": "Junior Developer", "description": "Entry level developer role"}
+    )
+    assert create_response.json()["extraction_profile"] is None
+    job_id = create_response.json()["id"]
+    
+    response = await client.put(
+        f"/api/v1/jobs/{job_id}",
+        json={"extraction_profile": "fast"}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["extraction_profile"] == "fast"
+    
+    # ملف غير معروف
+    response = await client.put(
+        f"/api/v1/jobs/{job_id}",
+        json={"extraction_profile": "ultra"}
+    )
+    
+    assert response.status_code == 422
+
+
 # ==========================================
 # Delete Job Tests
 # ==========================================
@@ -238,3 +293,15 @@ async def test_get_job_statistics(authenticated_client):
     assert "total_applications" in data
     assert "completed" in data
     assert "pending" in data
+
+
+@pytest.mark.asyncio
+async def test_job_progress_not_found(authenticated_client):
+    """
+    Test: متابعة تقدم وظيفة غير موجودة
+    """
+    client, _ = authenticated_client
+    
+    response = await client.get("/api/v1/jobs/99999/progress")
+    
+    assert response.status_code == 404
@@ -0,0 +1,242 @@
+"""
+Processing Pipeline Tests
+Test stage forwarding, failure routing, shutdown and stage steps (no database)
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from app.models.application import ProcessingStatus
+from app.models.processing_task import TaskLane
+from app.utils import pipeline as pipeline_module
+from app.utils import background_tasks
+from app.utils.pipeline import CVPipeline
+
+# ==========================================
+# Helper Functions
+# ==========================================
+
+class FakeSession:
+    """جلسة وهمية تكفي لمراحل خط المعالجة"""
+    
+    def __init__(self, log: list, applications: dict):
+        self.log = log
+        self.applications = applications
+    
+    async def __aenter__(self):
+        self.log.append("open")
+        return self
+    
+    async def __aexit__(self, *exc):
+        self.log.append("close")
+    
+    async def execute(self, query):
+        # استعلام الكتابة: معرفات الطلبات التي ما زالت موجودة
+        rows = list(self.applications)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+    
+    def add_all(self, objects):
+        pass
+    
+    async def commit(self):
+        pass
+
+@asynccontextmanager
+async def session_slot():
+    yield
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """خط معالجة بطلبات في الذاكرة، يعيد (pipeline, applications, finished, log)"""
+    applications, finished, log = {}, [], []
+    
+    async def load_applications(db, application_ids):
+        return [
+            applications.setdefault(i, SimpleNamespace(id=i, job_id=1, status=ProcessingStatus.PENDING))
+            for i in application_ids
+        ]
+    
+    async def fail_unfinished(db, application_ids, error):
+        failed = [
+            applications[i] for i in application_ids
+            if applications[i].status in (ProcessingStatus.PENDING, ProcessingStatus.PROCESSING)
+        ]
+        for application in failed:
+            application.status = ProcessingStatus.FAILED
+        return failed
+    
+    async def publish(db, events):
+        pass
+    
+    async def finish(tasks):
+        finished.extend(task.id for task in tasks)
+    
+    monkeypatch.setattr(pipeline_module, "AsyncSessionLocal", lambda: FakeSession(log, applications))
+    monkeypatch.setattr(pipeline_module, "load_applications", load_applications)
+    monkeypatch.setattr(pipeline_module, "fail_unfinished", fail_unfinished)
+    monkeypatch.setattr(pipeline_module.progress_broker, "publish", publish)
+    monkeypatch.setattr(pipeline_module, "application_event", lambda *args: args)
+    
+    pipeline = CVPipeline(session_slot, finish, lambda count: None)
+    extract, identify, score = pipeline.stages
+    
+    async def prepare(applications, db):
+        log.append("prepare")
+        for application in applications:
+            application.status = ProcessingStatus.PROCESSING
+    
+    async def run_extract(applications, context):
+        # جلسة القراءة مغلقة أثناء الجزء الطويل
+        assert log[-1] == "close"
+    
+    async def run_noop(applications, context):
+        pass
+    
+    async def run_score(applications, context):
+        for application in applications:
+            application.status = ProcessingStatus.COMPLETED
+    
+    extract.prepare, extract.run = prepare, run_extract
+    identify.prepare, identify.run = prepare, run_noop
+    score.prepare, score.run = prepare, run_score
+    
+    return pipeline, applications, finished, log
+
+def make_tasks(ids, lane=TaskLane.BULK):
+    return [SimpleNamespace(id=i, application_id=i, batch_id=None, lane=lane) for i in ids]
+
+
+# ==========================================
+# Pipeline Tests
+# ==========================================
+
+@pytest.mark.asyncio
+async def test_pipeline_forwards_through_all_stages(fake_pipeline):
+    """
+    Test: المهام تمر بجميع المراحل وتُغلق
+    """
+    pipeline, applications, finished, _ = fake_pipeline
+    
+    pipeline.start()
+    await pipeline.submit(make_tasks(range(1, 21)))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert sorted(finished) == list(range(1, 21))
+    assert all(a.status == ProcessingStatus.COMPLETED for a in applications.values())
+    
+    stats = pipeline.stats()
+    assert stats["extract"]["processed"] == 20
+    assert stats["score"]["processed"] == 20
+    assert stats["score"]["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_routes_failures_to_finish(fake_pipeline):
+    """
+    Test: فشل مرحلة يرسل المهام مباشرة إلى الإغلاق
+    """
+    pipeline, applications, finished, _ = fake_pipeline
+    
+    async def broken_extract(applications, context):
+        raise RuntimeError("extraction crashed")
+    
+    pipeline.stages[0].run = broken_extract
+    
+    pipeline.start()
+    await pipeline.submit(make_tasks(range(1, 6)))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert sorted(finished) == list(range(1, 6))
+    assert all(a.status == ProcessingStatus.FAILED for a in applications.values())
+    
+    stats = pipeline.stats()
+    assert stats["extract"]["failed"] == 5
+    assert stats["identify"]["processed"] == 0
+    assert stats["score"]["processed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stop_cancels_workers(fake_pipeline):
+    """
+    Test: الإيقاف يلغي عمال المراحل بعد تفريغ الطوابير
+    """
+    pipeline, _, finished, _ = fake_pipeline
+    
+    pipeline.start()
+    workers = list(pipeline._workers)
+    await pipeline.submit(make_tasks([1]))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert finished == [1]
+    assert pipeline._workers == []
+    assert all(worker.cancelled() for worker in workers)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_drops_deleted_application(fake_pipeline):
+    """
+    Test: حذف طلب أثناء المعالجة لا يُفشل بقية المجموعة
+    """
+    pipeline, applications, finished, _ = fake_pipeline
+    extract = pipeline.stages[0]
+    run_extract = extract.run
+    
+    async def delete_during_extract(group, context):
+        await run_extract(group, context)
+        applications.pop(3, None)
+    
+    extract.run = delete_during_extract
+    
+    pipeline.start()
+    await pipeline.submit(make_tasks(range(1, 6)))
+    await pipeline.join()
+    await pipeline.stop()
+    
+    assert sorted(finished) == list(range(1, 6))
+    assert sorted(applications) == [1, 2, 4, 5]
+    assert all(a.status == ProcessingStatus.COMPLETED for a in applications.values())
+    assert pipeline.stats()["extract"]["failed"] == 1
+
+
+# ==========================================
+# Extraction Step Tests
+# ==========================================
+
+@pytest.mark.asyncio
+async def test_extraction_reuses_text_of_same_profile_only(monkeypatch):
+    """
+    Test: إعادة استخدام نص المستند فقط إذا استُخرج بنفس الملف الشخصي
+    """
+    extracted = []
+    
+    async def extract(path, profile):
+        extracted.append((path, profile))
+        return SimpleNamespace(text=f"{profile} text of the CV " * 5, method="docling")
+    
+    monkeypatch.setattr(background_tasks, "extract_cv_text_async", extract)
+    
+    def make_application(i, job_id):
+        document = SimpleNamespace(
+            extracted_text="fast text", extraction_method="text_layer", extraction_profile="fast",
+            candidate_name="Old Name", candidate_email=None, candidate_phone=None,
+            cv_embedding=b"old", embedding_model="old-tag"
+        )
+        return SimpleNamespace(
+            id=i, job_id=job_id, cv_file_path=f"cv{i}.pdf", original_filename=f"cv{i}.pdf",
+            extracted_text=None, extraction_method=None, document=document
+        )
+    
+    same, other = make_application(1, 1), make_application(2, 2)
+    
+    result = await background_tasks.extract_applications_text([same, other], {1: "fast", 2: "accurate"})
+    
+    assert result == [same, other]
+    assert extracted == [("cv2.pdf", "accurate")]
+    assert same.extracted_text == "fast text"
+    assert other.extracted_text.startswith("accurate text")
+    assert other.document.extraction_profile == "accurate"
+    assert other.document.candidate_name is None
+    assert other.document.cv_embedding is None
@@ -0,0 +1,189 @@
+"""
+Progress Broker Tests
+Test event delivery, NOTIFY payloads and stream statistics (no database)
+"""
+
+import asyncio
+import json
+import pytest
+from app.utils import progress as progress_module
+from app.utils.progress import ProgressBroker, apply_progress_event, MAX_NOTIFY_PAYLOAD, PROCESS_ID
+
+# ==========================================
+# Helper Functions
+# ==========================================
+
+def make_event(application_id: int, job_id: int = 1, previous_status="pending", status="processing", **extra) -> dict:
+    """إنشاء حدث انتقال حالة للاختبار"""
+    return {
+        "application_id": application_id,
+        "job_id": job_id,
+        "batch_id": None,
+        "previous_status": previous_status,
+        "status": status,
+        "candidate_name": None,
+        "match_score": None,
+        "error_message": None,
+        **extra
+    }
+
+def notify_payload(origin: str, events: list[dict]) -> str:
+    return json.dumps({"origin": origin, "events": events})
+
+
+# ==========================================
+# Delivery Tests
+# ==========================================
+
+def test_deliver_reaches_subscribers_of_the_job_only():
+    """
+    Test: الحدث يصل فقط إلى مشتركي الوظيفة نفسها
+    """
+    broker = ProgressBroker()
+    job_one, job_two = broker.subscribe(1), broker.subscribe(2)
+    
+    broker.deliver([make_event(10, job_id=1)])
+    
+    assert job_one.get_nowait()["application_id"] == 10
+    assert job_two.empty()
+
+
+def test_deliver_drops_events_of_lagging_subscriber():
+    """
+    Test: المشترك المتأخر يفقد الأحداث دون إيقاف الآخرين
+    """
+    broker = ProgressBroker(queue_size=1)
+    lagging = broker.subscribe(1)
+    
+    broker.deliver([make_event(10), make_event(11)])
+    
+    assert lagging.qsize() == 1
+    assert lagging.get_nowait()["application_id"] == 10
+
+
+def test_unsubscribe_removes_empty_job():
+    """
+    Test: إلغاء آخر اشتراك يزيل الوظيفة من الوسيط
+    """
+    broker = ProgressBroker()
+    queue = broker.subscribe(1)
+    
+    broker.unsubscribe(1, queue)
+    
+    assert broker.subscriber_count == 0
+    assert 1 not in broker._subscribers
+
+
+# ==========================================
+# NOTIFY Tests
+# ==========================================
+
+def test_payloads_fit_notify_limit():
+    """
+    Test: تقسيم الأحداث الكثيرة إلى رسائل تحت حد NOTIFY وبالترتيب
+    """
+    events = [make_event(i, candidate_name="محمد أحمد " * 20) for i in range(200)]
+    
+    payloads = ProgressBroker._payloads(events)
+    
+    assert len(payloads) > 1
+    assert all(len(payload.encode("utf-8")) < MAX_NOTIFY_PAYLOAD for payload in payloads)
+    
+    decoded = [json.loads(payload) for payload in payloads]
+    assert all(message["origin"] == PROCESS_ID for message in decoded)
+    assert [e["application_id"] for message in decoded for e in message["events"]] == list(range(200))
+
+
+def test_payloads_single_message_for_few_events():
+    """
+    Test: الأحداث القليلة تُرسل في رسالة واحدة
+    """
+    payloads = ProgressBroker._payloads([make_event(1), make_event(2)])
+    
+    assert len(payloads) == 1
+    assert len(json.loads(payloads[0])["events"]) == 2
+
+
+def test_on_notify_ignores_own_events():
+    """
+    Test: تجاهل الأحداث التي أرسلتها هذه العملية (سُلّمت محلياً مسبقاً)
+    """
+    broker = ProgressBroker()
+    queue = broker.subscribe(1)
+    
+    broker._on_notify(None, 0, progress_module.PROGRESS_CHANNEL, notify_payload(PROCESS_ID, [make_event(10)]))
+    
+    assert queue.empty()
+
+
+def test_on_notify_delivers_other_process_events():
+    """
+    Test: تسليم أحداث العمليات الأخرى وتجاهل الرسائل التالفة
+    """
+    broker = ProgressBroker()
+    queue = broker.subscribe(1)
+    
+    broker._on_notify(None, 0, progress_module.PROGRESS_CHANNEL, "not json")
+    broker._on_notify(None, 0, progress_module.PROGRESS_CHANNEL, notify_payload("other-worker", [make_event(10)]))
+    
+    assert queue.qsize() == 1
+    assert queue.get_nowait()["application_id"] == 10
+
+
+def test_close_ends_full_streams():
+    """
+    Test: الإغلاق يرسل نهاية البث حتى لطابور ممتلئ
+    """
+    broker = ProgressBroker(queue_size=1)
+    queue = broker.subscribe(1)
+    broker.deliver([make_event(10)])
+    
+    broker.close()
+    
+    assert queue.get_nowait() is None
+
+
+# ==========================================
+# Stream Statistics Tests
+# ==========================================
+
+def test_apply_progress_event_counts_transitions():
+    """
+    Test: تحديث إحصائيات البث مع كل انتقال حالة
+    """
+    stats = {"job_id": 1, "total_applications": 1, "completed": 0, "pending": 1, "processing": 0, "failed": 0}
+    
+    apply_progress_event(stats, make_event(2, previous_status=None, status="pending"))
+    apply_progress_event(stats, make_event(1, previous_status="pending", status="processing"))
+    apply_progress_event(stats, make_event(1, previous_status="processing", status="completed"))
+    
+    assert stats["total_applications"] == 2
+    assert stats["pending"] == 1
+    assert stats["processing"] == 0
+    assert stats["completed"] == 1
+
+
+def test_apply_progress_event_never_negative():
+    """
+    Test: الإحصائيات لا تصبح سالبة لحدث سبق اللقطة الأولى
+    """
+    stats = {"job_id": 1, "total_applications": 1, "completed": 1, "pending": 0, "processing": 0, "failed": 0}
+    
+    apply_progress_event(stats, make_event(1, previous_status="processing", status="failed"))
+    
+    assert stats["processing"] == 0
+    assert stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_delivers_locally_without_notify(monkeypatch):
+    """
+    Test: النشر يسلّم محلياً دون استخدام قاعدة البيانات عند تعطيل NOTIFY
+    """
+    monkeypatch.setattr(progress_module.settings, "PROGRESS_NOTIFY", False)
+    broker = ProgressBroker()
+    queue = broker.subscribe(1)
+    
+    await broker.publish(None, [make_event(10)])
+    
+    assert (await asyncio.wait_for(queue.get(), timeout=1))["application_id"] == 10
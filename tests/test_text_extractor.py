@@ -0,0 +1,122 @@
+"""
+Text Extraction Tests
+Test the text layer checks, page capping and DOCX conversion (no Docling)
+"""
+
+import docx
+from app.ai import text_extractor
+from app.ai.text_extractor import _is_garbled, _extract_docx
+
+# ==========================================
+# Helper Functions
+# ==========================================
+
+def build_docx(path) -> str:
+    """إنشاء ملف DOCX بعنوان ونص وقائمة وجدول وترويسة صفحة"""
+    document = docx.Document()
+    document.sections[0].header.is_linked_to_previous = False
+    document.sections[0].header.paragraphs[0].text = "john.smith@example.com"
+    document.add_heading("John Smith", level=0)
+    document.add_heading("Experience", level=1)
+    document.add_paragraph("Backend engineer at Acme")
+    document.add_paragraph("Python", style="List Bullet")
+    document.add_heading("Skills", level=2)
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Skill"
+    table.cell(0, 1).text = "Years"
+    table.cell(1, 0).text = "SQL | NoSQL"
+    table.cell(1, 1).text = "5"
+    
+    file_path = str(path / "cv.docx")
+    document.save(file_path)
+    return file_path
+
+# ==========================================
+# Text Layer Tests
+# ==========================================
+
+def test_clean_text_layer_is_not_garbled():
+    """
+    Test: النص السليم (مع أسطر جديدة وعلامات جدولة) ليس تالفاً
+    """
+    assert not _is_garbled("John Smith\nSoftware Engineer\tPython, SQL\r\n")
+    assert not _is_garbled("محمد أحمد - مهندس برمجيات")
+    assert not _is_garbled("")
+
+
+def test_replacement_characters_mark_text_garbled(monkeypatch):
+    """
+    Test: نسبة محارف الاستبدال أو التحكم فوق العتبة تعني ترميز خط معطوب
+    """
+    monkeypatch.setattr(text_extractor.settings, "TEXT_LAYER_MAX_GARBLED_RATIO", 0.05)
+    
+    assert _is_garbled("��� Smith")
+    assert _is_garbled("John\x01\x02\x03\x04")
+    assert not _is_garbled("�" + "a" * 99)
+
+
+# ==========================================
+# Page Range Tests
+# ==========================================
+
+def test_page_range_defaults_to_all_pages(monkeypatch):
+    """
+    Test: بدون نطاق تُستخرج كل الصفحات عند عدم تجاوز الحد
+    """
+    monkeypatch.setattr(text_extractor, "get_pdf_page_count", lambda file_path: 3)
+    monkeypatch.setattr(text_extractor.settings, "EXTRACTION_MAX_PAGES", 50)
+    
+    assert text_extractor._capped_page_range("cv.pdf", None) == (1, 3)
+
+
+def test_page_range_capped_to_max_pages(monkeypatch):
+    """
+    Test: الصفحات بعد EXTRACTION_MAX_PAGES تُهمل، والنطاق لا يتجاوز آخر صفحة
+    """
+    monkeypatch.setattr(text_extractor, "get_pdf_page_count", lambda file_path: 400)
+    monkeypatch.setattr(text_extractor.settings, "EXTRACTION_MAX_PAGES", 50)
+    
+    assert text_extractor._capped_page_range("cv.pdf", None) == (1, 50)
+    assert text_extractor._capped_page_range("cv.pdf", (41, 60)) == (41, 50)
+    assert text_extractor._capped_page_range("cv.pdf", (1, 900)) == (1, 50)
+
+
+def test_page_range_without_cap(monkeypatch):
+    """
+    Test: EXTRACTION_MAX_PAGES = 0 يعني عدم تحديد عدد الصفحات
+    """
+    monkeypatch.setattr(text_extractor, "get_pdf_page_count", lambda file_path: 400)
+    monkeypatch.setattr(text_extractor.settings, "EXTRACTION_MAX_PAGES", 0)
+    
+    assert text_extractor._capped_page_range("cv.pdf", None) == (1, 400)
+
+
+# ==========================================
+# DOCX Conversion Tests
+# ==========================================
+
+def test_docx_converted_to_markdown_in_document_order(tmp_path):
+    """
+    Test: تحويل DOCX إلى Markdown مع العناوين والقوائم والجداول بترتيب المستند
+    """
+    text = _extract_docx(build_docx(tmp_path))
+    
+    assert text.split("\n\n") == [
+        "john.smith@example.com",
+        "# John Smith",
+        "# Experience",
+        "Backend engineer at Acme",
+        "- Python",
+        "## Skills",
+        "| Skill | Years |\n| --- | --- |\n| SQL \\| NoSQL | 5 |"
+    ]
+
+
+def test_empty_docx_gives_empty_text(tmp_path):
+    """
+    Test: المستند الفارغ يعطي نصاً فارغاً
+    """
+    file_path = str(tmp_path / "empty.docx")
+    docx.Document().save(file_path)
+    
+    assert _extract_docx(file_path) == ""
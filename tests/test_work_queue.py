@@ -0,0 +1,268 @@
+"""
+Processing Queue Tests
+Test task leases, recovery by the reaper and claim scheduling
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from app.models import User, Job, Application, ProcessingStatus, ProcessingTask, TaskStatus, TaskLane
+from app.utils import work_queue
+from app.utils.work_queue import renew_leases, reap_expired_tasks, claim_rescores, claim_tasks
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# ==========================================
+# Helper Functions
+# ==========================================
+
+async def create_job(db, username: str) -> Job:
+    """إنشاء مستخدم ووظيفة للاختبار"""
+    user = User(username=username, email=f"{username}@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    
+    job = Job(title="Queue Job", description="Test Description", created_by=user.id)
+    db.add(job)
+    await db.flush()
+    return job
+
+async def create_application(db, job: Job, status=ProcessingStatus.PENDING) -> Application:
+    """إنشاء طلب قديم (خارج فترة السماح)"""
+    application = Application(
+        job_id=job.id,
+        cv_file_path="uploads/cvs/test.pdf",
+        original_filename="test.pdf",
+        status=status,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=1)
+    )
+    db.add(application)
+    await db.flush()
+    return application
+
+def expired_lease() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(minutes=5)
+
+async def tasks_of(db, application_id: int) -> list[ProcessingTask]:
+    db.expire_all()
+    result = await db.execute(
+        select(ProcessingTask)
+        .where(ProcessingTask.application_id == application_id)
+        .order_by(ProcessingTask.id)
+    )
+    return result.scalars().all()
+
+
+# ==========================================
+# Lease Tests
+# ==========================================
+
+@pytest.mark.asyncio
+async def test_reaper_requeues_expired_lease(db_session):
+    """
+    Test: إعادة جدولة مهمة انتهت مهلتها
+    """
+    job = await create_job(db_session, "reaper1")
+    application = await create_application(db_session, job, ProcessingStatus.PROCESSING)
+    db_session.add(ProcessingTask(
+        application_id=application.id,
+        owner_id=job.created_by,
+        status=TaskStatus.RUNNING,
+        attempts=1,
+        worker_id="dead-host:1:0",
+        lease_expires_at=expired_lease()
+    ))
+    await db_session.commit()
+    
+    requeued, failed = await reap_expired_tasks(db_session)
+    
+    assert (requeued, failed) == (1, 0)
+    tasks = await tasks_of(db_session, application.id)
+    assert tasks[0].status == TaskStatus.QUEUED
+    assert tasks[0].worker_id is None
+    
+    await db_session.refresh(application)
+    assert application.status == ProcessingStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_reaper_gives_up_after_max_attempts(db_session):
+    """
+    Test: فشل الطلب بعد استنفاد المحاولات
+    """
+    job = await create_job(db_session, "reaper2")
+    application = await create_application(db_session, job, ProcessingStatus.PROCESSING)
+    db_session.add(ProcessingTask(
+        application_id=application.id,
+        status=TaskStatus.RUNNING,
+        attempts=settings.MAX_TASK_ATTEMPTS,
+        worker_id="dead-host:1:0",
+        lease_expires_at=expired_lease()
+    ))
+    await db_session.commit()
+    
+    requeued, failed = await reap_expired_tasks(db_session)
+    
+    assert (requeued, failed) == (0, 1)
+    tasks = await tasks_of(db_session, application.id)
+    assert tasks[0].status == TaskStatus.FAILED
+    
+    await db_session.refresh(application)
+    assert application.status == ProcessingStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_reaper_keeps_finished_result(db_session):
+    """
+    Test: عدم إعادة جدولة طلب اكتمل قبل إغلاق مهمته
+    """
+    job = await create_job(db_session, "reaper5")
+    application = await create_application(db_session, job, ProcessingStatus.COMPLETED)
+    db_session.add(ProcessingTask(
+        application_id=application.id,
+        status=TaskStatus.RUNNING,
+        attempts=settings.MAX_TASK_ATTEMPTS,
+        worker_id="dead-host:1:0",
+        lease_expires_at=expired_lease()
+    ))
+    await db_session.commit()
+    
+    requeued, failed = await reap_expired_tasks(db_session)
+    
+    assert (requeued, failed) == (0, 0)
+    tasks = await tasks_of(db_session, application.id)
+    assert tasks[0].status == TaskStatus.DONE
+    
+    await db_session.refresh(application)
+    assert application.status == ProcessingStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_reaper_orphan_keeps_attempts(db_session):
+    """
+    Test: الطلب اليتيم يحتفظ بعدد المحاولات السابقة
+    """
+    job = await create_job(db_session, "reaper3")
+    retried = await create_application(db_session, job)
+    poisoned = await create_application(db_session, job, ProcessingStatus.PROCESSING)
+    db_session.add_all([
+        ProcessingTask(application_id=retried.id, status=TaskStatus.FAILED, attempts=1),
+        ProcessingTask(application_id=poisoned.id, status=TaskStatus.FAILED, attempts=settings.MAX_TASK_ATTEMPTS),
+    ])
+    await db_session.commit()
+    
+    requeued, failed = await reap_expired_tasks(db_session)
+    
+    assert (requeued, failed) == (1, 1)
+    
+    tasks = await tasks_of(db_session, retried.id)
+    assert tasks[-1].status == TaskStatus.QUEUED
+    assert tasks[-1].attempts == 1
+    
+    assert len(await tasks_of(db_session, poisoned.id)) == 1
+    await db_session.refresh(poisoned)
+    assert poisoned.status == ProcessingStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_ignores_previous_process_with_same_pid(db_session):
+    """
+    Test: النبض لا يجدد مهام عملية سابقة بنفس المضيف ورقم العملية
+    """
+    job = await create_job(db_session, "reaper4")
+    application = await create_application(db_session, job, ProcessingStatus.PROCESSING)
+    host_and_pid = work_queue.WORKER_ID.rsplit(":", 1)[0]
+    db_session.add(ProcessingTask(
+        application_id=application.id,
+        status=TaskStatus.RUNNING,
+        attempts=1,
+        worker_id=f"{host_and_pid}:previous",
+        lease_expires_at=expired_lease()
+    ))
+    await db_session.commit()
+    
+    await renew_leases(db_session)
+    
+    tasks = await tasks_of(db_session, application.id)
+    assert tasks[0].lease_expires_at < datetime.now(timezone.utc)
+
+
+# ==========================================
+# Rescore Tests
+# ==========================================
+
+@pytest.mark.asyncio
+async def test_claim_rescores_recovers_expired_claim(db_session):
+    """
+    Test: إعادة تشغيل إعادة التقييم التي توقفت مع عامل ميت
+    """
+    waiting = await create_job(db_session, "rescore1")
+    running = await create_job(db_session, "rescore2")
+    abandoned = await create_job(db_session, "rescore3")
+    waiting.rescore_in_progress = True
+    running.rescore_in_progress = True
+    running.rescore_lease_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    abandoned.rescore_in_progress = True
+    abandoned.rescore_lease_expires_at = expired_lease()
+    await db_session.commit()
+    
+    claimed = await claim_rescores(db_session, limit=10)
+    
+    assert sorted(claimed) == sorted([waiting.id, abandoned.id])
+    assert await claim_rescores(db_session, limit=10) == []
+
+
+# ==========================================
+# Claim Scheduling Tests
+# ==========================================
+
+async def queue_tasks(db, job: Job, owner_id, lane: TaskLane, count: int, status=TaskStatus.QUEUED) -> None:
+    """إضافة مهام لمالك في مسار معين"""
+    for _ in range(count):
+        application = await create_application(db, job)
+        db.add(ProcessingTask(application_id=application.id, owner_id=owner_id, lane=lane, status=status))
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_claim_order_shares_turns_between_owners(db_session, monkeypatch):
+    """
+    Test: ترتيب الحجز بالتناوب بين مالكين، مع أدوار مشتركة بين المسارين
+    """
+    monkeypatch.setattr(work_queue.settings, "MAX_IN_FLIGHT_PER_USER", 3)
+    job_one = await create_job(db_session, "claim1")
+    job_two = await create_job(db_session, "claim2")
+    
+    await queue_tasks(db_session, job_one, job_one.created_by, TaskLane.INTERACTIVE, 2)
+    await queue_tasks(db_session, job_one, job_one.created_by, TaskLane.BULK, 3)
+    await queue_tasks(db_session, job_two, job_two.created_by, TaskLane.BULK, 3)
+    await db_session.commit()
+    
+    tasks = await claim_tasks(db_session, 10)
+    
+    assert [(task.owner_id, task.lane) for task in tasks] == [
+        (job_one.created_by, TaskLane.INTERACTIVE),
+        (job_one.created_by, TaskLane.INTERACTIVE),
+        (job_two.created_by, TaskLane.BULK),
+        (job_two.created_by, TaskLane.BULK),
+        (job_one.created_by, TaskLane.BULK),
+        (job_two.created_by, TaskLane.BULK),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_claim_caps_tasks_without_owner(db_session, monkeypatch):
+    """
+    Test: المهام بدون مالك تخضع للحد كمالك واحد
+    """
+    monkeypatch.setattr(work_queue.settings, "MAX_IN_FLIGHT_PER_USER", 3)
+    job = await create_job(db_session, "claim3")
+    
+    await queue_tasks(db_session, job, None, TaskLane.BULK, 2, TaskStatus.RUNNING)
+    await queue_tasks(db_session, job, None, TaskLane.BULK, 5)
+    await db_session.commit()
+    
+    tasks = await claim_tasks(db_session, 10)
+    
+    assert len(tasks) == 1
@@ -0,0 +1,43 @@
+"""
+Smart Recruit AI - Queue Worker
+Run this file to process queued CVs in a separate process
+
+Start as many workers (processes or nodes) as needed, they share the
+database queue. Set RUN_EMBEDDED_WORKER=False to keep the API process
+free of CV processing.
+"""
+
+import asyncio
+import logging
+import signal
+from app.database import engine
+from app.utils.work_queue import run_worker
+from app.ai.extraction_pool import shutdown_extraction_pool
+from app.ai.inference_executor import inference_executor
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+logging.getLogger('docling').setLevel(logging.WARNING)
+logging.getLogger('rapidocr').setLevel(logging.WARNING)
+logging.getLogger('huggingface_hub').setLevel(logging.ERROR)
+logging.getLogger('transformers').setLevel(logging.ERROR)
+
+async def main():
+    stop_event = asyncio.Event()
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    
+    try:
+        await run_worker(stop_event)
+    finally:
+        shutdown_extraction_pool()
+        inference_executor.shutdown()
+        await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())